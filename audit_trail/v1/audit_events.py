@@ -0,0 +1,189 @@
+"""
+Session-event audit capture.
+
+While an audit scope is open on a Session, writes to the scope's model
+are turned into audit_log rows by two listeners:
+
+- after_flush: unit-of-work changes (db.add, attribute edits,
+  db.delete); old and new values come from attribute history, so no
+  SELECT is needed.
+- do_orm_execute: ORM-enabled bulk statements (Query.update,
+  update()/delete()/insert() through Session.execute). UPDATE and
+  DELETE read the matched rows once for the pre-image, the post-image
+  is derived from the statement's SET values; INSERT ... RETURNING
+  rows are audited as returned.
+
+Audit rows are inserted on the session's own connection, so they are
+committed or rolled back together with the change by the caller's
+single commit.
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import event, inspect, insert, select
+from sqlalchemy.orm import Session
+
+from model.v1.audit_log import AuditLog
+
+AUDIT_KEY = "audit_context"
+
+
+@dataclass
+class AuditContext:
+    action: str
+    table_name: str
+    model_class: type
+    performed_by: str = "UNKNOWN"
+    ip_address: str = None
+    path: str = None
+
+    def entry(self, record_id, old_data=None, new_data=None) -> dict:
+        # datetime, Decimal, enum... would fail the JSON columns, and with
+        # them the caller's write
+        old_data, new_data = jsonable_encoder(old_data), jsonable_encoder(new_data)
+        changed_fields = None
+        if old_data is not None and new_data is not None:
+            changed_fields = {
+                key: {"old": old_data.get(key), "new": value}
+                for key, value in new_data.items()
+                if old_data.get(key) != value
+            }
+        return {
+            "table_name": self.table_name,
+            "record_id": record_id,
+            "action": self.action,
+            "changed_fields": changed_fields,
+            "old_data": old_data,
+            "new_data": new_data,
+            "performed_by": self.performed_by,
+            "ip_address": self.ip_address,
+            "module": self.table_name.split("_")[0].capitalize(),
+            "extra_context": {"path": self.path},
+        }
+
+
+@contextmanager
+def audit_scope(db: Session, context: AuditContext):
+    """Audit writes to context.model_class made through db inside the block."""
+    info = db.info
+    previous = info.get(AUDIT_KEY)
+    info[AUDIT_KEY] = context
+    try:
+        yield context
+    finally:
+        if previous is None:
+            info.pop(AUDIT_KEY, None)
+        else:
+            info[AUDIT_KEY] = previous
+
+
+def _write(session: Session, entries):
+    if entries:
+        session.connection().execute(insert(AuditLog.__table__), entries)
+
+
+def _snapshot(state, history: bool):
+    """Column values from loaded state; history=True gives pre-flush values."""
+    values = {}
+    for attr in state.mapper.column_attrs:
+        if attr.key not in state.dict:
+            # expired / server-generated, reading it would emit a SELECT
+            continue
+        if history:
+            hist = state.attrs[attr.key].history
+            if hist.deleted:
+                values[attr.key] = hist.deleted[0]
+                continue
+        values[attr.key] = state.dict[attr.key]
+    return values
+
+
+@event.listens_for(Session, "after_flush")
+def _audit_flush(session, flush_context):
+    context = session.info.get(AUDIT_KEY)
+    if context is None:
+        return
+
+    entries = []
+    for obj in session.new:
+        if isinstance(obj, context.model_class):
+            state = inspect(obj)
+            entries.append(
+                context.entry(state.dict.get("id"), new_data=_snapshot(state, False))
+            )
+    for obj in session.dirty:
+        if isinstance(obj, context.model_class) and session.is_modified(obj):
+            state = inspect(obj)
+            entries.append(
+                context.entry(
+                    state.dict.get("id"),
+                    old_data=_snapshot(state, True),
+                    new_data=_snapshot(state, False),
+                )
+            )
+    for obj in session.deleted:
+        if isinstance(obj, context.model_class):
+            state = inspect(obj)
+            entries.append(
+                context.entry(state.dict.get("id"), old_data=_snapshot(state, True))
+            )
+    _write(session, entries)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _audit_bulk_statement(orm_execute_state):
+    session = orm_execute_state.session
+    context = session.info.get(AUDIT_KEY)
+    if context is None or not (
+        orm_execute_state.is_update
+        or orm_execute_state.is_delete
+        or orm_execute_state.is_insert
+    ):
+        return None
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None or mapper.class_ is not context.model_class:
+        return None
+    # executemany-style bulk UPDATE by primary key is not used by audited routes
+    if isinstance(orm_execute_state.parameters, list):
+        return None
+
+    statement = orm_execute_state.statement
+    table = mapper.local_table
+
+    if orm_execute_state.is_insert:
+        result = orm_execute_state.invoke_statement()
+        if not statement.returning_column_descriptions:
+            _write(session, [context.entry(None)])
+            return result
+        frozen = result.freeze()
+        _write(
+            session,
+            [
+                context.entry(row.get("id"), new_data=dict(row))
+                for row in frozen().mappings()
+            ],
+        )
+        return frozen()
+
+    pre_image = select(table)
+    if statement.whereclause is not None:
+        pre_image = pre_image.where(statement.whereclause)
+    before = [dict(row) for row in session.connection().execute(pre_image).mappings()]
+
+    result = orm_execute_state.invoke_statement()
+
+    if orm_execute_state.is_delete:
+        entries = [context.entry(row.get("id"), old_data=row) for row in before]
+    else:
+        # SET values bind under the column key, WHERE values get a suffix
+        params = statement.compile().params
+        params.update(orm_execute_state.parameters or {})
+        assigned = {key: params[key] for key in params if key in table.c}
+        entries = [
+            context.entry(row.get("id"), old_data=row, new_data={**row, **assigned})
+            for row in before
+        ]
+    _write(session, entries)
+    return result
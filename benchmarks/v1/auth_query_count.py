@@ -0,0 +1,190 @@
+"""
+Per-request query-count benchmark for token_required.
+
+Runs the dependency against a seeded database and reports how many SQL
+statements and how much time one authorization check costs, next to the
+legacy four-query sequence it replaced. token_required is measured on
+the default sync Session and on the opt-in AsyncSession path, with the
+permission cache cleared before every call (cold) and left warm.
+
+    python -m benchmarks.v1.auth_query_count
+    python -m benchmarks.v1.auth_query_count --database-url postgresql://... \
+        --async-database-url postgresql+asyncpg://... --user-id 1 --role-id 1
+
+The default run seeds a throwaway SQLite file shared by a sync and an
+aiosqlite engine.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from config.v1.env_loader import load_environment
+
+load_environment()
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from starlette.requests import Request
+
+from config.v1.config import Config
+from config.v1.config_dev import Base
+from model.v1.module_model import Module
+from model.v1.permission_model import Permission, RolePermission, UserPermission
+from model.v1.role_model import Role
+from model.v1.user_model import StatusMaster, User
+from utils.v1.query_counter import QueryCounter
+from utils.v1.permission_cache import invalidate_roles
+import middleware.v1.auth_token as auth_token
+
+
+def legacy_authorize(db, user_id, role_id, module_id, permission_id):
+    """The pre-join token_required sequence, kept here as the baseline."""
+    db.query(User).filter_by(id=user_id, is_deleted=0).first()
+    db.query(Role.role_name).filter_by(id=role_id, is_deleted=0, status=1).first()
+    role_perm = (
+        db.query(RolePermission)
+        .filter_by(
+            role_id=role_id,
+            module_id=module_id,
+            permission_id=permission_id,
+            is_deleted=0,
+        )
+        .first()
+    )
+    if not role_perm:
+        db.query(UserPermission).filter_by(
+            user_id=user_id,
+            module_id=module_id,
+            permission_id=permission_id,
+            is_deleted=0,
+        ).first()
+
+
+def seed(db):
+    db.add_all(
+        [
+            StatusMaster(id=1, status="Active", is_deleted=0),
+            Role(id=1, role_name="Admin", status=1, is_deleted=0),
+            Role(id=2, role_name="User", status=1, is_deleted=0),
+            Module(id=1, module_name="Role", is_deleted=0),
+            Permission(id=1, permission_name="Read", is_deleted=0),
+            User(
+                id=1,
+                email="bench@example.com",
+                password="x",
+                user_name="bench",
+                role_id=2,
+                is_deleted=0,
+            ),
+            # only a user-level grant, so the legacy path runs all four queries
+            UserPermission(user_id=1, module_id=1, permission_id=1, is_deleted=0),
+        ]
+    )
+    db.commit()
+
+
+def build_request(token):
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(b"cookie", f"access_token={token}".encode())],
+    }
+    return Request(scope)
+
+
+def run(args):
+    seeded = not args.database_url
+    if seeded:
+        path = os.path.join(tempfile.mkdtemp(), "bench.db")
+        args.database_url = f"sqlite:///{path}"
+        args.async_database_url = f"sqlite+aiosqlite:///{path}"
+
+    engine = create_engine(args.database_url)
+    async_engine = create_async_engine(args.async_database_url)
+
+    db = sessionmaker(bind=engine, autoflush=False)()
+    if seeded:
+        Base.metadata.create_all(engine)
+        seed(db)
+
+    Config.JWT_SECRET_KEY = Config.JWT_SECRET_KEY or "bench-secret"
+    Config.JWT_ALGORITHM = Config.JWT_ALGORITHM or "HS256"
+
+    from utils.v1.token_codec import create_access_token
+
+    token = create_access_token({"user_id": args.user_id, "role_id": args.role_id})
+    request = build_request(token)
+
+    # isolate database cost from the Redis blacklist lookup
+    async def not_blacklisted(jti):
+        return False
+
+    auth_token.is_token_blacklisted = not_blacklisted
+    sync_dependency = auth_token.token_required(
+        required_permission=[(1, 1)], use_async=False
+    )
+    async_dependency = auth_token.token_required(
+        required_permission=[(1, 1)], use_async=True
+    )
+
+    results = {}
+
+    with QueryCounter(engine) as counter:
+        start = time.perf_counter()
+        for _ in range(args.iterations):
+            legacy_authorize(db, args.user_id, args.role_id, 1, 1)
+        elapsed = time.perf_counter() - start
+    results["legacy"] = (counter.count / args.iterations, elapsed / args.iterations)
+
+    async def authorize_sync(cold):
+        for _ in range(args.iterations):
+            if cold:
+                invalidate_roles()
+            await sync_dependency(request, db)
+
+    async def authorize_async(cold):
+        async with AsyncSession(async_engine) as async_db:
+            for _ in range(args.iterations):
+                if cold:
+                    invalidate_roles()
+                await async_dependency(request, async_db)
+        await async_engine.dispose()
+
+    for path, counted, authorize_many in (
+        ("sync", engine, authorize_sync),
+        ("async", async_engine, authorize_async),
+    ):
+        for label, cold in (("cold", True), ("warm", False)):
+            invalidate_roles()
+            with QueryCounter(counted) as counter:
+                start = time.perf_counter()
+                asyncio.run(authorize_many(cold))
+                elapsed = time.perf_counter() - start
+            results[f"{path} {label}"] = (
+                counter.count / args.iterations,
+                elapsed / args.iterations,
+            )
+
+    print(f"{'path':<16}{'queries/request':>18}{'ms/request':>14}")
+    for name, (queries, seconds) in results.items():
+        print(f"{name:<16}{queries:>18.1f}{seconds * 1000:>14.3f}")
+
+    db.close()
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--database-url", default=os.getenv("BENCH_DATABASE_URL"))
+    parser.add_argument(
+        "--async-database-url", default=os.getenv("BENCH_ASYNC_DATABASE_URL")
+    )
+    parser.add_argument("--user-id", type=int, default=1)
+    parser.add_argument("--role-id", type=int, default=2)
+    parser.add_argument("--iterations", type=int, default=1000)
+    run(parser.parse_args())
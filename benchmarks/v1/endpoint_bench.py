@@ -0,0 +1,304 @@
+"""
+Endpoint benchmark: latency percentiles, throughput and SQL per request.
+
+Drives the real FastAPI app in-process through an httpx AsyncClient
+(ASGITransport, app lifespan included) against the database and Redis
+configured in the environment, typically a local Postgres filled with
+benchmarks.v1.generate_dataset. Each scenario runs --iterations requests
+over --concurrency workers after --warmup untimed requests, and reports
+p50/p95/p99 latency, requests per second and SQL statements per request
+(sync and async engines together). Results go to a JSON file.
+
+    python -m benchmarks.v1.endpoint_bench --output run.json
+    python -m benchmarks.v1.endpoint_bench --scenario list_users \\
+        --iterations 2000 --concurrency 16 --output run.json
+    python -m benchmarks.v1.endpoint_bench --compare before.json after.json
+
+The write scenarios add, update and then delete role permissions for
+--role-id. Every grant they touch ends soft-deleted, and a rerun revives
+those rows before it inserts new ones, so repeated runs do not grow the
+grant table.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import time
+from datetime import datetime, timezone
+
+from config.v1.env_loader import load_environment
+
+load_environment()
+
+import httpx
+from sqlalchemy import select
+
+from config.v1.config_dev import SessionLocal, async_engine, engine
+from main import app
+from model.v1.module_model import Module
+from model.v1.permission_model import Permission, RolePermission
+from utils.v1.query_counter import QueryCounter
+
+
+def summarise(latencies, errors, seconds, statements):
+    """Percentiles in ms over successful and failed requests alike."""
+    requests = len(latencies)
+    mean = statistics.fmean(latencies) if latencies else 0.0
+    if requests > 1:
+        cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    else:
+        p50 = p95 = p99 = latencies[0] if latencies else 0.0
+    return {
+        "requests": requests,
+        "errors": errors,
+        "p50_ms": round(p50 * 1000, 3),
+        "p95_ms": round(p95 * 1000, 3),
+        "p99_ms": round(p99 * 1000, 3),
+        "mean_ms": round(mean * 1000, 3),
+        "throughput_rps": round(requests / seconds, 1) if seconds else 0.0,
+        "statements_per_request": (
+            round(statements / requests, 2) if requests else 0.0
+        ),
+    }
+
+
+def plan_role_grants(combos, existing, iterations):
+    """
+    (module_id, permission_id) pairs for the write scenarios: the combos
+    add_role_permission grants and, index for index, the combos
+    update_role_permission moves those grants to. existing maps the
+    role's current combos to is_deleted. Add revives soft-deleted grants
+    first, then inserts new ones; update targets only combos with no row
+    at all, so no update can hit uix_role_permission.
+    """
+    revivable = [c for c in combos if existing.get(c, 0) != 0]
+    absent = [c for c in combos if c not in existing]
+    count = min(iterations, (len(revivable) + len(absent)) // 2)
+    add_combos = (revivable + absent)[:count]
+    targets = [c for c in absent if c not in add_combos][:count]
+    return add_combos, targets
+
+
+class Bench:
+    def __init__(self, client: httpx.AsyncClient, args):
+        self.client = client
+        self.args = args
+        # (id, module_id, permission_id) of grants created by
+        # add_role_permission, reused by the update and delete scenarios
+        self.grants = []
+        with SessionLocal() as db:
+            modules = db.scalars(select(Module.id).where(Module.is_deleted == 0))
+            permissions = db.scalars(
+                select(Permission.id).where(Permission.is_deleted == 0)
+            ).all()
+            combos = [(m, p) for m in modules for p in permissions]
+            existing = {
+                (row.module_id, row.permission_id): row.is_deleted
+                for row in db.execute(
+                    select(
+                        RolePermission.module_id,
+                        RolePermission.permission_id,
+                        RolePermission.is_deleted,
+                    ).where(RolePermission.role_id == args.role_id)
+                )
+            }
+        self.add_combos, self.update_targets = plan_role_grants(
+            combos, existing, args.iterations
+        )
+
+    def scenarios(self):
+        """name -> async callable(i) returning the response of request i."""
+        client, args = self.client, self.args
+        limit = {"limit": args.page_size}
+        return {
+            "login": lambda i: client.post(
+                "/v1/auth/login",
+                json={"email": args.email, "password": args.password},
+            ),
+            "refresh": lambda i: client.post("/v1/auth/refresh"),
+            "token_required_get": lambda i: client.get("/v1/auth/dummy-route"),
+            "list_users": lambda i: client.get("/v1/user/getuser", params=limit),
+            "list_roles": lambda i: client.get("/v1/role/getrole", params=limit),
+            "list_role_permissions": lambda i: client.get(
+                "/v1/perm/getrolepermission", params=limit
+            ),
+            "list_user_permissions": lambda i: client.get(
+                "/v1/perm/getuserpermission", params=limit
+            ),
+            "single_user_permissions": lambda i: client.get(
+                "/v1/perm/getsingleuserperm", params={"user_id": args.user_id}
+            ),
+            "add_role_permission": self._add_role_permission,
+            "update_role_permission": self._update_role_permission,
+            "delete_role_permission": self._delete_role_permission,
+        }
+
+    def iterations(self, name):
+        # every write touches a distinct grant; there are only so many combos
+        if name == "add_role_permission":
+            return len(self.add_combos)
+        if name == "update_role_permission":
+            return min(len(self.grants), len(self.update_targets))
+        if name == "delete_role_permission":
+            return len(self.grants)
+        return self.args.iterations
+
+    async def _add_role_permission(self, i):
+        module_id, permission_id = self.add_combos[i]
+        response = await self.client.post(
+            "/v1/perm/addrolepermission",
+            json={
+                "role_id": self.args.role_id,
+                "module_id": module_id,
+                "permission_id": permission_id,
+            },
+        )
+        if response.status_code == 201:
+            self.grants.append((response.json()["id"], module_id, permission_id))
+        return response
+
+    async def _update_role_permission(self, i):
+        grant_id = self.grants[i][0]
+        module_id, permission_id = self.update_targets[i]
+        return await self.client.patch(
+            "/v1/perm/updaterolepermission",
+            json={
+                "rp_id": grant_id,
+                "role_id": self.args.role_id,
+                "module_id": module_id,
+                "permission_id": permission_id,
+            },
+        )
+
+    async def _delete_role_permission(self, i):
+        return await self.client.delete(
+            "/v1/perm/deleterolepermission", params={"rp_id": self.grants[i][0]}
+        )
+
+    async def run_scenario(self, name, request):
+        total = self.iterations(name)
+        warmup = 0 if name.endswith("_role_permission") else self.args.warmup
+        for i in range(warmup):
+            await request(i)
+
+        latencies, errors = [], 0
+        pending = iter(range(total))
+
+        async def worker():
+            nonlocal errors
+            for i in pending:
+                started = time.perf_counter()
+                response = await request(i)
+                latencies.append(time.perf_counter() - started)
+                if response.status_code >= 400:
+                    errors += 1
+
+        sync_count, async_count = QueryCounter(engine), QueryCounter(async_engine)
+        with sync_count, async_count:
+            started = time.perf_counter()
+            await asyncio.gather(
+                *(worker() for _ in range(min(self.args.concurrency, total) or 1))
+            )
+            seconds = time.perf_counter() - started
+
+        return summarise(
+            latencies, errors, seconds, sync_count.count + async_count.count
+        )
+
+
+async def run(args):
+    results = {}
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        # https so the Secure auth cookies are sent back
+        async with httpx.AsyncClient(
+            transport=transport, base_url="https://bench"
+        ) as client:
+            login = await client.post(
+                "/v1/auth/login",
+                json={"email": args.email, "password": args.password},
+            )
+            login.raise_for_status()
+
+            bench = Bench(client, args)
+            scenarios = bench.scenarios()
+            for name in args.scenario or scenarios:
+                results[name] = await bench.run_scenario(name, scenarios[name])
+                row = results[name]
+                print(
+                    f"{name:<26}{row['requests']:>7}{row['errors']:>7}"
+                    f"{row['p50_ms']:>10.2f}{row['p95_ms']:>10.2f}"
+                    f"{row['p99_ms']:>10.2f}{row['throughput_rps']:>10.1f}"
+                    f"{row['statements_per_request']:>8.1f}"
+                )
+    return results
+
+
+def compare(before_path, after_path):
+    with open(before_path) as fh:
+        before = json.load(fh)["results"]
+    with open(after_path) as fh:
+        after = json.load(fh)["results"]
+
+    print(
+        f"{'scenario':<26}{'p95 before':>12}{'p95 after':>11}"
+        f"{'sql before':>12}{'sql after':>11}"
+    )
+    for name, new in after.items():
+        old = before.get(name, {})
+        print(
+            f"{name:<26}{old.get('p95_ms', float('nan')):>12.2f}"
+            f"{new['p95_ms']:>11.2f}"
+            f"{old.get('statements_per_request', float('nan')):>12.1f}"
+            f"{new['statements_per_request']:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--email", default=os.getenv("BENCH_EMAIL", "masteradmin@gmail.com")
+    )
+    parser.add_argument("--password", default=os.getenv("BENCH_PASSWORD", "admin@321"))
+    parser.add_argument("--user-id", type=int, default=1)
+    parser.add_argument("--role-id", type=int, default=2)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--scenario", action="append")
+    parser.add_argument("--output")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"))
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+    else:
+        print(
+            f"{'scenario':<26}{'reqs':>7}{'errs':>7}{'p50 ms':>10}{'p95 ms':>10}"
+            f"{'p99 ms':>10}{'req/s':>10}{'sql':>8}"
+        )
+        results = asyncio.run(run(args))
+        if args.output:
+            with open(args.output, "w") as fh:
+                json.dump(
+                    {
+                        "meta": {
+                            "started_at": datetime.now(timezone.utc).isoformat(),
+                            "python": platform.python_version(),
+                            "args": {
+                                k: v
+                                for k, v in vars(args).items()
+                                if k not in ("password", "compare", "output")
+                            },
+                        },
+                        "results": results,
+                    },
+                    fh,
+                    indent=2,
+                )
+            print(f"results written to {args.output}")
@@ -0,0 +1,166 @@
+"""
+EXPLAIN ANALYZE capture for the hot-path queries.
+
+Builds the statements the app actually runs (token_required's
+authorization probe, keyset user listing, reset-token lookups), runs
+each under EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) and stores the plans,
+so the effect of an index migration can be compared before and after.
+
+Grant lookups are served by the unique keys uix_role_permission
+(role_id, permission_id, module_id) and uix_user_permission (user_id,
+permission_id, module_id); there are no separate partial grant indexes.
+EXPECTED_INDEXES lists the index each query should use and queries
+whose plan misses it are flagged with "!".
+
+    python -m benchmarks.v1.explain_hot_queries --output before.json
+    alembic upgrade head
+    python -m benchmarks.v1.explain_hot_queries --output after.json
+    python -m benchmarks.v1.explain_hot_queries --compare before.json after.json
+
+PostgreSQL only. EXPLAIN ANALYZE executes the statements, all of which
+are read-only SELECTs.
+"""
+
+import argparse
+import json
+import os
+from datetime import datetime
+
+from config.v1.env_loader import load_environment
+
+load_environment()
+
+from sqlalchemy import create_engine, select
+
+from config.v1.config import Config
+from dao.v1.auth_dao import _authorization_query
+from helpers.v1.pagination import keyset
+from model.v1.permission_model import UserPermission
+from model.v1.user_model import PasswordResetToken, User
+
+
+# query -> indexes its plan should use once 43bc036dab9e is applied
+EXPECTED_INDEXES = {
+    "authorization_context": {"uix_role_permission", "uix_user_permission"},
+    "user_keyset_page": {"ix_users_active_id"},
+    "user_permissions_of_user": {"uix_user_permission"},
+    "reset_token_by_selector": {"ix_password_reset_tokens_selector"},
+    "reset_token_by_user": {"ix_password_reset_tokens_user_id"},
+    "expired_reset_tokens": {"ix_password_reset_tokens_unused_expires_at"},
+}
+
+
+def _missing(name, indexes):
+    """Expected indexes the plan does not use."""
+    return sorted(EXPECTED_INDEXES.get(name, set()) - set(indexes))
+
+
+def hot_queries(args):
+    """name -> statement, using the same builders as the request path."""
+    return {
+        "authorization_context": _authorization_query(
+            args.user_id, args.role_id, args.module_id, args.permission_id
+        ),
+        "user_keyset_page": keyset(
+            select(User.id, User.email).where(User.is_deleted == 0),
+            User,
+            Config.PAGE_SIZE_DEFAULT,
+        ),
+        "user_permissions_of_user": select(
+            UserPermission.module_id, UserPermission.permission_id
+        ).where(
+            UserPermission.user_id == args.user_id, UserPermission.is_deleted == 0
+        ),
+        "reset_token_by_selector": select(PasswordResetToken.id).where(
+            PasswordResetToken.selector == "0" * 32,
+            PasswordResetToken.used == False,
+            PasswordResetToken.expires_at > datetime.utcnow(),
+        ),
+        "reset_token_by_user": select(PasswordResetToken.id).where(
+            PasswordResetToken.user_id == args.user_id
+        ),
+        "expired_reset_tokens": select(PasswordResetToken.id).where(
+            PasswordResetToken.used == False,
+            PasswordResetToken.expires_at < datetime.utcnow(),
+        ),
+    }
+
+
+def _indexes(node):
+    found = {node["Index Name"]} if "Index Name" in node else set()
+    for child in node.get("Plans", []):
+        found |= _indexes(child)
+    return found
+
+
+def capture(args):
+    engine = create_engine(args.database_url)
+    results = {}
+    with engine.connect() as conn:
+        for name, statement in hot_queries(args).items():
+            compiled = statement.compile(dialect=engine.dialect)
+            explained = conn.exec_driver_sql(
+                f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {compiled}", compiled.params
+            ).scalar()
+            # psycopg2 decodes json columns, other drivers may hand back text
+            if isinstance(explained, str):
+                explained = json.loads(explained)
+            plan = explained[0]
+            indexes = sorted(_indexes(plan["Plan"]))
+            results[name] = {
+                "execution_ms": plan["Execution Time"],
+                "planning_ms": plan["Planning Time"],
+                "root_node": plan["Plan"]["Node Type"],
+                "indexes": indexes,
+                "missing_indexes": _missing(name, indexes),
+                "plan": plan,
+            }
+            flag = "!" if results[name]["missing_indexes"] else " "
+            print(
+                f"{flag}{name:<25}{plan['Execution Time']:>10.3f} ms  "
+                f"{plan['Plan']['Node Type']}  {', '.join(indexes)}"
+            )
+        conn.rollback()
+    engine.dispose()
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(results, fh, indent=2, default=str)
+        print(f"plans written to {args.output}")
+
+
+def compare(before_path, after_path):
+    with open(before_path) as fh:
+        before = json.load(fh)
+    with open(after_path) as fh:
+        after = json.load(fh)
+
+    print(f"{'query':<26}{'before ms':>11}{'after ms':>11}  indexes after")
+    for name, new in after.items():
+        old = before.get(name)
+        old_ms = f"{old['execution_ms']:>11.3f}" if old else f"{'-':>11}"
+        flag = "!" if _missing(name, new["indexes"]) else " "
+        print(
+            f"{flag}{name:<25}{old_ms}{new['execution_ms']:>11.3f}  "
+            f"{', '.join(new['indexes']) or new['root_node']}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("BENCH_DATABASE_URL") or Config.DATABASE_URL,
+    )
+    parser.add_argument("--output")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"))
+    parser.add_argument("--user-id", type=int, default=1)
+    parser.add_argument("--role-id", type=int, default=1)
+    parser.add_argument("--module-id", type=int, default=1)
+    parser.add_argument("--permission-id", type=int, default=1)
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+    else:
+        capture(args)
@@ -0,0 +1,366 @@
+"""
+Synthetic production-sized dataset for capacity testing.
+
+Fills a PostgreSQL database with roles, modules, permissions, users,
+role/user grants, audit rows and sessions using COPY ... FROM STDIN, in
+chunks of --chunk-rows, all in one transaction. Every table draws from
+its own random stream derived from --seed, so the same arguments always
+produce the same rows. Generated ids continue after the current max(id)
+of each table and the sequences are moved past them afterwards, so the
+generator can run against a database that already holds seed data.
+
+    python -m benchmarks.v1.generate_dataset --users 1000000 --audit-rows 5000000
+    python -m benchmarks.v1.generate_dataset --database-url postgresql://... \\
+        --users 50000 --seed 7 --truncate
+
+All users share one bcrypt hash of --password, computed once per run.
+A --deleted-ratio share of users and grants is soft-deleted so the
+is_deleted = 0 filters and partial indexes see realistic selectivity.
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from config.v1.env_loader import load_environment
+
+load_environment()
+
+import bcrypt
+from faker import Faker
+from sqlalchemy import create_engine
+
+from config.v1.config import Config
+
+# FK order: parents before children
+TABLES = (
+    "status_master",
+    "role_master",
+    "module_master",
+    "permission_master",
+    "users",
+    "role_permission",
+    "user_permission",
+    "audit_log",
+    "user_sessions",
+)
+
+AUDIT_ACTIONS = ("LOGIN", "LOGOUT", "CHANGE_PASSWORD", "CREATE", "UPDATE", "DELETE")
+AUDIT_TABLES = ("users", "role_master", "role_permission", "user_permission")
+BCRYPT_ALPHABET = b"./ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+
+
+def seeded_hash(password: str, rng: random.Random) -> str:
+    """bcrypt hash with a salt drawn from rng, so reruns store the same value."""
+    salt = bytes(rng.choice(BCRYPT_ALPHABET) for _ in range(21))
+    # the last salt character only carries 2 bits
+    salt += bytes([rng.choice(b".Oeu")])
+    return bcrypt.hashpw(password.encode(), b"$2b$12$" + salt).decode()
+
+
+class DatasetGenerator:
+    def __init__(
+        self,
+        counts: dict,
+        seed: int = 0,
+        start_ids: dict = None,
+        status_ids: list = None,
+        deleted_ratio: float = 0.02,
+        anchor: datetime = datetime(2026, 1, 1, tzinfo=timezone.utc),
+        days: int = 365,
+        password: str = "password",
+    ):
+        self.counts = counts
+        self.seed = seed
+        self.start_ids = start_ids or {}
+        self.status_ids = status_ids or []
+        self.deleted_ratio = deleted_ratio
+        self.anchor = anchor
+        self.days = days
+        self.password = password
+
+        fake = Faker()
+        fake.seed_instance(seed)
+        # small name pools combined per row; Faker per row is far too slow
+        self.first_names = [fake.first_name() for _ in range(500)]
+        self.last_names = [fake.last_name() for _ in range(500)]
+
+    def _rng(self, table):
+        return random.Random(f"{self.seed}:{table}")
+
+    def _ids(self, table, count):
+        start = self.start_ids.get(table, 0) + 1
+        return range(start, start + count)
+
+    def _timestamp(self, rng):
+        return self.anchor - timedelta(seconds=rng.randrange(self.days * 86400))
+
+    def _deleted(self, rng):
+        return 1 if rng.random() < self.deleted_ratio else 0
+
+    def tables(self):
+        """Yield (table, columns, rows) in FK order; rows is a lazy iterator."""
+        statuses = self.status_ids or list(self._ids("status_master", 2))
+        if not self.status_ids:
+            yield "status_master", ("id", "status", "is_deleted"), (
+                (sid, name, 0) for sid, name in zip(statuses, ("Active", "Inactive"))
+            )
+
+        roles = self._ids("role_master", self.counts["roles"])
+        modules = self._ids("module_master", self.counts["modules"])
+        permissions = self._ids("permission_master", self.counts["permissions"])
+        users = self._ids("users", self.counts["users"])
+        combos = [(m, p) for m in modules for p in permissions]
+
+        for table, ids, name_column, label in (
+            ("role_master", roles, "role_name", "Role"),
+            ("module_master", modules, "module_name", "Module"),
+            ("permission_master", permissions, "permission_name", "Permission"),
+        ):
+            yield table, ("id", name_column, "status", "is_deleted"), (
+                (i, f"{label} {i}", statuses[0], 0) for i in ids
+            )
+
+        yield "users", (
+            "id",
+            "email",
+            "password",
+            "user_name",
+            "role_id",
+            "status",
+            "created_at",
+            "modified_at",
+            "is_deleted",
+        ), self._users(users, roles, statuses)
+        yield "role_permission", (
+            "id",
+            "role_id",
+            "module_id",
+            "permission_id",
+            "is_deleted",
+        ), self._role_grants(roles, combos)
+        yield "user_permission", (
+            "id",
+            "user_id",
+            "module_id",
+            "permission_id",
+            "is_deleted",
+        ), self._user_grants(users, combos)
+        yield "audit_log", (
+            "id",
+            "table_name",
+            "record_id",
+            "action",
+            "new_data",
+            "performed_by",
+            "performed_at",
+            "ip_address",
+            "module",
+        ), self._audit_rows(users)
+        yield "user_sessions", (
+            "id",
+            "session_id",
+            "user_id",
+            "access_token",
+            "refresh_token_hash",
+            "is_active",
+            "created_at",
+            "last_used_at",
+            "ip_address",
+        ), self._sessions(users)
+
+    def _users(self, users, roles, statuses):
+        rng = self._rng("users")
+        password = seeded_hash(self.password, rng)
+        for user_id in users:
+            created = self._timestamp(rng)
+            first = rng.choice(self.first_names)
+            yield (
+                user_id,
+                f"{first.lower()}.{user_id}@example.com",
+                password,
+                f"{first} {rng.choice(self.last_names)}",
+                rng.choice(roles),
+                rng.choice(statuses),
+                created.isoformat(),
+                created.isoformat(),
+                self._deleted(rng),
+            )
+
+    def _role_grants(self, roles, combos):
+        rng = self._rng("role_permission")
+        ids = iter(self._ids("role_permission", len(roles) * len(combos)))
+        for role_id in roles:
+            for module_id, permission_id in sorted(
+                rng.sample(combos, rng.randint(1, len(combos)))
+            ):
+                yield next(ids), role_id, module_id, permission_id, self._deleted(rng)
+
+    def _user_grants(self, users, combos):
+        """(users[k % U], combos[k // U]) is unique for k < U * len(combos)."""
+        rng = self._rng("user_permission")
+        combos = combos[:]
+        rng.shuffle(combos)
+        count = min(self.counts["user_grants"], len(users) * len(combos))
+        for k, grant_id in enumerate(self._ids("user_permission", count)):
+            module_id, permission_id = combos[k // len(users)]
+            yield (
+                grant_id,
+                users[k % len(users)],
+                module_id,
+                permission_id,
+                self._deleted(rng),
+            )
+
+    def _audit_rows(self, users):
+        rng = self._rng("audit_log")
+        for audit_id in self._ids("audit_log", self.counts["audit_rows"]):
+            user_id = rng.choice(users)
+            yield (
+                audit_id,
+                rng.choice(AUDIT_TABLES),
+                rng.choice(users),
+                rng.choice(AUDIT_ACTIONS),
+                json.dumps({"seed": audit_id}),
+                str(user_id),
+                self._timestamp(rng).isoformat(),
+                f"10.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(256)}",
+                "User Management",
+            )
+
+    def _sessions(self, users):
+        rng = self._rng("user_sessions")
+        for session_id in self._ids("user_sessions", self.counts["sessions"]):
+            created = self._timestamp(rng)
+            yield (
+                session_id,
+                str(uuid.UUID(int=rng.getrandbits(128))),
+                rng.choice(users),
+                f"synthetic-access-{session_id}",
+                f"{rng.getrandbits(256):064x}",
+                rng.random() < 0.3,
+                created.isoformat(),
+                (created + timedelta(minutes=rng.randrange(60 * 24))).isoformat(),
+                f"10.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(256)}",
+            )
+
+
+def csv_chunks(rows, chunk_rows):
+    """Encode rows as CSV text for COPY, chunk_rows rows per buffer."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    pending = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending == chunk_rows:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if pending:
+        yield buffer.getvalue()
+
+
+def copy_table(cursor, table, columns, rows, chunk_rows):
+    statement = f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)"
+    copied = 0
+    for chunk in csv_chunks(rows, chunk_rows):
+        cursor.copy_expert(statement, io.StringIO(chunk))
+        copied += cursor.rowcount
+    return copied
+
+
+def run(args):
+    engine = create_engine(args.database_url)
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        if args.truncate:
+            cursor.execute(
+                f"TRUNCATE {', '.join(TABLES)}, user_session_logs, "
+                "password_reset_tokens RESTART IDENTITY CASCADE"
+            )
+
+        start_ids = {}
+        for table in TABLES:
+            cursor.execute(f"SELECT coalesce(max(id), 0) FROM {table}")
+            start_ids[table] = cursor.fetchone()[0]
+        cursor.execute("SELECT id FROM status_master WHERE is_deleted = 0 ORDER BY id")
+        status_ids = [row[0] for row in cursor.fetchall()]
+
+        generator = DatasetGenerator(
+            counts={
+                "roles": args.roles,
+                "modules": args.modules,
+                "permissions": args.permissions,
+                "users": args.users,
+                "user_grants": args.user_grants,
+                "audit_rows": args.audit_rows,
+                "sessions": args.sessions,
+            },
+            seed=args.seed,
+            start_ids=start_ids,
+            status_ids=status_ids,
+            deleted_ratio=args.deleted_ratio,
+            password=args.password,
+        )
+
+        for table, columns, rows in generator.tables():
+            started = time.perf_counter()
+            copied = copy_table(cursor, table, columns, rows, args.chunk_rows)
+            seconds = time.perf_counter() - started
+            print(
+                f"{table:<20}{copied:>12} rows{seconds:>9.1f}s"
+                f"{copied / seconds if seconds else 0:>12.0f} rows/s"
+            )
+
+        # explicit ids do not advance the serial sequences
+        for table in TABLES:
+            cursor.execute(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                f"(SELECT coalesce(max(id), 1) FROM {table}))"
+            )
+        raw.commit()
+
+        # fresh statistics so EXPLAIN reflects the new volume
+        raw.autocommit = True
+        for table in TABLES:
+            cursor.execute(f"ANALYZE {table}")
+    except Exception:
+        raw.rollback()
+        raise
+    finally:
+        raw.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("BENCH_DATABASE_URL") or Config.DATABASE_URL,
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--users", type=int, default=100000)
+    parser.add_argument("--roles", type=int, default=50)
+    parser.add_argument("--modules", type=int, default=40)
+    parser.add_argument("--permissions", type=int, default=8)
+    parser.add_argument("--user-grants", type=int, default=200000)
+    parser.add_argument("--audit-rows", type=int, default=500000)
+    parser.add_argument("--sessions", type=int, default=100000)
+    parser.add_argument("--deleted-ratio", type=float, default=0.02)
+    parser.add_argument("--password", default="password")
+    parser.add_argument("--chunk-rows", type=int, default=100000)
+    parser.add_argument(
+        "--truncate",
+        action="store_true",
+        help="empty the generated tables (RESTART IDENTITY CASCADE) first",
+    )
+    run(parser.parse_args())
@@ -0,0 +1,60 @@
+"""
+Micro-benchmark for access-token verification in token_required.
+
+Compares a full signature verification on every call (uncached) with the
+verified-claims cache lookup (sha256 of the raw token + TTL cache get),
+for the HS and RS algorithms Config.JWT_ALGORITHM can be set to.
+
+    python -m benchmarks.v1.jwt_decode
+    python -m benchmarks.v1.jwt_decode --iterations 20000 --algorithms HS256 RS256
+"""
+
+import argparse
+import time
+from datetime import timedelta
+
+from benchmarks.v1.token_codec import CLAIMS, bench_keys
+from utils.v1.token_cache import (
+    cache_verified_claims,
+    clear_token_cache,
+    get_verified_claims,
+)
+from utils.v1.token_codec import TokenCodec
+
+
+def time_per_call(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations
+
+
+def run(args):
+    print(f"{'algorithm':<12}{'uncached us':>14}{'cached us':>12}{'speedup':>10}")
+    for algorithm in args.algorithms:
+        codec = TokenCodec(algorithm, *bench_keys(algorithm))
+        token = codec.encode(CLAIMS, "access", timedelta(minutes=15))
+
+        def uncached():
+            codec.decode(token, "access")
+
+        def cached():
+            claims = get_verified_claims(token)
+            if claims is None:
+                claims = codec.decode(token, "access")
+                cache_verified_claims(token, claims)
+
+        clear_token_cache()
+        slow = time_per_call(uncached, args.iterations)
+        fast = time_per_call(cached, args.iterations)
+        print(
+            f"{algorithm:<12}{slow * 1e6:>14.2f}{fast * 1e6:>12.2f}"
+            f"{slow / fast:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--algorithms", nargs="+", default=["HS256", "RS256"])
+    run(parser.parse_args())
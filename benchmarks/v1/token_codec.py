@@ -0,0 +1,92 @@
+"""
+Encode/decode throughput of the shared TokenCodec.
+
+"before" is how the old call sites worked: module-level PyJWT calls that
+receive raw key material on every call, so PEM keys are re-parsed each
+time. "after" is the codec with keys parsed once at construction.
+
+    python -m benchmarks.v1.token_codec
+    python -m benchmarks.v1.token_codec --iterations 20000 --algorithms HS256
+"""
+
+import argparse
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from utils.v1.token_codec import TokenCodec
+
+CLAIMS = {"user_id": 1, "role_id": 1, "email": "bench@example.com"}
+
+
+def bench_keys(algorithm):
+    """Return (secret, private PEM, public PEM) for the algorithm family."""
+    if algorithm.startswith("HS"):
+        return "bench-secret", None, None
+
+    private = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    public_pem = (
+        private.public_key()
+        .public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        .decode()
+    )
+    return None, private_pem, public_pem
+
+
+def ops_per_second(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return iterations / (time.perf_counter() - start)
+
+
+def run(args):
+    print(f"{'algorithm':<12}{'op':<8}{'before ops/s':>14}{'after ops/s':>14}")
+    for algorithm in args.algorithms:
+        secret, private_pem, public_pem = bench_keys(algorithm)
+        signing_key = secret or private_pem
+        verifying_key = secret or public_pem
+        codec = TokenCodec(algorithm, secret, private_pem, public_pem)
+
+        def legacy_encode():
+            claims = dict(CLAIMS, jti=str(uuid.uuid4()), type="access")
+            claims["exp"] = datetime.now(timezone.utc) + timedelta(minutes=30)
+            return jwt.encode(claims, signing_key, algorithm=algorithm)
+
+        token = codec.encode(CLAIMS, "access", timedelta(minutes=30))
+
+        rows = {
+            "encode": (
+                legacy_encode,
+                lambda: codec.encode(CLAIMS, "access", timedelta(minutes=30)),
+            ),
+            "decode": (
+                lambda: jwt.decode(token, verifying_key, algorithms=[algorithm]),
+                lambda: codec.decode(token, "access"),
+            ),
+        }
+        for op, (before, after) in rows.items():
+            print(
+                f"{algorithm:<12}{op:<8}"
+                f"{ops_per_second(before, args.iterations):>14.0f}"
+                f"{ops_per_second(after, args.iterations):>14.0f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--algorithms", nargs="+", default=["HS256", "RS256"])
+    run(parser.parse_args())
@@ -12,10 +12,87 @@ class Config:
     DATABASE_URL = (
         f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_DBNAME}"
     )
+    ASYNC_DATABASE_URL = (
+        f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_DBNAME}"
+    )
+    ASYNC_DB_POOL_SIZE = int(os.getenv("ASYNC_DB_POOL_SIZE", "10"))
+    ASYNC_DB_MAX_OVERFLOW = int(os.getenv("ASYNC_DB_MAX_OVERFLOW", "20"))
+    # token_required authorization on the async engine for every route;
+    # off, routes opt in with token_required(use_async=True)
+    AUTH_ASYNC_DB = os.getenv("AUTH_ASYNC_DB", "false").lower() == "true"
 
     # JWT
     JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY")
     JWT_ALGORITHM = os.getenv("JWT_ALGORITHM")
+    # PEM keys, only used by RS*/ES*/PS* algorithms
+    JWT_PRIVATE_KEY = os.getenv("JWT_PRIVATE_KEY")
+    JWT_PUBLIC_KEY = os.getenv("JWT_PUBLIC_KEY")
+    # verified access-token claims kept per worker until the token's exp
+    JWT_CACHE_MAXSIZE = int(os.getenv("JWT_CACHE_MAXSIZE", "10000"))
+
+    # Permission cache (per worker process)
+    PERMISSION_CACHE_TTL = int(os.getenv("PERMISSION_CACHE_TTL", "60"))
+    PERMISSION_CACHE_MAXSIZE = int(os.getenv("PERMISSION_CACHE_MAXSIZE", "10000"))
+    ROLE_CACHE_MAXSIZE = int(os.getenv("ROLE_CACHE_MAXSIZE", "1000"))
+
+    # Redis (token blacklist)
+    REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
+    REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
+    REDIS_DB = int(os.getenv("REDIS_DB", "0"))
+    REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
+    REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+    REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "1.0"))
+    REDIS_CONNECT_TIMEOUT = float(os.getenv("REDIS_CONNECT_TIMEOUT", "1.0"))
+
+    # Per-worker revocation mirror kept in sync over pub/sub
+    REVOCATION_MIRROR_ENABLED = (
+        os.getenv("REVOCATION_MIRROR_ENABLED", "true").lower() == "true"
+    )
+    REVOCATION_CHANNEL = os.getenv("REVOCATION_CHANNEL", "revocations")
+    # when the subscription is down: check Redis directly (true) or trust the mirror
+    REVOCATION_FALLBACK_TO_REDIS = (
+        os.getenv("REVOCATION_FALLBACK_TO_REDIS", "true").lower() == "true"
+    )
+
+    # bcrypt worker pool; requests beyond PASSWORD_POOL_MAX_PENDING get a 503
+    PASSWORD_POOL_WORKERS = int(os.getenv("PASSWORD_POOL_WORKERS", "4"))
+    PASSWORD_POOL_MAX_PENDING = int(os.getenv("PASSWORD_POOL_MAX_PENDING", "32"))
+
+    # HMAC key for password-reset verifiers, defaults to the JWT secret
+    RESET_TOKEN_SECRET = os.getenv("RESET_TOKEN_SECRET")
+
+    # Keyset pagination for list endpoints
+    PAGE_SIZE_DEFAULT = int(os.getenv("PAGE_SIZE_DEFAULT", "100"))
+    PAGE_SIZE_MAX = int(os.getenv("PAGE_SIZE_MAX", "1000"))
+
+    # upper bound on items accepted by one bulk request
+    BULK_MAX_ITEMS = int(os.getenv("BULK_MAX_ITEMS", "1000"))
+
+    # bulk user import: rows per INSERT/commit and bcrypt worker processes
+    # (one pool of that size per app worker, shared by concurrent uploads)
+    USER_IMPORT_BATCH_SIZE = int(os.getenv("USER_IMPORT_BATCH_SIZE", "1000"))
+    USER_IMPORT_WORKERS = int(
+        os.getenv("USER_IMPORT_WORKERS", str(os.cpu_count() or 1))
+    )
+
+    # rows per INSERT/UPDATE when seeding reference data and permission YAML
+    SEED_SYNC_BATCH_SIZE = int(os.getenv("SEED_SYNC_BATCH_SIZE", "1000"))
+
+    # rows fetched per server-side cursor round-trip in streaming exports
+    EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
+    # background audit writer: rows per INSERT, max seconds a record waits,
+    # queued records before log_audit callers wait, crash-safety spool file
+    # (each worker process writes and flocks its own <name>.<id>.ndjson
+    # next to it)
+    AUDIT_BATCH_SIZE = int(os.getenv("AUDIT_BATCH_SIZE", "500"))
+    AUDIT_FLUSH_INTERVAL = float(os.getenv("AUDIT_FLUSH_INTERVAL", "0.5"))
+    AUDIT_QUEUE_MAXSIZE = int(os.getenv("AUDIT_QUEUE_MAXSIZE", "10000"))
+    AUDIT_SPOOL_PATH = os.getenv("AUDIT_SPOOL_PATH", "logs/v1/audit_spool.ndjson")
+    # fsync every spooled record; without it the spool survives a process
+    # crash but not a host crash
+    AUDIT_SPOOL_FSYNC = os.getenv("AUDIT_SPOOL_FSYNC", "false").lower() == "true"
+    AUDIT_DRAIN_TIMEOUT = float(os.getenv("AUDIT_DRAIN_TIMEOUT", "10"))
 
     FRONTEND_URL = os.getenv("FRONTEND_URL")
     # SMTP
@@ -34,6 +111,11 @@ class TestingConfig:
     DATABASE_URL = (
         f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_DBNAME}"
     )
+    ASYNC_DATABASE_URL = (
+        f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_DBNAME}"
+    )
+    ASYNC_DB_POOL_SIZE = int(os.getenv("ASYNC_DB_POOL_SIZE", "10"))
+    ASYNC_DB_MAX_OVERFLOW = int(os.getenv("ASYNC_DB_MAX_OVERFLOW", "20"))
 
     # JWT
     JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY")
@@ -52,6 +134,11 @@ class ProductionConfig:
     DATABASE_URL = (
         f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_DBNAME}"
     )
+    ASYNC_DATABASE_URL = (
+        f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_DBNAME}"
+    )
+    ASYNC_DB_POOL_SIZE = int(os.getenv("ASYNC_DB_POOL_SIZE", "10"))
+    ASYNC_DB_MAX_OVERFLOW = int(os.getenv("ASYNC_DB_MAX_OVERFLOW", "20"))
 
     # JWT
     JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY")
@@ -3,6 +3,7 @@ from sqlalchemy import create_engine
 from config.v1.config import Config
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 
 engine = create_engine(Config.DATABASE_URL, echo=False)
 
@@ -10,6 +11,18 @@ Base = declarative_base()
 
 SessionLocal = sessionmaker(autoflush=False, autocommit=False, bind=engine)
 
+async_engine = create_async_engine(
+    Config.ASYNC_DATABASE_URL,
+    echo=False,
+    pool_size=Config.ASYNC_DB_POOL_SIZE,
+    max_overflow=Config.ASYNC_DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
 
 def getDBConnection():
     db = SessionLocal()
@@ -18,3 +31,8 @@ def getDBConnection():
         yield db
     finally:
         db.close()
+
+
+async def getAsyncDBConnection():
+    async with AsyncSessionLocal() as db:
+        yield db
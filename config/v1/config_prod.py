@@ -2,6 +2,7 @@ from sqlalchemy import create_engine
 from .config import ProductionConfig as Config
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 
 engine = create_engine(Config.DATABASE_URL, echo=False)
 
@@ -9,6 +10,18 @@ Base = declarative_base()
 
 SessionLocal = sessionmaker(autoflush=False, autocommit=False, bind=engine)
 
+async_engine = create_async_engine(
+    Config.ASYNC_DATABASE_URL,
+    echo=False,
+    pool_size=Config.ASYNC_DB_POOL_SIZE,
+    max_overflow=Config.ASYNC_DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
 
 def getDBConnection():
     db = SessionLocal()
@@ -17,3 +30,8 @@ def getDBConnection():
         yield db
     finally:
         db.close()
+
+
+async def getAsyncDBConnection():
+    async with AsyncSessionLocal() as db:
+        yield db
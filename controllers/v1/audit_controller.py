@@ -0,0 +1,38 @@
+from dao.v1.audit_dao import Audit_DBConn
+from helpers.v1.export import export_response
+from logging.handlers import RotatingFileHandler
+import logging
+import os
+
+
+# Detect Render environment
+is_render = os.getenv("RENDER", "false").lower() == "true"
+
+# Create logger
+audit_logger = logging.getLogger("audit_logger")
+audit_logger.setLevel(logging.INFO)
+
+# Common formatter
+formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+
+if is_render:
+    # Render → log to console
+    log_handler = logging.StreamHandler()
+else:
+    # Local → log to file
+    log_dir = "logs/v1"
+    os.makedirs(log_dir, exist_ok=True)
+    log_handler = RotatingFileHandler(
+        f"{log_dir}/audit_controller.log", maxBytes=5 * 1024 * 1024, backupCount=5
+    )
+
+log_handler.setFormatter(formatter)
+audit_logger.addHandler(log_handler)
+
+
+class AuditController:
+    @staticmethod
+    async def exportAuditLog(table_name, fmt):
+        """Stream the audit log, optionally for one table, as NDJSON or CSV."""
+        audit_logger.info(f"Exporting audit log as {fmt} for table: {table_name}")
+        return export_response(Audit_DBConn.exportQuery(table_name), fmt, "audit_log")
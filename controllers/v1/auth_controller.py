@@ -3,8 +3,9 @@ from fastapi.responses import JSONResponse
 from model.v1.user_model import User
 from services.v1.auth_services import AuthServices
 from sqlalchemy.orm import Session
-from utils.v1.auth_utils import hash_password, verifyResetPassToken
+from utils.v1.auth_utils import hash_password_async, verifyResetPassToken
 from dao.v1.user_dao import user_databaseConnection
+from core.v1.exceptions import AppException
 import logging
 from utils.v1.utility import generate_reset_token, sendResetLink
 
@@ -60,23 +61,19 @@ class AuthController:
                     status_code=400,
                 )
 
-            data = user_databaseConnection.getUserTable(db)
+            user = user_databaseConnection.get_by_email(receiverEmail, db)
 
-            emailList = [i.email for i in data]
-
-            if receiverEmail not in emailList:
+            if not user:
                 return JSONResponse(
                     content={"success": False, "message": "Email not registered."},
                     status_code=400,
                 )
 
-            for i in data:
-                if i.email == receiverEmail:
-                    user_id = i.id
+            user_id = user.id
 
-            raw_token, hashed_token, expires_at = generate_reset_token()
+            raw_token, selector, hashed_verifier, expires_at = generate_reset_token()
 
-            dataList = [user_id, hashed_token, expires_at]
+            dataList = [user_id, selector, hashed_verifier, expires_at]
             saveResetToken = user_databaseConnection.addResetPasswordToken(dataList, db)
 
             success = sendResetLink(receiverEmail, background_task, db, raw_token)
@@ -114,7 +111,7 @@ class AuthController:
             token_row = await verifyResetPassToken(token, db)
 
             # Hash new password
-            hashed_pwd = hash_password(password)
+            hashed_pwd = await hash_password_async(password)
 
             # Encode password and generate salt for hashing
 
@@ -128,6 +125,9 @@ class AuthController:
                 content={"success": True, "message": "Password changed successfully."}
             )
 
+        except AppException:
+            # pool saturated, let the handler answer 503
+            raise
         except Exception as e:
             auth_logger.error(f"error: {e}")
             return JSONResponse(
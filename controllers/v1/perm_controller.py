@@ -1,4 +1,5 @@
 from helpers.v1.permission_helpers import (
+    validate_permission_triples,
     verifyModuleRolendPermID,
     verifyModuleUserndPermID,
 )
@@ -8,6 +9,9 @@ from services.v1.permission_services import Perm_Serv, Module_Serv
 from dao.v1.perm_dao import RolePerm_DBConn, UserPerm_DBConn
 from dao.v1.user_dao import user_databaseConnection
 from dao.v1.module_dao import Module_DBConn
+from helpers.v1.pagination import page_result
+from helpers.v1.export import export_response
+from utils.v1.audit_logger import log_audit
 from logging.handlers import RotatingFileHandler
 from fastapi.responses import JSONResponse
 from collections import defaultdict
@@ -43,10 +47,19 @@ perm_logger.addHandler(log_handler)
 
 class PermissionModule:
     @staticmethod
-    async def getRolePermission(role_id, db):
+    async def getRolePermission(role_id, db, page=None):
         perm_logger.info("Fetching role permissions from the database.")
         try:
-            data = RolePerm_DBConn.getRPData(db)
+            next_cursor = None
+            if page and not role_id:
+                data = RolePerm_DBConn.getRPData(
+                    db, limit=page.limit, after_id=page.after_id
+                )
+                data, next_cursor = page_result(data, page.limit)
+            elif role_id:
+                data = RolePerm_DBConn.getRPData(db, role_id=int(role_id))
+            else:
+                data = RolePerm_DBConn.getRPData(db)
             role_dict = defaultdict(list)
             for entry in data:
                 r_id = entry.role_id  # Extracting role ID
@@ -80,6 +93,7 @@ class PermissionModule:
                     "success": True,
                     "message": "Fetched all roles successfully.",
                     "data": role_dict,
+                    "next_cursor": next_cursor,
                 },
                 status_code=200,
             )
@@ -91,7 +105,13 @@ class PermissionModule:
             )
 
     @staticmethod
-    async def addRolePermission(data, db):
+    async def exportRolePermission(fmt):
+        """Stream every active role permission as NDJSON or CSV."""
+        perm_logger.info(f"Exporting role permissions as {fmt}.")
+        return export_response(RolePerm_DBConn.exportQuery(), fmt, "role_permissions")
+
+    @staticmethod
+    async def addRolePermission(data, db, current_user=None):
         """
         Add a new role permission to the database.
         """
@@ -120,37 +140,98 @@ class PermissionModule:
             if verificationID.status_code == 400:
                 return verificationID
 
-            existing_role_permission = (
-                db.query(RolePermission)
-                .filter(
-                    RolePermission.role_id == role_id,
-                    RolePermission.module_id == module_id,
-                    RolePermission.permission_id == permission_id,
-                    RolePermission.is_deleted == 0,
+            # a single upsert; an active duplicate comes back as a 400
+            dataList = [role_id, module_id, permission_id]
+            created_by = current_user["user_id"] if current_user else None
+            uploadData = RolePerm_DBConn.addRolePerm(dataList, db, created_by)
+            if uploadData.status_code != 201:
+                perm_logger.warning("Role Permission Not Added")
+            else:
+                perm_logger.info("Role permission added successfully.")
+            return uploadData
+
+        except Exception as e:
+            perm_logger.error(f"Add Role Permission failed: {e}")  # ✅ Fixed line
+            return JSONResponse(
+                content={"success": False, "message": str(e)},
+                status_code=400,
+            )
+
+    @staticmethod
+    async def bulkAddRolePermission(payload, db, current_user, request=None):
+        """
+        Grant many (role_id, module_id, permission_id) triples at once.
+        All triples are validated in one query and the request is rejected
+        as a whole if any of them is invalid. Triples that already exist
+        are skipped, soft-deleted ones are revived. One audit record is
+        written for the whole batch.
+        """
+        try:
+            # drop repeats, one statement cannot upsert the same row twice
+            triples = list(
+                dict.fromkeys(
+                    (i.role_id, i.module_id, i.permission_id) for i in payload.items
                 )
-                .all()
             )
-            if existing_role_permission:
-                perm_logger.warning(f"RolePermission creation failed: Duplicate Entry.")
+            perm_logger.info(f"Bulk adding {len(triples)} role permissions.")
 
+            errors = validate_permission_triples("role", triples, db)
+            if errors:
+                perm_logger.warning(f"Bulk role permission rejected: {errors}")
                 return JSONResponse(
                     content={
                         "success": False,
-                        "message": "Role Permission already exists.",
+                        "message": "Invalid role permissions.",
+                        "errors": [
+                            {
+                                "role_id": role_id,
+                                "module_id": module_id,
+                                "permission_id": permission_id,
+                                "message": message,
+                            }
+                            for (role_id, module_id, permission_id), message in errors
+                        ],
                     },
                     status_code=400,
                 )
 
-            dataList = [role_id, module_id, permission_id]
-            uploadData = RolePerm_DBConn.addRolePerm(dataList, db)
-            if uploadData.status_code != 201:
-                perm_logger.warning("Role Permission Not Added")
-            else:
-                perm_logger.info("Role permission added successfully.")
-            return uploadData
+            rows = RolePerm_DBConn.bulkUpsertRolePerm(
+                triples, current_user["user_id"], db
+            )
+            if isinstance(rows, JSONResponse):
+                return rows
+
+            added = [
+                {
+                    "id": row.id,
+                    "role_id": row.role_id,
+                    "module_id": row.module_id,
+                    "permission_id": row.permission_id,
+                }
+                for row in rows
+            ]
+            await log_audit(
+                db,
+                table_name="role_permissions",
+                record_id=None,
+                action="CREATE",
+                user=str(current_user["user_id"]),
+                request=request,
+                new_data={"bulk": True, "added": added},
+            )
 
+            perm_logger.info(f"Bulk role permission: {len(added)} added.")
+            return JSONResponse(
+                content={
+                    "success": True,
+                    "message": "Role Permissions Added Successfully.",
+                    "added": added,
+                    "skipped": len(triples) - len(added),
+                },
+                status_code=201,
+            )
         except Exception as e:
-            perm_logger.error(f"Add Role Permission failed: {e}")  # ✅ Fixed line
+            perm_logger.error(f"Bulk Add Role Permission failed: {e}")
             return JSONResponse(
                 content={"success": False, "message": str(e)},
                 status_code=400,
@@ -252,13 +333,8 @@ class PermissionModule:
 
         # Retrieve user_id if only email is provided
         if email and not user_id:
-            try:
-                user_id = [
-                    i.id
-                    for i in user_databaseConnection.getUserTable(db)
-                    if i.email == email
-                ][0]
-            except IndexError:
+            user = user_databaseConnection.get_by_email(email, db)
+            if not user:
                 perm_logger.error(f"User with email '{email}' not found.")
                 return JSONResponse(
                     content={
@@ -267,6 +343,7 @@ class PermissionModule:
                     },
                     status_code=400,
                 )
+            user_id = user.id
 
         perm_logger.info(f"Fetching permission details for user_id: {user_id}")
 
@@ -293,14 +370,23 @@ class PermissionModule:
         return JSONResponse(content=response, status_code=200)
 
     @staticmethod
-    async def getUserPermission(user_id, db):
+    async def getUserPermission(user_id, db, page=None):
         """
         Retrieve user permissions from the database.
         If 'user_id' is provided, return permissions specific to that user.
         """
         perm_logger.info("Fetching user permissions from the database.")
         try:
-            data = UserPerm_DBConn.getUserPData(db)
+            next_cursor = None
+            if page and not user_id:
+                data = UserPerm_DBConn.getUserPData(
+                    db, limit=page.limit, after_id=page.after_id
+                )
+                data, next_cursor = page_result(data, page.limit)
+            elif user_id:
+                data = UserPerm_DBConn.getUserPData(db, user_id=int(user_id))
+            else:
+                data = UserPerm_DBConn.getUserPData(db)
 
             user_dict = defaultdict(list)
             for entry in data:
@@ -319,9 +405,7 @@ class PermissionModule:
 
                 if user_dict.get(user_id) is None:
                     perm_logger.warning(f"No permissions found for user_id: {user_id}")
-                    return JSONResponse(
-                        content={userPermissionID: "No user permissions."}
-                    )
+                    return JSONResponse(content={str(user_id): "No user permissions."})
 
                 perm_logger.info(f"Returning permissions for user_id: {user_id}")
                 return JSONResponse(
@@ -337,6 +421,7 @@ class PermissionModule:
                 content={
                     "message": "Fetched all users successfully.",
                     "data": user_dict,
+                    "next_cursor": next_cursor,
                 },
                 status_code=200,
             )
@@ -351,7 +436,13 @@ class PermissionModule:
             )
 
     @staticmethod
-    async def addUserPermission(data, db):
+    async def exportUserPermission(fmt):
+        """Stream every active user permission as NDJSON or CSV."""
+        perm_logger.info(f"Exporting user permissions as {fmt}.")
+        return export_response(UserPerm_DBConn.exportQuery(), fmt, "user_permissions")
+
+    @staticmethod
+    async def addUserPermission(data, db, current_user=None):
         """
         Add a new user permission to the database.
         """
@@ -380,18 +471,15 @@ class PermissionModule:
             if verificationID.status_code == 400:
                 return verificationID
 
-            existing_user_permission = (
-                db.query(UserPermission)
-                .filter(
-                    UserPermission.user_id == user_id,
-                    UserPermission.module_id == module_id,
-                    UserPermission.permission_id == permission_id,
-                    UserPermission.is_deleted == 0,
-                )
-                .all()
-            )
-            if existing_user_permission:
-                perm_logger.warning(f"UserPermission creation failed: Duplicate Entry.")
+            # a single upsert; False means an active grant already exists
+            dataList = [user_id, module_id, permission_id]
+
+            created_by = current_user["user_id"] if current_user else None
+            uploadData = UserPerm_DBConn.addUserPerm(dataList, db, created_by)
+            if isinstance(uploadData, JSONResponse):
+                return uploadData
+            if not uploadData:
+                perm_logger.warning("User permission already exists.")
                 return JSONResponse(
                     content={
                         "success": False,
@@ -400,29 +488,112 @@ class PermissionModule:
                     status_code=400,
                 )
 
-            dataList = [user_id, module_id, permission_id]
+            perm_logger.info("User permission added successfully.")
+            return JSONResponse(
+                content={
+                    "success": True,
+                    "message": "User permission added successfully.",
+                },
+                status_code=200,
+            )
+        except Exception as e:
+            perm_logger.error(f"Add User Permission failed: {e}")
 
-            uploadData = UserPerm_DBConn.addUserPerm(dataList, db)
-            if not uploadData:
-                perm_logger.warning("User permission already exists.")
+    @staticmethod
+    async def bulkApplyUserPermission(payload, db, current_user, request=None):
+        """
+        Grant and revoke many (user_id, module_id, permission_id) triples in
+        one transaction. Grants are validated in one query and the request
+        is rejected as a whole if any of them is invalid, or if a triple is
+        both granted and revoked. One audit record covers the whole batch.
+        """
+        try:
+            grants = list(
+                dict.fromkeys(
+                    (i.user_id, i.module_id, i.permission_id) for i in payload.grant
+                )
+            )
+            revokes = list(
+                dict.fromkeys(
+                    (i.user_id, i.module_id, i.permission_id) for i in payload.revoke
+                )
+            )
+            perm_logger.info(
+                f"Bulk user permission: {len(grants)} grants, {len(revokes)} revokes."
+            )
+
+            errors = validate_permission_triples("user", grants, db)
+            errors += [
+                (triple, "Triple is both granted and revoked")
+                for triple in set(grants) & set(revokes)
+            ]
+            if errors:
+                perm_logger.warning(f"Bulk user permission rejected: {errors}")
                 return JSONResponse(
                     content={
                         "success": False,
-                        "message": "User permission already exists.",
+                        "message": "Invalid user permissions.",
+                        "errors": [
+                            {
+                                "user_id": user_id,
+                                "module_id": module_id,
+                                "permission_id": permission_id,
+                                "message": message,
+                            }
+                            for (user_id, module_id, permission_id), message in errors
+                        ],
                     },
                     status_code=400,
                 )
 
-            perm_logger.info("User permission added successfully.")
+            result = UserPerm_DBConn.bulkApplyUserPerm(
+                grants, revokes, current_user["user_id"], db
+            )
+            if isinstance(result, JSONResponse):
+                return result
+
+            granted, revoked = (
+                [
+                    {
+                        "id": row.id,
+                        "user_id": row.user_id,
+                        "module_id": row.module_id,
+                        "permission_id": row.permission_id,
+                    }
+                    for row in rows
+                ]
+                for rows in result
+            )
+            await log_audit(
+                db,
+                table_name="user_permissions",
+                record_id=None,
+                action="UPDATE",
+                user=str(current_user["user_id"]),
+                request=request,
+                new_data={"bulk": True, "granted": granted, "revoked": revoked},
+            )
+
+            unchanged = len(grants) + len(revokes) - len(granted) - len(revoked)
+            perm_logger.info(
+                f"Bulk user permission: {len(granted)} granted, {len(revoked)} revoked."
+            )
             return JSONResponse(
                 content={
                     "success": True,
-                    "message": "User permission added successfully.",
+                    "message": "User Permissions Updated Successfully.",
+                    "granted": granted,
+                    "revoked": revoked,
+                    "unchanged": unchanged,
                 },
                 status_code=200,
             )
         except Exception as e:
-            perm_logger.error(f"Add User Permission failed: {e}")
+            perm_logger.error(f"Bulk User Permission failed: {e}")
+            return JSONResponse(
+                content={"success": False, "message": str(e)},
+                status_code=400,
+            )
 
     @staticmethod
     async def updateUserPermission(data, db):
@@ -610,7 +781,7 @@ class PermissionModule:
             )
 
     @staticmethod
-    async def getModule(module_id, db):
+    async def getModule(module_id, db, page=None):
         """
         Fetch modules:
         - If module_id is given, return that module.
@@ -619,7 +790,14 @@ class PermissionModule:
         perm_logger.info("Received request to fetch module(s).")
 
         try:
-            all_modules = Module_DBConn.getModuleData(db)
+            next_cursor = None
+            if page and not module_id:
+                all_modules = Module_DBConn.getModuleData(
+                    db, limit=page.limit, after_id=page.after_id
+                )
+                all_modules, next_cursor = page_result(all_modules, page.limit)
+            else:
+                all_modules = Module_DBConn.getModuleData(db)
 
             if module_id:
                 module_id = int(module_id)
@@ -649,6 +827,7 @@ class PermissionModule:
                     }
                     for m in all_modules
                 ],
+                "next_cursor": next_cursor,
             }
 
             perm_logger.info(f"Successfully retrieved {len(all_modules)} module(s).")
@@ -817,7 +996,7 @@ class PermissionModule:
             )
 
     @staticmethod
-    async def getPermission(permission_id, db):
+    async def getPermission(permission_id, db, page=None, fieldset=None):
         """
         Retrieve permission details.
         - If permission_id is provided, return specific permission details.
@@ -832,7 +1011,9 @@ class PermissionModule:
                 )
 
             # Call service layer to fetch permissions
-            response = await Perm_Serv.getPermission_Serv(permission_id, db)
+            response = await Perm_Serv.getPermission_Serv(
+                permission_id, db, page, fieldset
+            )
 
             perm_logger.info(
                 f"Fetched permission details for permission_id: {permission_id}"
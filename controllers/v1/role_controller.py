@@ -3,6 +3,7 @@ from dao.v1.role_dao import Role_DBConn
 from fastapi.responses import JSONResponse
 from model.v1.user_model import Role
 from sqlalchemy.orm import Session
+from utils.v1.permission_cache import invalidate_roles
 
 
 
@@ -38,13 +39,13 @@ role_logger.addHandler(log_handler)
 
 class RoleController:
     @staticmethod
-    async def getRole(role_id, db):
+    async def getRole(role_id, db, page=None, fieldset=None):
         """Retrieves details of a specific role based on role ID."""
         try:
             role_logger.info(f"Fetching role details: RoleID={role_id}")
 
             # Call service layer to fetch role details
-            result = await Role_Services.getRole_serv(role_id, db)
+            result = await Role_Services.getRole_serv(role_id, db, page, fieldset)
             return result
         except Exception as e:
             role_logger.error(f"error: {e}")
@@ -160,6 +161,7 @@ class RoleController:
             # Perform delete operation
             db.query(Role).filter(Role.id == role_id).update({"is_deleted": 1})
             db.commit()
+            invalidate_roles()
             role_logger.info(f"Role deleted successfully: {role_id}")
             return JSONResponse(
                 content={
@@ -1,7 +1,11 @@
 from services.v1.user_services import user_services
 from dao.v1.user_dao import user_databaseConnection
+from helpers.v1.export import export_response
+from services.v1.user_import_services import UserImporter, import_pool, read_import
+from starlette.concurrency import run_in_threadpool
 from logging.handlers import RotatingFileHandler
 from fastapi.responses import JSONResponse
+import io
 import logging
 
 
@@ -36,13 +40,13 @@ user_logger.addHandler(log_handler)
 
 class UserController:
     @staticmethod
-    async def getAllUser(userID, db):
+    async def getAllUser(userID, db, page=None, fieldset=None):
         """Retrieves details of all users or a specific user by ID."""
         try:
             user_logger.info(f"getAllUser called with user ID: {userID}")
 
             # Call service layer to get users
-            result = await user_services.getAlluser_serv(userID, db)
+            result = await user_services.getAlluser_serv(userID, db, page, fieldset)
 
             return result
         except Exception as e:
@@ -52,6 +56,43 @@ class UserController:
                 status_code=400,
             )
 
+    @staticmethod
+    async def exportUsers(fmt):
+        """Streams every active user as NDJSON or CSV."""
+        user_logger.info(f"exportUsers called with format: {fmt}")
+        return export_response(user_databaseConnection.exportQuery(), fmt, "users")
+
+    @staticmethod
+    async def importUsers(file, fmt, db, current_user):
+        """Imports users from an uploaded CSV/NDJSON file in batches."""
+        try:
+            user_logger.info(f"importUsers called with {file.filename} ({fmt})")
+            stream = io.TextIOWrapper(file.file, encoding="utf-8", newline="")
+            records = read_import(stream, fmt)
+            importer = UserImporter(
+                db, created_by=current_user["user_id"], pool=import_pool()
+            )
+            # parsing, hashing and inserts are blocking; keep them off the event loop
+            summary = await run_in_threadpool(importer.run, records)
+            user_logger.info(
+                f"importUsers finished: {summary['imported']}/{summary['total']} "
+                f"imported in {summary['seconds']}s"
+            )
+            return JSONResponse(
+                content={
+                    "success": True,
+                    "message": "User import finished.",
+                    **summary,
+                },
+                status_code=200,
+            )
+        except Exception as e:
+            user_logger.error(f"importUsers failed: {e}")
+            return JSONResponse(
+                content={"success": False, "message": str(e)},
+                status_code=400,
+            )
+
     @staticmethod
     async def updateUser(data, db, current_user):
         """Updates user details such as username, status, and role."""
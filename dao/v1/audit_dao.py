@@ -0,0 +1,25 @@
+from sqlalchemy import select
+from model.v1.audit_log import AuditLog
+
+
+class Audit_DBConn:
+    @staticmethod
+    def exportQuery(table_name: str = None):
+        """Column-only select for the streaming audit-log export."""
+        query = select(
+            AuditLog.id,
+            AuditLog.table_name,
+            AuditLog.record_id,
+            AuditLog.action,
+            AuditLog.changed_fields,
+            AuditLog.old_data,
+            AuditLog.new_data,
+            AuditLog.performed_by,
+            AuditLog.performed_at,
+            AuditLog.ip_address,
+            AuditLog.module,
+            AuditLog.extra_context,
+        )
+        if table_name:
+            query = query.where(AuditLog.table_name == table_name)
+        return query.order_by(AuditLog.id)
@@ -1,18 +1,72 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, exists, false, select
 from model.v1.user_model import User
+from model.v1.role_model import Role
+from model.v1.permission_model import RolePermission, UserPermission
+
+
+def _authorization_query(user_id, role_id, module_id=None, permission_id=None):
+    if module_id is not None and permission_id is not None:
+        role_granted = exists().where(
+            RolePermission.role_id == role_id,
+            RolePermission.module_id == module_id,
+            RolePermission.permission_id == permission_id,
+            RolePermission.is_deleted == 0,
+        )
+        user_granted = exists().where(
+            UserPermission.user_id == user_id,
+            UserPermission.module_id == module_id,
+            UserPermission.permission_id == permission_id,
+            UserPermission.is_deleted == 0,
+        )
+    else:
+        # no permission requested, skip both probes
+        role_granted = user_granted = false()
+
+    return (
+        select(
+            User.id,
+            Role.role_name,
+            role_granted.label("role_granted"),
+            user_granted.label("user_granted"),
+        )
+        .outerjoin(
+            Role,
+            and_(Role.id == role_id, Role.is_deleted == 0, Role.status == 1),
+        )
+        .where(User.id == user_id, User.is_deleted == 0)
+        .limit(1)
+    )
+
+
+def _user_details_query(email: str = None, user_id: int = None):
+    query = select(User).where(User.is_deleted == 0)  # filter out deleted users
+
+    if email:
+        query = query.where(User.email == email)
+
+    if user_id:
+        query = query.where(User.id == user_id)
+
+    return query.limit(1)
+
+
+def _new_user(user_details):
+    return User(
+        email=user_details[0],
+        password=user_details[1],
+        user_name=user_details[2],
+        role_id=user_details[3],
+        status=user_details[4],
+        created_by=user_details[5],
+    )
 
 
 class AuthDAO:
     @staticmethod
     def register_user_dao(user_details, db: Session):
-        new_user = User(
-            email=user_details[0],
-            password=user_details[1],
-            user_name=user_details[2],
-            role_id=user_details[3],
-            status=user_details[4],
-            created_by=user_details[5],
-        )
+        new_user = _new_user(user_details)
         db.add(new_user)
         db.commit()
         db.refresh(new_user)
@@ -22,16 +76,43 @@ class AuthDAO:
     def get_user_details_dao(
         email: str = None, user_id: int = None, db: Session = None
     ):
-        query = db.query(User).filter(User.is_deleted == 0)  # filter out deleted users
-
-        if email:
-            query = query.filter(User.email == email)
-
-        if user_id:
-            query = query.filter(User.id == user_id)
-
         if not email and not user_id:
             # no filters, return all active users
             return None
 
-        return query.first()
+        return db.execute(_user_details_query(email, user_id)).scalars().first()
+
+    @staticmethod
+    def get_authorization_context(
+        user_id: int,
+        role_id: int,
+        module_id: int = None,
+        permission_id: int = None,
+        db: Session = None,
+    ):
+        """
+        Resolve everything token_required needs in a single statement.
+        Returns a row of (user_id, role_name, role_granted, user_granted),
+        or None when the user does not exist or is deleted. role_name is
+        None when the role is missing, deleted or inactive.
+        """
+        return db.execute(
+            _authorization_query(user_id, role_id, module_id, permission_id)
+        ).first()
+
+
+class AsyncAuthDAO:
+    """AsyncSession lookup for token_required(use_async=True)."""
+
+    @staticmethod
+    async def get_authorization_context(
+        user_id: int,
+        role_id: int,
+        module_id: int = None,
+        permission_id: int = None,
+        db: AsyncSession = None,
+    ):
+        result = await db.execute(
+            _authorization_query(user_id, role_id, module_id, permission_id)
+        )
+        return result.first()
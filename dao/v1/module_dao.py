@@ -3,17 +3,21 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from fastapi.responses import JSONResponse
+from helpers.v1.pagination import keyset
 
 
 class Module_DBConn:
     @staticmethod
-    def getModuleData(db: Session):
+    def getModuleData(db: Session, limit: int = None, after_id: int = None):
         # Establishing a database connection
-        modules = (
-            db.query(Module).filter(Module.is_deleted == 0).all()
+        query = db.query(Module).filter(
+            Module.is_deleted == 0
         )  # Query to fetch all module data
+        if limit:
+            # one keyset page ordered by id
+            query = keyset(query, Module, limit, after_id)
         # Fetching all results
-        return modules  # Returning the fetched module data
+        return query.all()  # Returning the fetched module data
 
     @staticmethod
     def addModDB(name, created_by, db: Session):
@@ -2,17 +2,74 @@ from model.v1.permission_model import Permission, RolePermission, UserPermission
 from sqlalchemy.exc import IntegrityError
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
+from sqlalchemy import func, select, tuple_, update
 from sqlalchemy import text
+from utils.v1.permission_cache import invalidate_permissions
+from helpers.v1.pagination import keyset
+from helpers.v1.fieldsets import select_columns
+from helpers.v1.bulk import dialect_insert
+
+
+def _grant_upsert(model, owner_field, triples, created_by, db):
+    """
+    INSERT ... ON CONFLICT statement for (owner_id, module_id,
+    permission_id) triples: soft-deleted rows are revived, active ones are
+    left untouched. RETURNING yields only the inserted or revived rows.
+    A revived row keeps its modified_by when created_by is None.
+    """
+    stmt = dialect_insert(model, db).values(
+        [
+            {
+                owner_field: owner_id,
+                "module_id": module_id,
+                "permission_id": permission_id,
+                "created_by": created_by,
+                "is_deleted": 0,
+            }
+            for owner_id, module_id, permission_id in triples
+        ]
+    )
+    revive = {"is_deleted": 0, "modified_at": func.now()}
+    if created_by is not None:
+        revive["modified_by"] = stmt.excluded.created_by
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[owner_field, "permission_id", "module_id"],
+        set_=revive,
+        where=model.is_deleted != 0,
+    ).returning(
+        model.id,
+        getattr(model, owner_field),
+        model.module_id,
+        model.permission_id,
+    )
+    return stmt
 
 
 class Permissions_DBConn:
+    # response key -> column for list reads
+    LIST_FIELDS = {
+        "permission_id": Permission.id,
+        "name": Permission.permission_name,
+        "created_by": Permission.created_by,
+    }
+
     @staticmethod
-    def getPermissionData(db: Session):
+    def getPermissionData(
+        db: Session, limit: int = None, after_id: int = None, fields: dict = None
+    ):
         # Establishing a database connection
-        data = (
-            db.query(Permission).filter(Permission.is_deleted == 0).all()
+        if fields:
+            # column-only Row tuples instead of hydrated Permission entities
+            query = db.query(*select_columns(Permission, fields))
+        else:
+            query = db.query(Permission)
+        query = query.filter(
+            Permission.is_deleted == 0
         )  # Query to fetch all permission records
-        return data  # Returning the fetched data
+        if limit:
+            # one keyset page ordered by id
+            query = keyset(query, Permission, limit, after_id)
+        return query.all()  # Returning the fetched data
 
     @staticmethod
     def addPermissionDB(name, created_by, db: Session):
@@ -91,27 +148,61 @@ class Permissions_DBConn:
 
 class RolePerm_DBConn:
     @staticmethod
-    def getRPData(db: Session):
+    def getRPData(
+        db: Session, limit: int = None, after_id: int = None, role_id: int = None
+    ):
         # Establishing a database connection
         try:
-            data = db.query(RolePermission).filter(RolePermission.is_deleted == 0).all()
-            return data  # Returning the fetched data
+            query = db.query(RolePermission).filter(RolePermission.is_deleted == 0)
+            if role_id is not None:
+                query = query.filter(RolePermission.role_id == role_id)
+            if limit:
+                # one keyset page ordered by id
+                query = keyset(query, RolePermission, limit, after_id)
+            return query.all()  # Returning the fetched data
         except Exception as e:
             return []
 
     @staticmethod
-    def addRolePerm(dataList, db: Session):
-        try:
-            # Query to insert a new role permission record
-            newRolePermission = RolePermission(
-                role_id=dataList[0], module_id=dataList[1], permission_id=dataList[2]
+    def exportQuery():
+        """Column-only select for the streaming role-permission export."""
+        return (
+            select(
+                RolePermission.id,
+                RolePermission.role_id,
+                RolePermission.module_id,
+                RolePermission.permission_id,
+                RolePermission.status,
+                RolePermission.created_at,
+                RolePermission.modified_at,
             )
-            db.add(newRolePermission)
+            .where(RolePermission.is_deleted == 0)
+            .order_by(RolePermission.id)
+        )
+
+    @staticmethod
+    def addRolePerm(dataList, db: Session, created_by=None):
+        try:
+            # insert, or revive a soft-deleted grant, in one statement
+            row = db.execute(
+                _grant_upsert(RolePermission, "role_id", [dataList], created_by, db)
+            ).first()
             db.commit()  # Committing the transaction
+            if row is None:
+                # conflict with an active grant, nothing was written
+                return JSONResponse(
+                    content={
+                        "success": False,
+                        "message": "Role Permission already exists.",
+                    },
+                    status_code=400,
+                )
+            invalidate_permissions()
             return JSONResponse(
                 content={
                     "success": True,
-                    "meesage": "Role Permission Added Successfully.",
+                    "message": "Role Permission Added Successfully.",
+                    "id": row.id,
                 },
                 status_code=201,
             )
@@ -133,12 +224,34 @@ class RolePerm_DBConn:
                 content={"success": False, "error": str(e)}, status_code=400
             )
 
+    @staticmethod
+    def bulkUpsertRolePerm(triples, created_by, db: Session):
+        """
+        Insert (role_id, module_id, permission_id) triples in one
+        INSERT ... ON CONFLICT statement. Soft-deleted rows are revived,
+        active ones are left untouched. Returns the inserted or revived rows.
+        """
+        try:
+            rows = db.execute(
+                _grant_upsert(RolePermission, "role_id", triples, created_by, db)
+            ).all()
+            db.commit()
+            invalidate_permissions()
+            return rows
+        except IntegrityError as ie:
+            db.rollback()
+            return JSONResponse(
+                content={"success": False, "error": "Database integrity error"},
+                status_code=400,
+            )
+
     @staticmethod
     def updateRolePermissionDB(recentUpdate, data2update, id, db: Session):
         try:
             updateData = dict(zip(recentUpdate, data2update))
             db.query(RolePermission).filter(RolePermission.id == id).update(updateData)
             db.commit()  # Committing the transaction
+            invalidate_permissions()
             updated_data = {
                 recentUpdate[i]: data2update[i] for i in range(len(recentUpdate))
             }
@@ -187,6 +300,7 @@ class RolePerm_DBConn:
                 {"is_deleted": 1}
             )
             db.commit()  # Committing the transaction
+            invalidate_permissions()
             return JSONResponse(
                 content={
                     "message": "Role Permission Deleted Successfully.",
@@ -206,14 +320,38 @@ class RolePerm_DBConn:
 
 class UserPerm_DBConn:
     @staticmethod
-    def getUserPData(db: Session):
+    def getUserPData(
+        db: Session, limit: int = None, after_id: int = None, user_id: int = None
+    ):
         # Establishing a database connection
         try:
-            data = db.query(UserPermission).filter(UserPermission.is_deleted == 0).all()
-            return data  # Returning the fetched data
+            query = db.query(UserPermission).filter(UserPermission.is_deleted == 0)
+            if user_id is not None:
+                query = query.filter(UserPermission.user_id == user_id)
+            if limit:
+                # one keyset page ordered by id
+                query = keyset(query, UserPermission, limit, after_id)
+            return query.all()  # Returning the fetched data
         except Exception as e:
             return []
 
+    @staticmethod
+    def exportQuery():
+        """Column-only select for the streaming user-permission export."""
+        return (
+            select(
+                UserPermission.id,
+                UserPermission.user_id,
+                UserPermission.module_id,
+                UserPermission.permission_id,
+                UserPermission.status,
+                UserPermission.created_at,
+                UserPermission.modified_at,
+            )
+            .where(UserPermission.is_deleted == 0)
+            .order_by(UserPermission.id)
+        )
+
     @staticmethod
     def getPermissionsOfUser(userid, db: Session):
         # Establishing a database connection
@@ -256,14 +394,17 @@ WHERE bu.id = :idnum AND bu.is_deleted = 0;"""
             return []
 
     @staticmethod
-    def addUserPerm(dataList, db: Session):
+    def addUserPerm(dataList, db: Session, created_by=None):
         try:
-            # Query to insert a new user permission record
-            newUserPermission = UserPermission(
-                user_id=dataList[0], module_id=dataList[1], permission_id=dataList[2]
-            )
-            db.add(newUserPermission)
+            # insert, or revive a soft-deleted grant, in one statement
+            row = db.execute(
+                _grant_upsert(UserPermission, "user_id", [dataList], created_by, db)
+            ).first()
             db.commit()  # Committing the transaction
+            if row is None:
+                # conflict with an active grant, nothing was written
+                return False
+            invalidate_permissions()
             return True  # Returning the result
 
         except IntegrityError as ie:
@@ -289,6 +430,55 @@ WHERE bu.id = :idnum AND bu.is_deleted = 0;"""
                 content={"success": False, "error": str(e)}, status_code=400
             )
 
+    @staticmethod
+    def bulkApplyUserPerm(grants, revokes, modified_by, db: Session):
+        """
+        Grant and revoke (user_id, module_id, permission_id) triples in one
+        transaction: one INSERT ... ON CONFLICT on uix_user_permission for
+        the grants and one UPDATE ... WHERE (user_id, module_id,
+        permission_id) IN (...) soft-delete for the revokes. Returns
+        (granted rows, revoked rows); unchanged triples are not returned.
+        """
+        try:
+            granted = (
+                db.execute(
+                    _grant_upsert(UserPermission, "user_id", grants, modified_by, db)
+                ).all()
+                if grants
+                else []
+            )
+            revoked = []
+            if revokes:
+                revoked = db.execute(
+                    update(UserPermission)
+                    .where(
+                        tuple_(
+                            UserPermission.user_id,
+                            UserPermission.module_id,
+                            UserPermission.permission_id,
+                        ).in_(revokes),
+                        UserPermission.is_deleted == 0,
+                    )
+                    .values(
+                        is_deleted=1, modified_by=modified_by, modified_at=func.now()
+                    )
+                    .returning(
+                        UserPermission.id,
+                        UserPermission.user_id,
+                        UserPermission.module_id,
+                        UserPermission.permission_id,
+                    )
+                ).all()
+            db.commit()
+            invalidate_permissions()
+            return granted, revoked
+        except IntegrityError as ie:
+            db.rollback()
+            return JSONResponse(
+                content={"success": False, "error": "Database integrity error"},
+                status_code=400,
+            )
+
     @staticmethod
     def updateUserPermissionDB(recentUpdate, data2update, id, db: Session):
         try:
@@ -296,6 +486,7 @@ WHERE bu.id = :idnum AND bu.is_deleted = 0;"""
             updateData = dict(zip(recentUpdate, data2update))
             db.query(UserPermission).filter(UserPermission.id == id).update(updateData)
             db.commit()  # Committing the transaction
+            invalidate_permissions()
             return JSONResponse(
                 content={"success": True, "message": "User Permission Successfully."},
                 status_code=200,
@@ -364,6 +555,7 @@ WHERE bu.email = :emailid AND bu.is_deleted = 0;
                 {"is_deleted": 1}
             )
             db.commit()  # Committing the transaction
+            invalidate_permissions()
             return True
         except Exception as e:
             return False
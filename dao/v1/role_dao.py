@@ -2,16 +2,44 @@ from model.v1.user_model import Role
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from fastapi.responses import JSONResponse
+from utils.v1.permission_cache import invalidate_roles
+from helpers.v1.pagination import keyset
+from helpers.v1.fieldsets import select_columns
 
 
 class Role_DBConn:
+    # response key -> column for list reads
+    LIST_FIELDS = {
+        "id": Role.id,
+        "rolename": Role.role_name,
+        "status": Role.status,
+        "created_by": Role.created_by,
+        "modified_by": Role.modified_by,
+        "created_at": Role.created_at,
+        "modified_at": Role.modified_at,
+    }
+
     @staticmethod
-    def getRoleData(db: Session):
+    def getRoleData(
+        db: Session,
+        limit: int = None,
+        after_id: int = None,
+        fields: dict = None,
+        role_id: int = None,
+    ):
         # Establishing a database connection
-        data = (
-            db.query(Role).filter(Role.is_deleted == 0).all()
-        )  # Query to fetch all roles
-        return data  # Returning the fetched role data
+        if fields:
+            # column-only Row tuples instead of hydrated Role entities
+            query = db.query(*select_columns(Role, fields))
+        else:
+            query = db.query(Role)
+        query = query.filter(Role.is_deleted == 0)  # Query to fetch all roles
+        if role_id is not None:
+            query = query.filter(Role.id == role_id)
+        if limit:
+            # one keyset page ordered by id
+            query = keyset(query, Role, limit, after_id)
+        return query.all()  # Returning the fetched role data
 
     @staticmethod
     def createRole(dataList, db: Session):
@@ -59,6 +87,7 @@ class Role_DBConn:
             updateRoleData = dict(zip(updateRole, dataList))
             affected_rows = db.query(Role).filter(Role.id == id).update(updateRoleData)
             db.commit()
+            invalidate_roles()
             return affected_rows > 0  # Only return True if update was successful
         except Exception as e:
             print(f"Error updating role: {e}")
@@ -1,10 +1,28 @@
 from fastapi.responses import JSONResponse
 from model.v1.user_model import User, PasswordResetToken
 from sqlalchemy.orm import Session
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
+from utils.v1.permission_cache import invalidate_permissions
+from helpers.v1.pagination import keyset
+from helpers.v1.fieldsets import select_columns
+from helpers.v1.bulk import dialect_insert
 
 
 class user_databaseConnection:
+    # response key -> column for list/export reads; password is never selected
+    LIST_FIELDS = {
+        "id": User.id,
+        "email": User.email,
+        "username": User.user_name,
+        "status": User.status,
+        "role": User.role_id,
+        "created_by": User.created_by,
+        "modified_by": User.modified_by,
+        "created_at": User.created_at,
+        "modified_at": User.modified_at,
+    }
+
     @staticmethod
     def registerUserDetails(user_data, role, db: Session):
         # Establishing a database connection
@@ -60,17 +78,84 @@ class user_databaseConnection:
             )
 
     @staticmethod
-    def getUserTable(db: Session):
+    def getUserTable(
+        db: Session, limit: int = None, after_id: int = None, fields: dict = None
+    ):
         # Establishing a database connection
         try:
-            result = db.query(User).filter(User.is_deleted == 0).all()
-            return result  # Returning user data
+            if fields:
+                # column-only Row tuples instead of hydrated User entities
+                query = db.query(*select_columns(User, fields))
+            else:
+                query = db.query(User)
+            query = query.filter(User.is_deleted == 0)
+            if limit:
+                # one keyset page ordered by id
+                query = keyset(query, User, limit, after_id)
+            return query.all()  # Returning user data
         except Exception as e:
             return JSONResponse(
                 content={"success": False, "error": "Database Connection Error."},
                 status_code=400,
             )
 
+    @staticmethod
+    def exportQuery():
+        """Column-only select for the streaming user export, ordered by id."""
+        return (
+            select(*select_columns(User, user_databaseConnection.LIST_FIELDS))
+            .where(User.is_deleted == 0)
+            .order_by(User.id)
+        )
+
+    @staticmethod
+    def get_by_id(user_id, db: Session, fields: dict = None):
+        """Single active user by primary key, or None."""
+        query = db.query(*select_columns(User, fields)) if fields else db.query(User)
+        return query.filter(User.id == user_id, User.is_deleted == 0).first()
+
+    @staticmethod
+    def get_by_email(email, db: Session):
+        """Single active user by email (unique index), or None."""
+        return (
+            db.query(User).filter(User.email == email, User.is_deleted == 0).first()
+        )
+
+    @staticmethod
+    def exists_ids(ids, db: Session):
+        """Subset of `ids` that belong to active users."""
+        if not ids:
+            return set()
+        rows = (
+            db.query(User.id)
+            .filter(User.id.in_(set(ids)), User.is_deleted == 0)
+            .all()
+        )
+        return {row.id for row in rows}
+
+    @staticmethod
+    def existing_emails(emails, db: Session):
+        """Subset of `emails` already taken, deleted users included (unique column)."""
+        if not emails:
+            return set()
+        return set(db.scalars(select(User.email).where(User.email.in_(set(emails)))))
+
+    @staticmethod
+    def bulkInsertUsers(rows, db: Session):
+        """
+        Multi-row INSERT ... ON CONFLICT (email) DO NOTHING for a batch of
+        user dicts. Returns the emails that were inserted; the caller commits.
+        """
+        if not rows:
+            return set()
+        stmt = (
+            dialect_insert(User, db)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["email"])
+            .returning(User.email)
+        )
+        return set(db.scalars(stmt))
+
     @staticmethod
     def updateUser(id, updateUser, dataList, db: Session):
         try:
@@ -88,6 +173,7 @@ class user_databaseConnection:
         try:
             result = db.query(User).filter(User.id == id).update({"is_deleted": 1})
             db.commit()
+            invalidate_permissions()
             if result == 0:
                 return False  # No user found to delete
             return True
@@ -106,14 +192,20 @@ class user_databaseConnection:
                 db.query(PasswordResetToken).filter(
                     PasswordResetToken.user_id == dataList[0]
                 ).update(
-                    {"token": dataList[1], "expires_at": dataList[2], "used": False}
+                    {
+                        "selector": dataList[1],
+                        "token": dataList[2],
+                        "expires_at": dataList[3],
+                        "used": False,
+                    }
                 )
                 db.commit()
             else:
                 newResetToken = PasswordResetToken(
                     user_id=dataList[0],
-                    token=dataList[1],
-                    expires_at=dataList[2],
+                    selector=dataList[1],
+                    token=dataList[2],
+                    expires_at=dataList[3],
                 )
                 db.add(newResetToken)
                 db.commit()
@@ -3,8 +3,23 @@ import os
 env = os.getenv("FASTAPI_ENV", "development")
 
 if env == "testing":
-    from config.v1.config_test import getDBConnection
+    from config.v1.config_test import (
+        SessionLocal,
+        async_engine,
+        getAsyncDBConnection,
+        getDBConnection,
+    )
 elif env == "production":
-    from config.v1.config_prod import getDBConnection
+    from config.v1.config_prod import (
+        SessionLocal,
+        async_engine,
+        getAsyncDBConnection,
+        getDBConnection,
+    )
 else:
-    from config.v1.config_dev import getDBConnection
+    from config.v1.config_dev import (
+        SessionLocal,
+        async_engine,
+        getAsyncDBConnection,
+        getDBConnection,
+    )
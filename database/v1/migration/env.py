@@ -8,6 +8,7 @@ from model.v1 import (
     role_model,
     permission_model,
     user_session_model,
+    seed_state_model,
 )
 
 import os
@@ -0,0 +1,54 @@
+"""add hot path partial indexes
+
+Revision ID: 43bc036dab9e
+Revises: d388bf0b079c
+Create Date: 2026-10-18 14:05:12.902117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '43bc036dab9e'
+down_revision: Union[str, Sequence[str], None] = 'd388bf0b079c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, table, columns, partial predicate)
+INDEXES = [
+    ('ix_users_active_id', 'users', ['id'], 'is_deleted = 0'),
+    ('ix_password_reset_tokens_user_id', 'password_reset_tokens', ['user_id'], None),
+    ('ix_password_reset_tokens_unused_expires_at', 'password_reset_tokens', ['expires_at'], 'used = false'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction; the tables stay writable
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where else None,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,32 @@
+"""add selector to password reset tokens
+
+Revision ID: d388bf0b079c
+Revises: e2d614145e53
+Create Date: 2026-10-18 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd388bf0b079c'
+down_revision: Union[str, Sequence[str], None] = 'e2d614145e53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('password_reset_tokens', sa.Column('selector', sa.String(length=32), nullable=True))
+    op.create_index(op.f('ix_password_reset_tokens_selector'), 'password_reset_tokens', ['selector'], unique=True)
+    # bcrypt-hashed tokens issued before this revision cannot be verified any more
+    op.execute("UPDATE password_reset_tokens SET used = true WHERE selector IS NULL")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_password_reset_tokens_selector'), table_name='password_reset_tokens')
+    op.drop_column('password_reset_tokens', 'selector')
@@ -0,0 +1,154 @@
+"""
+Set-based sync of permission YAML into role_permission / user_permission.
+
+The YAML maps owner -> module -> [permission names]. A sync resolves
+every name with one IN query per master table, loads the owner table's
+grants once, diffs desired against actual in memory and applies the
+difference as batched upserts and soft-deletes in a single transaction.
+A sha256 of the YAML content is stored in seed_state, so a deploy with
+an unchanged file does one SELECT and nothing else.
+"""
+
+import hashlib
+import json
+
+from sqlalchemy import func, select, tuple_, update
+from sqlalchemy.orm import Session
+
+from config.v1.config import Config
+from dao.v1.perm_dao import _grant_upsert
+from helpers.v1.bulk import dialect_insert
+from model.v1.module_model import Module
+from model.v1.permission_model import Permission
+from model.v1.seed_state_model import SeedState
+
+
+def content_hash(yaml_data) -> str:
+    """sha256 of the parsed YAML, independent of key order and formatting."""
+    canonical = json.dumps(yaml_data or {}, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _batched(items, size):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _resolve(db: Session, column, names):
+    """name -> id for one master table, in one query."""
+    if not names:
+        return {}
+    model = column.class_
+    return dict(db.execute(select(column, model.id).where(column.in_(names))).all())
+
+
+def _save_hash(db: Session, name, digest):
+    stmt = dialect_insert(SeedState, db).values(name=name, content_hash=digest)
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["name"],
+            set_={"content_hash": digest, "applied_at": func.now()},
+        )
+    )
+
+
+def sync_grants(
+    yaml_data,
+    db: Session,
+    *,
+    name: str,
+    owner_column,
+    model,
+    owner_field: str,
+    force: bool = False,
+    batch_size: int = None,
+) -> dict:
+    """
+    Make `model`'s active grants match `yaml_data` exactly.
+
+    owner_column is the natural key the YAML uses for owners
+    (Role.role_name, User.email); owner_field is the matching FK column
+    on `model`. Returns counts of inserted, restored and deleted grants,
+    or {"skipped": True} when the content hash is unchanged. The hash is
+    only recorded when every name resolved, so a file that references a
+    role or user created later is retried on the next run.
+    """
+    yaml_data = yaml_data or {}
+    batch_size = batch_size or Config.SEED_SYNC_BATCH_SIZE
+    digest = content_hash(yaml_data)
+
+    if not force:
+        stored = db.scalar(
+            select(SeedState.content_hash).where(SeedState.name == name)
+        )
+        if stored == digest:
+            return {"skipped": True}
+
+    # Step 1: resolve names, one query per master table
+    module_names = {m for modules in yaml_data.values() for m in (modules or {})}
+    permission_names = {
+        p
+        for modules in yaml_data.values()
+        for actions in (modules or {}).values()
+        for p in (actions or [])
+    }
+    owners = _resolve(db, owner_column, set(yaml_data))
+    modules = _resolve(db, Module.module_name, module_names)
+    permissions = _resolve(db, Permission.permission_name, permission_names)
+
+    owner_kind = owner_column.class_.__name__
+    missing = (
+        [(owner_kind, n) for n in sorted(set(yaml_data) - set(owners))]
+        + [("Module", n) for n in sorted(module_names - set(modules))]
+        + [("Permission", n) for n in sorted(permission_names - set(permissions))]
+    )
+    for kind, missing_name in missing:
+        print(f"{kind} not found: {missing_name}")
+
+    desired = {
+        (owners[owner], modules[module], permissions[action])
+        for owner, owner_modules in yaml_data.items()
+        if owner in owners
+        for module, actions in (owner_modules or {}).items()
+        if module in modules
+        for action in (actions or [])
+        if action in permissions
+    }
+
+    # Step 2: diff against what is stored
+    owner_col = getattr(model, owner_field)
+    key = tuple_(owner_col, model.module_id, model.permission_id)
+    active, deleted = set(), set()
+    for owner_id, module_id, permission_id, is_deleted in db.execute(
+        select(owner_col, model.module_id, model.permission_id, model.is_deleted)
+    ):
+        (deleted if is_deleted else active).add((owner_id, module_id, permission_id))
+
+    to_grant = sorted(desired - active)
+    to_revoke = sorted(active - desired)
+
+    # Step 3: apply, one transaction
+    try:
+        for batch in _batched(to_grant, batch_size):
+            db.execute(_grant_upsert(model, owner_field, batch, None, db))
+        for batch in _batched(to_revoke, batch_size):
+            db.execute(
+                update(model)
+                .where(key.in_(batch), model.is_deleted == 0)
+                .values(is_deleted=1, modified_at=func.now())
+            )
+        if not missing:
+            _save_hash(db, name, digest)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    restored = sum(1 for triple in to_grant if triple in deleted)
+    return {
+        "skipped": False,
+        "inserted": len(to_grant) - restored,
+        "restored": restored,
+        "deleted": len(to_revoke),
+        "unresolved": len(missing),
+    }
@@ -1,4 +1,7 @@
-from sqlalchemy.exc import IntegrityError
+from collections import defaultdict
+
+from sqlalchemy import inspect
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session
 from database.v1.connection import getDBConnection
 from datetime import datetime
@@ -16,22 +19,80 @@ import sys
 import os
 from datetime import datetime
 
+from config.v1.config import Config
+from helpers.v1.bulk import dialect_insert
 from utils.v1.auth_utils import hash_password
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
 
 
-def safe_add_all(db: Session, records: list):
+def _insert_rows(db: Session, model, rows: list) -> int:
+    """INSERT ... ON CONFLICT DO NOTHING; returns how many rows were new."""
+    stmt = (
+        dialect_insert(model, db)
+        .values(rows)
+        .on_conflict_do_nothing()
+        .returning(*inspect(model).primary_key)
+    )
+    return len(db.execute(stmt).all())
+
+
+def safe_add_all(db: Session, records: list, batch_size: int = None) -> dict:
+    """
+    Idempotent bulk load of ORM instances: one multi-row INSERT ... ON
+    CONFLICT DO NOTHING per chunk, all in one transaction. Rows that hit
+    an existing key are counted as skipped. A chunk that fails for any
+    other reason is retried row by row inside savepoints so only the bad
+    rows are reported and left out.
+    """
+    batch_size = batch_size or Config.SEED_SYNC_BATCH_SIZE
+
+    # (model, columns set) -> rows; a multi-row VALUES needs the same columns
+    groups = defaultdict(list)
     for record in records:
-        try:
-            db.add(record)
-            db.flush()  # Flush one by one
-            print(f"✅ Seeding done for {record}")
-        except IntegrityError as e:
-            db.rollback()
-            print(f"⚠️ Skipping duplicate or error for record: {record} — {e.orig}")
-        else:
-            db.commit()
+        state = inspect(record)
+        row = {
+            attr.key: state.dict[attr.key]
+            for attr in state.mapper.column_attrs
+            if attr.key in state.dict
+        }
+        groups[(state.class_, frozenset(row))].append(row)
+
+    counts = {"inserted": 0, "skipped": 0, "failed": 0}
+    try:
+        for (model, _), rows in groups.items():
+            for start in range(0, len(rows), batch_size):
+                chunk = rows[start : start + batch_size]
+                failed = 0
+                try:
+                    with db.begin_nested():
+                        inserted = _insert_rows(db, model, chunk)
+                except SQLAlchemyError:
+                    inserted = 0
+                    for row in chunk:
+                        try:
+                            with db.begin_nested():
+                                inserted += _insert_rows(db, model, [row])
+                        except SQLAlchemyError as e:
+                            failed += 1
+                            print(
+                                f"❌ Failed to seed {model.__name__} {row}: "
+                                f"{getattr(e, 'orig', e)}"
+                            )
+                counts["inserted"] += inserted
+                counts["failed"] += failed
+                counts["skipped"] += len(chunk) - inserted - failed
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    names = ", ".join(sorted({model.__name__ for model, _ in groups}))
+    print(
+        f"✅ Seeding done for {names}: {counts['inserted']} inserted, "
+        f"{counts['skipped']} skipped, {counts['failed']} failed"
+    )
+    return counts
 
 
 # Seeder functions for all tables
@@ -167,7 +228,7 @@ def seed_permissions(db):
 #     safe_add_all(db, data)
 
 
-def run_all_seeders():
+def run_all_seeders(force: bool = False):
     db_generator = getDBConnection()
     db = next(db_generator)
     try:
@@ -176,8 +237,9 @@ def run_all_seeders():
         seed_users(db)
         seed_modules(db)
         seed_permissions(db)
-        seed_role_permissions(role_yaml_data, db)
-        seed_user_permissions(user_yaml_data, db)
+        # YAML syncs are skipped when the file hash is unchanged, unless forced
+        seed_role_permissions(role_yaml_data, db, force=force)
+        seed_user_permissions(user_yaml_data, db, force=force)
         db.commit()
         print("✅ All seeders executed successfully.")
     except IntegrityError as e:
@@ -190,4 +252,4 @@ if __name__ == "__main__":
     user_yaml_data = load_yaml_user_permissions(
         "database/v1/seeders/user_permissions.yaml"
     )
-    run_all_seeders()
+    run_all_seeders(force="--force" in sys.argv)
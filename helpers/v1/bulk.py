@@ -0,0 +1,11 @@
+from sqlalchemy.dialects import postgresql, sqlite
+
+
+def dialect_insert(model, db):
+    """
+    INSERT construct with on_conflict_do_nothing/do_update for the
+    session's backend (PostgreSQL in the app, SQLite in tests/benchmarks).
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        return sqlite.insert(model)
+    return postgresql.insert(model)
@@ -0,0 +1,69 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+
+from fastapi.responses import StreamingResponse
+
+from config.v1.config import Config
+from database.v1.connection import SessionLocal
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def _csv_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=_json_default)
+    return value
+
+
+def stream_rows(statement, fmt: str, batch_size: int = None, session_factory=None):
+    """
+    Yield `statement`'s rows as NDJSON lines or CSV, one chunk per batch.
+
+    Runs on its own session with a server-side cursor (yield_per), so only
+    one batch is held in memory at a time. The session is opened when the
+    response starts streaming and closed once it finishes or the client
+    goes away.
+    """
+    batch_size = batch_size or Config.EXPORT_BATCH_SIZE
+    db = (session_factory or SessionLocal)()
+    try:
+        result = db.execute(statement.execution_options(yield_per=batch_size))
+        columns = list(result.keys())
+
+        if fmt == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(columns)
+            yield buffer.getvalue()
+
+        for batch in result.partitions():
+            if fmt == "csv":
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                writer.writerows([_csv_value(v) for v in row] for row in batch)
+                yield buffer.getvalue()
+            else:
+                yield "".join(
+                    json.dumps(dict(row._mapping), default=_json_default) + "\n"
+                    for row in batch
+                )
+    finally:
+        db.close()
+
+
+def export_response(statement, fmt: str, filename: str) -> StreamingResponse:
+    return StreamingResponse(
+        stream_rows(statement, fmt),
+        media_type=EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'},
+    )
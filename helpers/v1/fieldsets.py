@@ -0,0 +1,49 @@
+from datetime import date, datetime
+
+from fastapi import Query
+
+from core.v1.exceptions import AppException
+
+
+class FieldParams:
+    """`fields=` query parameter (comma separated) shared by the list endpoints."""
+
+    def __init__(
+        self,
+        fields: str = Query(None, description="Comma separated, e.g. id,email"),
+    ):
+        self.names = (
+            [name.strip() for name in fields.split(",") if name.strip()]
+            if fields
+            else None
+        )
+
+
+def resolve_fields(available: dict, names=None) -> dict:
+    """
+    Narrow a resource's {response key: column} map to the requested keys,
+    in request order. No names means every field.
+    """
+    if not names:
+        return dict(available)
+    unknown = [name for name in names if name not in available]
+    if unknown:
+        raise AppException(f"Unknown field(s): {', '.join(unknown)}.", 400)
+    return {name: available[name] for name in dict.fromkeys(names)}
+
+
+def select_columns(model, fields: dict) -> list:
+    """Labelled columns for a column-only query; id is always selected for cursors."""
+    columns = [column.label(name) for name, column in fields.items()]
+    if "id" not in fields:
+        columns.insert(0, model.id)
+    return columns
+
+
+def row_to_dict(row, fields) -> dict:
+    """Serialise one Row (or entity) to the requested response keys."""
+    data = {}
+    for name in fields:
+        value = getattr(row, name)
+        data[name] = value.isoformat() if isinstance(value, (datetime, date)) else value
+    return data
@@ -0,0 +1,62 @@
+import base64
+import json
+
+from fastapi import Query
+
+from config.v1.config import Config
+from core.v1.exceptions import AppException
+
+
+class PageParams:
+    """One requested keyset page of a list endpoint."""
+
+    def __init__(self, limit: int, cursor: str = None):
+        self.limit = limit
+        self.cursor = cursor
+        self.after_id = decode_cursor(cursor)
+
+
+def page_params(
+    limit: int = Query(None, ge=1, le=Config.PAGE_SIZE_MAX),
+    cursor: str = Query(None),
+):
+    """
+    limit / cursor query parameters shared by the list endpoints. Paging is
+    opt-in: without either parameter the endpoint returns the full list, a
+    cursor alone continues with PAGE_SIZE_DEFAULT rows per page.
+    """
+    if limit is None and not cursor:
+        return None
+    return PageParams(limit or Config.PAGE_SIZE_DEFAULT, cursor)
+
+
+def encode_cursor(last_id: int) -> str:
+    raw = json.dumps({"id": last_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    """Opaque cursor -> id of the last row already returned (None = first page)."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return int(json.loads(base64.urlsafe_b64decode(padded))["id"])
+    except (ValueError, KeyError, TypeError):
+        raise AppException("Invalid cursor.", 400)
+
+
+def keyset(query, model, limit, after_id=None):
+    """Order by id and fetch one row past the page to know if more exist."""
+    if after_id is not None:
+        query = query.filter(model.id > after_id)
+    return query.order_by(model.id).limit(limit + 1)
+
+
+def page_result(rows, limit):
+    """Split a keyset() result into (page rows, next_cursor)."""
+    rows = list(rows)
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, encode_cursor(rows[-1].id)
+    return rows, None
@@ -1,40 +1,92 @@
-from dao.v1.module_dao import Module_DBConn
-from dao.v1.user_dao import user_databaseConnection
-from dao.v1.perm_dao import Permissions_DBConn
 from fastapi.responses import JSONResponse
-from dao.v1.role_dao import Role_DBConn
+from sqlalchemy import literal, select, union_all
+from model.v1.module_model import Module
+from model.v1.permission_model import Permission
+from model.v1.role_model import Role
+from model.v1.user_model import User
 
+OWNER_MODELS = {"role": Role, "user": User}
 
-async def verifyModuleRolendPermID(role_id, module_id, permission_id, db):
-    # Fetch existing Role IDs from the database
-    data = [i.id for i in Role_DBConn.getRoleData(db)]
-    if role_id not in data:
-        return JSONResponse(
-            content={
-                "status": False,
-                "message": "Role ID not available",
-            },
-            status_code=400,
-        )
 
-    # Fetch existing Module IDs from the database
-    data = [i.id for i in Module_DBConn.getModuleData(db)]
-    if module_id not in data:
-        return JSONResponse(
-            content={
-                "status": False,
-                "message": "Module ID not available",
-            },
-            status_code=400,
+def _as_id(value):
+    """value when it is an integer id, else None ("1", " 7 ", 1.5, True)."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    return None
+
+
+def existing_ids(owner, owner_ids, module_ids, permission_ids, db):
+    """
+    Which of the given ids exist and are not deleted, in one round-trip.
+    owner is "role" or "user". Returns {owner: set, "module": set,
+    "permission": set} of integer ids; values that are not integers are
+    left out of the query and never found.
+    """
+    found = {owner: set(), "module": set(), "permission": set()}
+    lookups = [
+        (owner, OWNER_MODELS[owner], owner_ids),
+        ("module", Module, module_ids),
+        ("permission", Permission, permission_ids),
+    ]
+    lookups = [
+        # a non-integer id would fail the whole statement on Postgres
+        (kind, model, {_as_id(i) for i in ids} - {None})
+        for kind, model, ids in lookups
+    ]
+
+    selects = [
+        select(literal(kind).label("kind"), model.id.label("id")).where(
+            model.id.in_(ids), model.is_deleted == 0
         )
+        for kind, model, ids in lookups
+        if ids
+    ]
+    if not selects:
+        return found
+
+    for row in db.execute(union_all(*selects)):
+        found[row.kind].add(row.id)
+    return found
+
+
+def validate_permission_triples(owner, triples, db):
+    """
+    Validate many (owner_id, module_id, permission_id) triples with a
+    single query. Returns a list of (triple, message) for the invalid
+    ones, checking owner, then module, then permission like the single
+    verifiers do.
+    """
+    triples = list(triples)
+    found = existing_ids(
+        owner,
+        [t[0] for t in triples],
+        [t[1] for t in triples],
+        [t[2] for t in triples],
+        db,
+    )
 
-    # Fetch existing Permission IDs from the database
-    data = [i.id for i in Permissions_DBConn.getPermissionData(db)]
-    if permission_id not in data:
+    errors = []
+    for triple in triples:
+        owner_id, module_id, permission_id = (_as_id(i) for i in triple)
+        if owner_id not in found[owner]:
+            errors.append((triple, f"{owner.capitalize()} ID not available"))
+        elif module_id not in found["module"]:
+            errors.append((triple, "Module ID not available"))
+        elif permission_id not in found["permission"]:
+            errors.append((triple, "Permission ID not available"))
+    return errors
+
+
+async def verifyModuleRolendPermID(role_id, module_id, permission_id, db):
+    # Role, module and permission ids checked in one query
+    errors = validate_permission_triples(
+        "role", [(role_id, module_id, permission_id)], db
+    )
+    if errors:
         return JSONResponse(
             content={
                 "status": False,
-                "message": "Permission ID not available",
+                "message": errors[0][1],
             },
             status_code=400,
         )
@@ -49,35 +101,15 @@ async def verifyModuleRolendPermID(role_id, module_id, permission_id, db):
 
 
 async def verifyModuleUserndPermID(user_id, module_id, permission_id, db):
-    # Fetch existing User IDs from the database
-    data = [i.id for i in user_databaseConnection.getUserTable(db)]
-    if user_id not in data:
-        return JSONResponse(
-            content={
-                "status": False,
-                "message": "User ID not available",
-            },
-            status_code=400,
-        )
-
-    # Fetch existing Module IDs from the database
-    data = [i.id for i in Module_DBConn.getModuleData(db)]
-    if module_id not in data:
-        return JSONResponse(
-            content={
-                "status": False,
-                "message": "Module ID not available",
-            },
-            status_code=400,
-        )
-
-    # Fetch existing Permission IDs from the database
-    data = [i.id for i in Permissions_DBConn.getPermissionData(db)]
-    if permission_id not in data:
+    # User, module and permission ids checked in one query
+    errors = validate_permission_triples(
+        "user", [(user_id, module_id, permission_id)], db
+    )
+    if errors:
         return JSONResponse(
             content={
                 "status": False,
-                "message": "Permission ID not available",
+                "message": errors[0][1],
             },
             status_code=400,
         )
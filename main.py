@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse
 from config.v1.env_loader import load_environment
@@ -5,7 +6,29 @@ from config.v1.env_loader import load_environment
 # --- load env
 load_environment()
 
-app = FastAPI(redoc_url=False)
+from utils.v1.redis_client import close_redis, start_revocation_mirror
+from utils.v1.password_pool import password_pool
+from utils.v1.audit_sink import audit_sink
+from utils.v1.utility import reset_token_key
+from services.v1.user_import_services import shutdown_import_pool
+from config.v1.config import Config
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # refuse to start rather than fail on the first password reset
+    reset_token_key()
+    start_revocation_mirror()
+    await audit_sink.start()
+    yield
+    # drain queued audit records before the engines go away
+    await audit_sink.stop(timeout=Config.AUDIT_DRAIN_TIMEOUT)
+    await close_redis()
+    password_pool.shutdown()
+    shutdown_import_pool()
+
+
+app = FastAPI(redoc_url=False, lifespan=lifespan)
 
 
 from routes.v1.route_register import register_routes
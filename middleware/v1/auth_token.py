@@ -1,85 +1,112 @@
 from fastapi import Depends, HTTPException, Request
-from jose import jwt, JWTError
 from sqlalchemy.orm import Session
-from config.v1.config_dev import getDBConnection
-from model.v1.user_model import User
-from model.v1.role_model import Role
-from model.v1.permission_model import RolePermission, UserPermission
+from sqlalchemy.ext.asyncio import AsyncSession
 from config.v1.config import Config
+from config.v1.config_dev import getAsyncDBConnection, getDBConnection
+from dao.v1.auth_dao import AsyncAuthDAO, AuthDAO
 from utils.v1.redis_client import is_token_blacklisted
+from utils.v1.permission_cache import decision_cache, role_name_cache
+from utils.v1.token_cache import cache_verified_claims, get_verified_claims
+from utils.v1.token_codec import InvalidTokenError, decode_token
 
 
-def token_required(required_role: str = None, required_permission: tuple = None):
+def token_required(
+    required_role: str = None,
+    required_permission: tuple = None,
+    use_async: bool = None,
+):
+    """
+    Route dependency that authenticates the access-token cookie and checks
+    required_role / required_permission.
+
+    The authorization lookup runs on the sync Session by default. Routes
+    opt in to the AsyncSession path with use_async=True, or all routes at
+    once with AUTH_ASYNC_DB; the async engine only opens connections for
+    routes that use it.
+    """
+    if use_async is None:
+        use_async = Config.AUTH_ASYNC_DB
+
+    async def authorization_context(user_id, role_id, module_id, permission_id, db):
+        if use_async:
+            return await AsyncAuthDAO.get_authorization_context(
+                user_id, role_id, module_id, permission_id, db=db
+            )
+        return AuthDAO.get_authorization_context(
+            user_id, role_id, module_id, permission_id, db=db
+        )
+
     async def dependency(request: Request, db: Session = Depends(getDBConnection)):
         # 1️⃣ Read token from cookie
         token = request.cookies.get("access_token")
         if not token:
             raise HTTPException(status_code=401, detail="Token missing")
 
-        # 2️⃣ Decode JWT
+        # 2️⃣ Decode JWT, reusing claims of a token verified earlier
         try:
-            payload = jwt.decode(
-                token, Config.JWT_SECRET_KEY, algorithms=[Config.JWT_ALGORITHM]
-            )
+            payload = get_verified_claims(token)
+            if payload is None:
+                payload = decode_token(token, token_type="access")
+                cache_verified_claims(token, payload)
 
             jti = payload.get("jti")
 
-            if is_token_blacklisted(jti):
+            if await is_token_blacklisted(jti):
                 raise HTTPException(status_code=401, detail="Token has been revoked")
             user_id = payload.get("user_id")
             role_id = payload.get("role_id")
             email = payload.get("email")
             username = payload.get("username")
-        except JWTError:
+        except InvalidTokenError:
             raise HTTPException(status_code=401, detail="Invalid or expired token")
 
-        # 3️⃣ Check user exists
-        user = db.query(User).filter_by(id=user_id, is_deleted=0).first()
-        if not user:
+        # 3️⃣ Normalise required_permission: routes pass either (module_id, permission_id)
+        #    or a single-item list wrapping that pair
+        module_id = permission_id = None
+        if required_permission:
+            if isinstance(required_permission[0], (list, tuple)):
+                module_id, permission_id = required_permission[0]
+            else:
+                module_id, permission_id = required_permission
+
+        # 4️⃣ User, role and permission grants: cached, else one round-trip
+        cache_key = (role_id, user_id, module_id, permission_id)
+        decision = decision_cache.get(cache_key)
+        role_name = role_name_cache.get(role_id)
+
+        if decision is None or role_name is None:
+            context = await authorization_context(
+                user_id, role_id, module_id, permission_id, db
+            )
+            decision = (
+                context is not None,
+                bool(context and (context.role_granted or context.user_granted)),
+            )
+            decision_cache.set(cache_key, decision)
+
+            role_name = context.role_name if context else None
+            if role_name:
+                role_name_cache.set(role_id, role_name)
+
+        user_exists, granted = decision
+        if not user_exists:
             raise HTTPException(status_code=404, detail="User not found")
 
-        # 4️⃣ Role-based check (if required)
-        role_name = (
-            db.query(Role.role_name)
-            .filter_by(id=role_id, is_deleted=0, status=1)
-            .first()[0]
-        )
+        if not role_name:
+            raise HTTPException(status_code=403, detail="Permission denied.")
+
+        # 5️⃣ Role-based check (if required)
         if required_role and role_name.lower() != required_role:
             raise HTTPException(status_code=403, detail="Permission denied.")
 
-        # 5️⃣ Permission-based check (if required)
-        if required_permission:
-            module_id, permission_id = required_permission
-
-            role_perm = (
-                db.query(RolePermission)
-                .filter_by(
-                    role_id=role_id,
-                    module_id=module_id,
-                    permission_id=permission_id,
-                    is_deleted=0,
-                )
-                .first()
+        # 6️⃣ Permission-based check (if required): role grant or user override
+        if required_permission and not granted:
+            raise HTTPException(
+                status_code=403,
+                detail="Permission denied.",
             )
 
-            if not role_perm:
-                user_perm = (
-                    db.query(UserPermission)
-                    .filter_by(
-                        user_id=user_id,
-                        module_id=module_id,
-                        permission_id=permission_id,
-                        is_deleted=0,
-                    )
-                    .first()
-                )
-                if not user_perm:
-                    raise HTTPException(
-                        status_code=403,
-                        detail="Permission denied.",
-                    )
-
-        # 6️⃣ Return lightweight user info
+        # 7️⃣ Return lightweight user info
         return {
             "user_id": user_id,
             "email": email,
@@ -87,4 +114,13 @@ def token_required(required_role: str = None, required_permission: tuple = None)
             "role": role_name,
         }
 
+    if use_async:
+
+        async def async_dependency(
+            request: Request, db: AsyncSession = Depends(getAsyncDBConnection)
+        ):
+            return await dependency(request, db)
+
+        return async_dependency
+
     return dependency
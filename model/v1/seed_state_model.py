@@ -0,0 +1,16 @@
+from sqlalchemy import Column, String, DateTime, func
+from config.v1.config_dev import Base
+
+
+class SeedState(Base):
+    __tablename__ = "seed_state"
+
+    # one row per seeded YAML source, e.g. "role_permissions"
+    name = Column(String(100), primary_key=True)
+    content_hash = Column(String(64), nullable=False)
+    applied_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
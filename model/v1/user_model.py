@@ -1,4 +1,5 @@
 from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, func, Boolean
+from sqlalchemy import Index, text
 from config.v1.config_dev import Base
 from .role_model import Role
 
@@ -37,12 +38,20 @@ class User(Base):
     )
     is_deleted = Column(Integer, default=0, nullable=False)
 
+    __table_args__ = (
+        # keyset pages over live users (WHERE is_deleted = 0 ORDER BY id)
+        Index("ix_users_active_id", "id", postgresql_where=text("is_deleted = 0")),
+    )
+
 
 class PasswordResetToken(Base):
     __tablename__ = "password_reset_tokens"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    # public half of the emailed token, used to look the row up
+    selector = Column(String(32), unique=True, index=True)
+    # HMAC-SHA256 of the secret half (verifier)
     token = Column(String(255), nullable=False)
     expires_at = Column(DateTime, nullable=False)
     used = Column(Boolean, default=False)
@@ -50,3 +59,12 @@ class PasswordResetToken(Base):
     updated_at = Column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
+
+    __table_args__ = (
+        # sweeps of outstanding tokens (used = false AND expires_at < now())
+        Index(
+            "ix_password_reset_tokens_unused_expires_at",
+            "expires_at",
+            postgresql_where=text("used = false"),
+        ),
+    )
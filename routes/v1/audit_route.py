@@ -0,0 +1,15 @@
+from fastapi import APIRouter, Query, Depends
+from middleware.v1.auth_token import token_required
+from controllers.v1.audit_controller import AuditController
+from typing import Optional
+
+router = APIRouter()
+
+
+@router.get("/exportauditlog")
+async def export_audit_log(
+    table_name: Optional[str] = Query(None),
+    fmt: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    current_user: dict = Depends(token_required(required_role="admin")),
+):
+    return await AuditController.exportAuditLog(table_name, fmt)
@@ -17,14 +17,18 @@ from schema.v1.auth_schema import (
     LoginUserBaseModel,
     ResetPassBaseModel,
 )
-import jwt
-from config.v1.config import Config
 from dao.v1.auth_dao import AuthDAO
 from middleware.v1.auth_token import token_required
-from utils.v1.token_generation import create_access_token
+from utils.v1.token_codec import (
+    ExpiredSignatureError,
+    InvalidTokenError,
+    create_access_token,
+    decode_token,
+)
 from utils.v1.auth_utils import verifyResetPassToken
 from utils.v1.audit_logger import log_audit
-from utils.v1.redis_client import blacklist_token
+from utils.v1.redis_client import blacklist_tokens
+from utils.v1.password_pool import password_pool
 
 router = APIRouter()
 
@@ -36,9 +40,7 @@ def refresh_token(request: Request, db: Session = Depends(getDBConnection)):
         raise HTTPException(status_code=401, detail="Refresh token missing")
 
     try:
-        payload = jwt.decode(
-            refresh_token, Config.JWT_SECRET_KEY, algorithms=[Config.JWT_ALGORITHM]
-        )
+        payload = decode_token(refresh_token, token_type="refresh")
         user_id = payload.get("user_id")
         user_details = AuthDAO.get_user_details_dao(user_id=user_id, db=db)
         if not user_details:
@@ -63,8 +65,10 @@ def refresh_token(request: Request, db: Session = Depends(getDBConnection)):
             path="/",
         )
         return response
-    except jwt.ExpiredSignatureError:
+    except ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Refresh token expired")
+    except InvalidTokenError:
+        raise HTTPException(status_code=401, detail="Invalid refresh token")
 
 
 @router.post("/register")
@@ -79,6 +83,16 @@ async def login(data: LoginUserBaseModel, db: Session = Depends(getDBConnection)
     return await AuthController.login_controller(data, db)
 
 
+@router.get("/password-pool-stats")
+async def get_password_pool_stats(
+    user: dict = Depends(token_required(required_role="admin")),
+):
+    return JSONResponse(
+        content={"success": True, "data": password_pool.stats()},
+        status_code=200,
+    )
+
+
 #! delete this
 @router.get("/dummy-route")
 async def dummy_route(
@@ -130,18 +144,16 @@ async def logout(
     if not access_token and not refresh_token:
         raise HTTPException(status_code=400, detail="Tokens Missing.")
 
-    if access_token:
-        blacklist_token(access_token)
-    if refresh_token:
-        blacklist_token(refresh_token)
+    # both tokens go to Redis in one pipelined round-trip
+    await blacklist_tokens(*[t for t in (access_token, refresh_token) if t])
 
     try:
         await log_audit(
             db=db,
             table_name="users",
-            record_id=user.id,
+            record_id=user.get("user_id"),
             action="LOGOUT",
-            user=user.id,
+            user=user.get("user_id"),
             request=request,
             old_data=None,
             new_data=None,
@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 from database.v1.connection import getDBConnection
 from audit_trail.v1.audit_decorater import audit_loggable
 from model.v1.module_model import Module
+from helpers.v1.pagination import PageParams, page_params
 
 router = APIRouter()
 
@@ -28,10 +29,11 @@ async def add_module(
 @router.get("/getmodule")
 async def get_module(
     module_id: int = Query(None),
+    page: PageParams = Depends(page_params),
     current_user: dict = Depends(token_required(required_role="admin")),
     db: Session = Depends(getDBConnection),
 ):
-    return await PermissionModule.getModule(module_id, db)
+    return await PermissionModule.getModule(module_id, db, page)
 
 
 @router.patch("/updatemodule")
@@ -5,6 +5,11 @@ from sqlalchemy.orm import Session
 from database.v1.connection import getDBConnection
 from audit_trail.v1.audit_decorater import audit_loggable
 from model.v1.permission_model import RolePermission, UserPermission, Permission
+from fastapi.responses import JSONResponse
+from utils.v1.permission_cache import cache_stats
+from helpers.v1.pagination import PageParams, page_params
+from helpers.v1.fieldsets import FieldParams
+from schema.v1.perm_schema import BulkRolePermissionRequest, BulkUserPermissionRequest
 
 router = APIRouter()
 
@@ -12,10 +17,19 @@ router = APIRouter()
 @router.get("/getrolepermission")
 async def get_role_permission(
     role_id: int = Query(None),
+    page: PageParams = Depends(page_params),
     current_user: dict = Depends(token_required(required_role="admin")),
     db: Session = Depends(getDBConnection),
 ):
-    return await PermissionModule.getRolePermission(role_id, db)
+    return await PermissionModule.getRolePermission(role_id, db, page)
+
+
+@router.get("/exportrolepermission")
+async def export_role_permission(
+    fmt: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    current_user: dict = Depends(token_required(required_role="admin")),
+):
+    return await PermissionModule.exportRolePermission(fmt)
 
 
 @router.post("/addrolepermission")
@@ -30,7 +44,20 @@ async def add_role_permission(
     db: Session = Depends(getDBConnection),
 ):
     data = await request.json()
-    return await PermissionModule.addRolePermission(data, db)
+    return await PermissionModule.addRolePermission(data, db, current_user)
+
+
+@router.post("/bulkrolepermission")
+async def bulk_add_role_permission(
+    payload: BulkRolePermissionRequest,
+    request: Request,
+    current_user: dict = Depends(token_required(required_role="admin")),
+    db: Session = Depends(getDBConnection),
+):
+    # one batched audit record is written by the controller
+    return await PermissionModule.bulkAddRolePermission(
+        payload, db, current_user, request
+    )
 
 
 @router.patch("/updaterolepermission")
@@ -87,16 +114,38 @@ async def add_user_permission(
     db: Session = Depends(getDBConnection),
 ):
     data = await request.json()
-    return await PermissionModule.addUserPermission(data, db)
+    return await PermissionModule.addUserPermission(data, db, current_user)
 
 
 @router.get("/getuserpermission")
 async def get_user_permission(
     user_id: int = Query(None),
+    page: PageParams = Depends(page_params),
+    current_user: dict = Depends(token_required(required_role="admin")),
+    db: Session = Depends(getDBConnection),
+):
+    return await PermissionModule.getUserPermission(user_id, db, page)
+
+
+@router.get("/exportuserpermission")
+async def export_user_permission(
+    fmt: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    current_user: dict = Depends(token_required(required_role="admin")),
+):
+    return await PermissionModule.exportUserPermission(fmt)
+
+
+@router.post("/bulkuserpermission")
+async def bulk_apply_user_permission(
+    payload: BulkUserPermissionRequest,
+    request: Request,
     current_user: dict = Depends(token_required(required_role="admin")),
     db: Session = Depends(getDBConnection),
 ):
-    return await PermissionModule.getUserPermission(user_id, db)
+    # one batched audit record is written by the controller
+    return await PermissionModule.bulkApplyUserPermission(
+        payload, db, current_user, request
+    )
 
 
 @router.patch("/updateuserpermission")
@@ -149,10 +198,12 @@ async def add_permission(
 @router.get("/getpermission")
 async def get_permission(
     permission_id: int = Query(None),
+    page: PageParams = Depends(page_params),
+    fieldset: FieldParams = Depends(),
     current_user: dict = Depends(token_required(required_role="admin")),
     db: Session = Depends(getDBConnection),
 ):
-    return await PermissionModule.getPermission(permission_id, db)
+    return await PermissionModule.getPermission(permission_id, db, page, fieldset)
 
 
 @router.patch("/updatepermission")
@@ -184,3 +235,13 @@ async def delete_permission(
     db: Session = Depends(getDBConnection),
 ):
     return await PermissionModule.deletePermission(permission_id, db)
+
+
+@router.get("/getcachestats")
+async def get_cache_stats(
+    current_user: dict = Depends(token_required(required_role="admin")),
+):
+    return JSONResponse(
+        content={"success": True, "data": cache_stats()},
+        status_code=200,
+    )
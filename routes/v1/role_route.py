@@ -7,6 +7,8 @@ from database.v1.connection import getDBConnection
 from audit_trail.v1.audit_decorater import audit_loggable
 from model.v1.user_model import Role
 from controllers.v1.role_controller import RoleController
+from helpers.v1.pagination import PageParams, page_params
+from helpers.v1.fieldsets import FieldParams
 
 
 router = APIRouter()
@@ -16,10 +18,12 @@ router = APIRouter()
 @router.get("/getrole")
 async def get_role(
     role_id: int = Query(None),
+    page: PageParams = Depends(page_params),
+    fieldset: FieldParams = Depends(),
     current_user: dict = Depends(token_required(required_permission=[(1, 2)])),
     db: Session = Depends(getDBConnection),
 ):
-    return await RoleController.getRole(role_id, db)
+    return await RoleController.getRole(role_id, db, page, fieldset)
 
 
 # roleBP.route('/addrole', methods=['POST'], endpoint="add_role")(Services.addrole)
@@ -1,4 +1,5 @@
 from . import (
+    audit_route,
     auth_route,
     docs_route,
     module_route,
@@ -11,6 +12,7 @@ from fastapi import FastAPI
 
 def register_routes(app: FastAPI):
     app.include_router(docs_route.router)
+    app.include_router(audit_route.router, prefix="/v1/audit", tags=["Audit"])
     app.include_router(auth_route.router, prefix="/v1/auth", tags=["Auth"])
     app.include_router(module_route.router, prefix="/v1/module", tags=["Module"])
     app.include_router(perm_route.router, prefix="/v1/perm", tags=["Permission"])
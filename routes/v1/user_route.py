@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Query, Request, Depends, Header
+from fastapi import APIRouter, Query, Request, Depends, Header, File, UploadFile
 from middleware.v1.auth_token import token_required
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
@@ -7,6 +7,8 @@ from database.v1.connection import getDBConnection
 from controllers.v1.user_controller import UserController
 from audit_trail.v1.audit_decorater import audit_loggable
 from typing import Optional
+from helpers.v1.pagination import PageParams, page_params
+from helpers.v1.fieldsets import FieldParams
 
 from schema.v1.auth_schema import UpdateUserRequest
 
@@ -17,10 +19,30 @@ router = APIRouter()
 @router.get("/getuser")
 async def get_user(
     id: Optional[int] = Query(None),
+    page: PageParams = Depends(page_params),
+    fieldset: FieldParams = Depends(),
     current_user: dict = Depends(token_required(required_permission=[(2, 2)])),
     db: Session = Depends(getDBConnection),
 ):
-    return await UserController.getAllUser(id, db)
+    return await UserController.getAllUser(id, db, page, fieldset)
+
+
+@router.get("/exportusers")
+async def export_users(
+    fmt: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    current_user: dict = Depends(token_required(required_permission=[(2, 2)])),
+):
+    return await UserController.exportUsers(fmt)
+
+
+@router.post("/importusers")
+async def import_users(
+    file: UploadFile = File(...),
+    fmt: str = Query("csv", alias="format", pattern="^(ndjson|csv)$"),
+    current_user: dict = Depends(token_required(required_role="admin")),
+    db: Session = Depends(getDBConnection),
+):
+    return await UserController.importUsers(file, fmt, db, current_user)
 
 
 @router.patch("/updateuser")
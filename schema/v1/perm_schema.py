@@ -0,0 +1,33 @@
+from pydantic import BaseModel, Field, StrictInt, model_validator
+from typing import List
+
+from config.v1.config import Config
+
+
+class RolePermissionItem(BaseModel):
+    role_id: StrictInt
+    module_id: StrictInt
+    permission_id: StrictInt
+
+
+class BulkRolePermissionRequest(BaseModel):
+    items: List[RolePermissionItem] = Field(
+        ..., min_length=1, max_length=Config.BULK_MAX_ITEMS
+    )
+
+
+class UserPermissionItem(BaseModel):
+    user_id: StrictInt
+    module_id: StrictInt
+    permission_id: StrictInt
+
+
+class BulkUserPermissionRequest(BaseModel):
+    grant: List[UserPermissionItem] = Field([], max_length=Config.BULK_MAX_ITEMS)
+    revoke: List[UserPermissionItem] = Field([], max_length=Config.BULK_MAX_ITEMS)
+
+    @model_validator(mode="after")
+    def check_items(self):
+        if not self.grant and not self.revoke:
+            raise ValueError("grant or revoke must contain at least one item")
+        return self
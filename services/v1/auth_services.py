@@ -1,9 +1,9 @@
 from dao.v1.auth_dao import AuthDAO
 from fastapi.responses import JSONResponse
-from utils.v1.auth_utils import hash_password, verify_password
+from utils.v1.auth_utils import hash_password_async, verify_password_async
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException
-from utils.v1.token_generation import create_access_token, create_refresh_token
+from utils.v1.token_codec import create_access_token, create_refresh_token
 
 
 class AuthServices:
@@ -11,7 +11,7 @@ class AuthServices:
     async def register_serv(data, db):
         try:
             email = data.email
-            password = hash_password(data.password)  # hash password
+            password = await hash_password_async(data.password)  # hash password
             username = data.username
             status = data.status
             role = data.role
@@ -52,7 +52,7 @@ class AuthServices:
             )
 
         # Verify password using bcrypt
-        if not verify_password(password, user_details.password):
+        if not await verify_password_async(password, user_details.password):
             raise HTTPException(status_code=400, detail="Invalid email or password")
 
         # Generate tokens
@@ -1,6 +1,8 @@
 from dao.v1.perm_dao import RolePerm_DBConn, UserPerm_DBConn, Permissions_DBConn
 from dao.v1.user_dao import user_databaseConnection
 from dao.v1.module_dao import Module_DBConn
+from helpers.v1.pagination import page_result
+from helpers.v1.fieldsets import resolve_fields, row_to_dict
 from logging.handlers import RotatingFileHandler
 from fastapi.responses import JSONResponse
 import logging
@@ -96,8 +98,7 @@ class Perm_Serv:
             )
 
         # Validate user_id existence
-        valid_user_ids = {i.id for i in user_databaseConnection.getUserTable(db)}
-        if user_id not in valid_user_ids:
+        if not user_databaseConnection.exists_ids([user_id], db):
             perm_logger.error(f"User ID %s not found {user_id}")
             return JSONResponse(
                 content={"success": False, "message": "User ID not available"},
@@ -175,8 +176,11 @@ class Perm_Serv:
             perm_logger.info("Permission '%s' added successfully.", name)
         return uploadData
 
-    async def getPermission_Serv(permission_id, db):
-        """Retrieve permission details based on permission_id."""
+    async def getPermission_Serv(permission_id, db, page=None, fieldset=None):
+        """Retrieve permission details (the `fieldset` columns) by permission_id."""
+        fields = resolve_fields(
+            Permissions_DBConn.LIST_FIELDS, fieldset.names if fieldset else None
+        )
 
         perm_logger.info(
             "getPermission_Serv called with permission_id: %s", permission_id
@@ -184,21 +188,22 @@ class Perm_Serv:
 
         # If no specific permission_id is given, return all permissions
         if not permission_id:
-            data = [i for i in Permissions_DBConn.getPermissionData(db)]
+            next_cursor = None
+            if page:
+                data = Permissions_DBConn.getPermissionData(
+                    db, limit=page.limit, after_id=page.after_id, fields=fields
+                )
+                data, next_cursor = page_result(data, page.limit)
+            else:
+                data = Permissions_DBConn.getPermissionData(db, fields=fields)
 
             perm_logger.info("Returning all permissions.")
             return JSONResponse(
                 content={
                     "message": "Data fetched successfully.",
                     "success": True,
-                    "data": [
-                        {
-                            "permission_id": i.id,
-                            "name": i.name,
-                            "created_by": i.created_by,
-                        }
-                        for i in data
-                    ],
+                    "data": [row_to_dict(i, fields) for i in data],
+                    "next_cursor": next_cursor,
                 },
                 status_code=200,
             )
@@ -206,7 +211,7 @@ class Perm_Serv:
         # Retrieve specific permission by ID
         data = [
             i
-            for i in Permissions_DBConn.getPermissionData(db)
+            for i in Permissions_DBConn.getPermissionData(db, fields=fields)
             if i.id == int(permission_id)
         ]
 
@@ -227,10 +232,7 @@ class Perm_Serv:
             content={
                 "message": "Data fetched successfully.",
                 "success": True,
-                "data": [
-                    {"permission_id": i.id, "name": i.name, "created_by": i.created_by}
-                    for i in data
-                ],
+                "data": [row_to_dict(i, fields) for i in data],
             },
             status_code=200,
         )
@@ -1,6 +1,8 @@
 from logging.handlers import RotatingFileHandler
 from fastapi.responses import JSONResponse
 from dao.v1.role_dao import Role_DBConn
+from helpers.v1.pagination import page_result
+from helpers.v1.fieldsets import resolve_fields, row_to_dict
 import logging
 
 import os
@@ -34,35 +36,32 @@ perm_logger.addHandler(log_handler)
 
 class Role_Services:
     @staticmethod
-    async def getRole_serv(role_id, db):
-        """Fetches role details based on role_id. Returns all roles if role_id is not provided."""
-
-        def format_role_data(rows):
-            return [
-                {
-                    "id": row.id,
-                    "rolename": row.rolename,
-                    "status": row.status,
-                    "created_by": row.created_by,
-                    "modified_by": row.modified_by,
-                    "created_at": (
-                        row.created_at.isoformat() if row.created_at else None
-                    ),
-                    "modified_at": (
-                        row.modifed_at.isoformat() if row.modifed_at else None
-                    ),
-                }
-                for row in rows
-            ]
+    async def getRole_serv(role_id, db, page=None, fieldset=None):
+        """
+        Fetches role details based on role_id. Returns all roles if role_id
+        is not provided, one keyset page at a time when `page` is given.
+        Only the `fieldset` columns are selected.
+        """
+        fields = resolve_fields(
+            Role_DBConn.LIST_FIELDS, fieldset.names if fieldset else None
+        )
 
         logger.info(
             f"Fetching {'all roles' if not role_id else f'role with ID {role_id}'}"
         )
 
-        roles = Role_DBConn.getRoleData(db)
-        filtered_roles = (
-            roles if not role_id else [role for role in roles if role.id == role_id]
-        )
+        next_cursor = None
+        if role_id:
+            filtered_roles = Role_DBConn.getRoleData(
+                db, fields=fields, role_id=role_id
+            )
+        elif page:
+            roles = Role_DBConn.getRoleData(
+                db, limit=page.limit, after_id=page.after_id, fields=fields
+            )
+            filtered_roles, next_cursor = page_result(roles, page.limit)
+        else:
+            filtered_roles = Role_DBConn.getRoleData(db, fields=fields)
 
         message_text = (
             "Fetched all roles successfully."
@@ -72,7 +71,8 @@ class Role_Services:
 
         response = {
             "message": message_text,
-            "roles": format_role_data(filtered_roles),
+            "roles": [row_to_dict(row, fields) for row in filtered_roles],
+            "next_cursor": next_cursor,
         }
 
         return JSONResponse(content=response, status_code=200)
@@ -0,0 +1,252 @@
+"""
+Bulk user import from CSV or NDJSON.
+
+Rows are read lazily and handled USER_IMPORT_BATCH_SIZE at a time:
+validated, checked for duplicate emails with one query, bcrypt-hashed
+in parallel on a process pool and written with one multi-row INSERT
+and one commit per batch. Bad rows are reported individually and never
+fail the rest of the import.
+
+HTTP imports share one lazily created pool of USER_IMPORT_WORKERS
+processes (import_pool, shut down in the app lifespan), so concurrent
+uploads queue for the same workers instead of forking a pool each. The
+CLI runs its own pool sized by --workers.
+
+    python -m services.v1.user_import_services users.csv
+    python -m services.v1.user_import_services users.ndjson --format ndjson \\
+        --created-by 1 --workers 8
+"""
+
+import argparse
+import csv
+import json
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from config.v1.config import Config
+from dao.v1.user_dao import user_databaseConnection
+from model.v1.role_model import Role
+from model.v1.user_model import StatusMaster
+from schema.v1.auth_schema import RegisterUserBaseModel
+from utils.v1.auth_utils import hash_password
+
+
+def read_import(stream, fmt: str):
+    """Yield one dict per CSV row / NDJSON line of a text stream."""
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+        return
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            # reported as an invalid row instead of aborting the import
+            yield {}
+
+
+_import_pool = None
+_import_pool_lock = threading.Lock()
+
+
+def import_pool() -> ProcessPoolExecutor:
+    """The process pool shared by every HTTP import in this worker."""
+    global _import_pool
+    with _import_pool_lock:
+        if _import_pool is None:
+            _import_pool = ProcessPoolExecutor(max_workers=Config.USER_IMPORT_WORKERS)
+        return _import_pool
+
+
+def shutdown_import_pool():
+    global _import_pool
+    with _import_pool_lock:
+        if _import_pool is not None:
+            _import_pool.shutdown(wait=False, cancel_futures=True)
+            _import_pool = None
+
+
+def _batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class UserImporter:
+    def __init__(
+        self,
+        db: Session,
+        created_by: int = None,
+        batch_size: int = None,
+        workers: int = None,
+        hasher=hash_password,
+        on_progress=None,
+        pool: ProcessPoolExecutor = None,
+    ):
+        self.db = db
+        self.created_by = created_by
+        self.batch_size = batch_size or Config.USER_IMPORT_BATCH_SIZE
+        self.workers = workers or Config.USER_IMPORT_WORKERS
+        self.hasher = hasher
+        self.on_progress = on_progress
+        # a shared pool is borrowed, not shut down; without one run() owns a pool
+        self.pool = pool
+
+        self.total = 0
+        self.imported = 0
+        self.errors = []
+        self._seen = set()
+        self._started = None
+
+    def run(self, records) -> dict:
+        """Import an iterable of row dicts and return the summary."""
+        self._started = time.perf_counter()
+        self._role_ids = set(
+            self.db.scalars(select(Role.id).where(Role.is_deleted == 0))
+        )
+        self._status_ids = set(
+            self.db.scalars(
+                select(StatusMaster.id).where(StatusMaster.is_deleted == 0)
+            )
+        )
+
+        if self.pool is not None:
+            self._run_batches(records, self.pool)
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                self._run_batches(records, pool)
+        return self.summary()
+
+    def _run_batches(self, records, pool):
+        for batch in _batched(enumerate(records, start=1), self.batch_size):
+            self._import_batch(batch, pool)
+            if self.on_progress:
+                self.on_progress(self.summary())
+
+    def summary(self) -> dict:
+        seconds = time.perf_counter() - self._started
+        return {
+            "total": self.total,
+            "imported": self.imported,
+            "failed": len(self.errors),
+            "errors": self.errors,
+            "seconds": round(seconds, 2),
+            "rows_per_second": round(self.total / seconds, 1) if seconds else 0.0,
+        }
+
+    def _fail(self, row, email, message):
+        self.errors.append({"row": row, "email": email, "error": message})
+
+    def _import_batch(self, batch, pool):
+        self.total += len(batch)
+
+        candidates = []
+        for row, record in batch:
+            if not isinstance(record, dict) or not record:
+                self._fail(row, None, "Invalid row.")
+                continue
+            try:
+                user = RegisterUserBaseModel(**record)
+            except ValidationError as e:
+                fields = ", ".join(str(err["loc"][0]) for err in e.errors())
+                self._fail(row, record.get("email"), f"Invalid row: {fields}")
+                continue
+
+            email = user.email.strip()
+            if email in self._seen:
+                self._fail(row, email, "Duplicate email in file.")
+            elif user.role not in self._role_ids:
+                self._fail(row, email, "Role ID not available")
+            elif user.status not in self._status_ids:
+                self._fail(row, email, "Status ID not available")
+            else:
+                self._seen.add(email)
+                candidates.append((row, email, user))
+
+        taken = user_databaseConnection.existing_emails(
+            [email for _, email, _ in candidates], self.db
+        )
+        for row, email, _ in candidates:
+            if email in taken:
+                self._fail(row, email, "User Email Already Exists.")
+        candidates = [c for c in candidates if c[1] not in taken]
+        if not candidates:
+            return
+
+        chunksize = max(1, len(candidates) // (self.workers * 4))
+        hashed = pool.map(
+            self.hasher,
+            [user.password for _, _, user in candidates],
+            chunksize=chunksize,
+        )
+        rows = [
+            {
+                "email": email,
+                "password": password,
+                "user_name": user.username,
+                "role_id": user.role,
+                "status": user.status,
+                "created_by": self.created_by,
+                "is_deleted": 0,
+            }
+            for (_, email, user), password in zip(candidates, hashed)
+        ]
+
+        try:
+            inserted = user_databaseConnection.bulkInsertUsers(rows, self.db)
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            for row, email, _ in candidates:
+                self._fail(row, email, "Database integrity error")
+            return
+
+        self.imported += len(inserted)
+        for row, email, _ in candidates:
+            if email not in inserted:
+                # registered concurrently between the check and the insert
+                self._fail(row, email, "User Email Already Exists.")
+
+
+if __name__ == "__main__":
+    from database.v1.connection import SessionLocal
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=["csv", "ndjson"], default="csv")
+    parser.add_argument("--created-by", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    def report(summary):
+        print(
+            f"{summary['total']} rows, {summary['imported']} imported, "
+            f"{summary['failed']} failed, {summary['rows_per_second']} rows/s"
+        )
+
+    db = SessionLocal()
+    try:
+        with open(args.path, newline="", encoding="utf-8") as stream:
+            summary = UserImporter(
+                db,
+                created_by=args.created_by,
+                batch_size=args.batch_size,
+                workers=args.workers,
+                on_progress=report,
+            ).run(read_import(stream, args.format))
+    finally:
+        db.close()
+
+    for error in summary["errors"]:
+        print(f"row {error['row']} ({error['email']}): {error['error']}")
+    print(f"done in {summary['seconds']}s")
@@ -1,4 +1,6 @@
 from dao.v1.user_dao import user_databaseConnection
+from helpers.v1.pagination import page_result
+from helpers.v1.fieldsets import resolve_fields, row_to_dict
 from logging.handlers import RotatingFileHandler
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
@@ -34,41 +36,40 @@ perm_logger.addHandler(log_handler)
 
 class user_services:
     @staticmethod
-    async def getAlluser_serv(userID, db: Session):
+    async def getAlluser_serv(userID, db: Session, page=None, fieldset=None):
         """
-        Retrieve all users or a specific user by userID.
+        Retrieve all users (one keyset page when `page` is given) or a
+        specific user by userID, limited to the `fieldset` columns.
         """
         logger.info("Fetching user(s) data.")  # Logging the operation
         users = []  # Initializing an empty list to store user data
+        fields = resolve_fields(
+            user_databaseConnection.LIST_FIELDS, fieldset.names if fieldset else None
+        )
 
-        dbData = user_databaseConnection.getUserTable(
-            db
-        )  # Fetching all user data from the database
+        if not userID:
+            dbData = user_databaseConnection.getUserTable(
+                db,
+                limit=page.limit if page else None,
+                after_id=page.after_id if page else None,
+                fields=fields,
+            )  # Fetching one page of user data from the database
 
-        if isinstance(dbData, dict) and dbData.get("success") is False:
-            return JSONResponse(content=dbData, status_code=400)
+            if isinstance(dbData, JSONResponse):
+                return dbData
 
-        if not userID:
-            users = [
-                {
-                    "id": row.id,
-                    "email": row.email,
-                    "username": row.username,
-                    "status": row.status,
-                    "role": row.role,
-                    "created_by": row.created_by,
-                    "modified_by": row.modified_by,
-                    "created_at": row.created_at.isoformat(),
-                    "modified_at": row.modified_at.isoformat(),
-                }
-                for row in dbData
-            ]
+            next_cursor = None
+            if page:
+                dbData, next_cursor = page_result(dbData, page.limit)
+
+            users = [row_to_dict(row, fields) for row in dbData]
             logger.info("Returning all users data.")
             return JSONResponse(
                 content={
                     "success": True,
                     "message": "Users fetched successfully.",
                     "users": users,
+                    "next_cursor": next_cursor,
                 },
                 status_code=200,
             )
@@ -80,21 +81,8 @@ class user_services:
         #     return verification
 
         # Fetch user data for the provided userID
-        data = [row for row in dbData if row.id == userID]
-        users = [
-            {
-                "id": row.id,
-                "email": row.email,
-                "username": row.username,
-                "status": row.status,
-                "role": row.role,
-                "created_by": row.created_by,
-                "modified_by": row.modified_by,
-                "created_at": row.created_at.isoformat(),
-                "modified_at": row.modified_at.isoformat(),
-            }
-            for row in data
-        ]
+        row = user_databaseConnection.get_by_id(userID, db, fields=fields)
+        users = [row_to_dict(row, fields)] if row else []
         logger.info(f"Returning user data for userID: {userID}")
         if users:
             return JSONResponse(
@@ -122,10 +110,7 @@ class user_services:
         logger.info(f"Attempting to update user: {id}")
 
         # Fetch user by ID
-        data = next(
-            (row for row in user_databaseConnection.getUserTable(db) if row.id == id),
-            None,
-        )
+        data = user_databaseConnection.get_by_id(id, db)
         if not data:
             logger.warning(f"No user found with ID: {id}")
             return JSONResponse(
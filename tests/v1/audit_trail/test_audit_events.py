@@ -0,0 +1,168 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import create_engine, event, insert, select, update
+from sqlalchemy.orm import sessionmaker
+
+from audit_trail.v1.audit_decorater import audit_loggable
+from audit_trail.v1.audit_events import AuditContext, audit_scope
+from model.v1.audit_log import AuditLog
+from model.v1.role_model import Role
+
+
+@pytest.fixture
+def sqlite_session():
+    engine = create_engine("sqlite://")
+    for model in (Role, AuditLog):
+        model.__table__.create(engine)
+    db = sessionmaker(bind=engine)()
+    db.add(Role(id=1, role_name="Admin", status=1, is_deleted=0))
+    db.commit()
+    yield db
+    db.close()
+
+
+def _statements(db):
+    statements = []
+    event.listen(
+        db.get_bind(),
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2].split()[0]),
+    )
+    return statements
+
+
+def _context(action):
+    return AuditContext(action, "roles", Role, performed_by="7", path="/v1/role")
+
+
+# * AUDIT EVENTS STARTED
+def test_bulk_update_is_audited_with_old_and_new_values(sqlite_session):
+    # Act
+    with audit_scope(sqlite_session, _context("UPDATE")):
+        sqlite_session.query(Role).filter(Role.id == 1).update({"role_name": "Root"})
+        sqlite_session.commit()
+
+    # Assert
+    entry = sqlite_session.scalars(select(AuditLog)).one()
+    assert entry.record_id == 1
+    assert entry.action == "UPDATE"
+    assert entry.performed_by == "7"
+    assert entry.changed_fields == {"role_name": {"old": "Admin", "new": "Root"}}
+    assert entry.new_data["role_name"] == "Root"
+
+
+def test_timestamp_update_is_stored_as_json(sqlite_session):
+    # Arrange
+    stamp = datetime(2026, 5, 1, 12, 30, tzinfo=timezone.utc)
+
+    # Act
+    with audit_scope(sqlite_session, _context("UPDATE")):
+        sqlite_session.execute(
+            update(Role).where(Role.id == 1).values(modified_at=stamp)
+        )
+        role = sqlite_session.get(Role, 1)
+        role.created_at = stamp
+        sqlite_session.commit()
+
+    # Assert
+    bulk, flushed = sqlite_session.scalars(select(AuditLog).order_by(AuditLog.id))
+    assert bulk.changed_fields["modified_at"]["new"] == stamp.isoformat()
+    assert flushed.new_data["created_at"] == stamp.isoformat()
+
+
+def test_audit_row_shares_the_transaction_of_the_change(sqlite_session):
+    # Act
+    with audit_scope(sqlite_session, _context("DELETE")):
+        sqlite_session.execute(update(Role).where(Role.id == 1).values(is_deleted=1))
+        sqlite_session.rollback()
+
+    # Assert
+    assert sqlite_session.scalars(select(AuditLog)).all() == []
+    assert sqlite_session.get(Role, 1).is_deleted == 0
+
+
+def test_flushed_insert_is_audited_without_a_lookup(sqlite_session):
+    # Arrange
+    statements = _statements(sqlite_session)
+
+    # Act
+    with audit_scope(sqlite_session, _context("CREATE")):
+        sqlite_session.add(Role(role_name="Manager", status=1, is_deleted=0))
+        sqlite_session.commit()
+
+    # Assert
+    assert statements == ["INSERT", "INSERT"]
+    entry = sqlite_session.scalars(select(AuditLog)).one()
+    assert entry.record_id == 2
+    assert entry.new_data["role_name"] == "Manager"
+
+
+def test_insert_returning_rows_are_audited_as_returned(sqlite_session):
+    # Arrange
+    stmt = (
+        insert(Role)
+        .values(role_name="Manager", status=1, is_deleted=0)
+        .returning(Role.id, Role.role_name)
+    )
+
+    # Act
+    with audit_scope(sqlite_session, _context("CREATE")):
+        row = sqlite_session.execute(stmt).first()
+        sqlite_session.commit()
+
+    # Assert: the caller still gets its RETURNING row
+    assert row.id == 2
+    entry = sqlite_session.scalars(select(AuditLog)).one()
+    assert entry.record_id == 2
+    assert entry.new_data == {"id": 2, "role_name": "Manager"}
+
+
+def test_attribute_edit_is_audited_from_history(sqlite_session):
+    # Arrange
+    role = sqlite_session.get(Role, 1)
+
+    # Act
+    with audit_scope(sqlite_session, _context("UPDATE")):
+        role.status = 2
+        sqlite_session.commit()
+
+    # Assert
+    entry = sqlite_session.scalars(select(AuditLog)).one()
+    assert entry.changed_fields == {"status": {"old": 1, "new": 2}}
+
+
+def test_writes_outside_a_scope_are_not_audited(sqlite_session):
+    # Act
+    sqlite_session.query(Role).filter(Role.id == 1).update({"role_name": "Root"})
+    sqlite_session.commit()
+
+    # Assert
+    assert sqlite_session.scalars(select(AuditLog)).all() == []
+
+
+def test_decorator_adds_one_select_and_no_commit(sqlite_session):
+    # Arrange
+    @audit_loggable(action="DELETE", table_name="roles", model_class=Role)
+    async def delete_role(role_id, db, current_user):
+        db.query(Role).filter(Role.id == role_id).update({"is_deleted": 1})
+        db.commit()
+        return True
+
+    statements = _statements(sqlite_session)
+
+    # Act
+    asyncio.run(
+        delete_role(role_id=1, db=sqlite_session, current_user={"user_id": 3})
+    )
+
+    # Assert: pre-image, the update itself, the audit insert
+    assert statements == ["SELECT", "UPDATE", "INSERT"]
+    entry = sqlite_session.scalars(select(AuditLog)).one()
+    assert entry.action == "DELETE"
+    assert entry.performed_by == "3"
+    assert entry.changed_fields == {"is_deleted": {"old": 0, "new": 1}}
+
+
+# * AUDIT EVENTS ENDED
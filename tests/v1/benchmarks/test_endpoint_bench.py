@@ -0,0 +1,41 @@
+from benchmarks.v1.endpoint_bench import plan_role_grants, summarise
+
+
+# * ENDPOINT BENCH STARTED
+def test_summarise_reports_percentiles_and_sql_per_request():
+    # Arrange: 1..100 ms
+    latencies = [i / 1000 for i in range(1, 101)]
+
+    # Act
+    row = summarise(latencies, errors=2, seconds=2.0, statements=300)
+
+    # Assert
+    assert row["requests"] == 100
+    assert row["errors"] == 2
+    assert row["p50_ms"] == 50.5
+    assert row["p95_ms"] == 95.05
+    assert row["p99_ms"] == 99.01
+    assert row["throughput_rps"] == 50.0
+    assert row["statements_per_request"] == 3.0
+
+
+def test_summarise_handles_empty_and_single_runs():
+    assert summarise([], 0, 0.0, 0)["requests"] == 0
+    assert summarise([0.004], 0, 0.004, 2)["p99_ms"] == 4.0
+
+
+def test_plan_role_grants_updates_onto_free_combos_only():
+    # Arrange: (1, 1) live, (1, 2) soft-deleted, the rest have no row
+    combos = [(m, p) for m in (1, 2, 3) for p in (1, 2)]
+    existing = {(1, 1): 0, (1, 2): 1}
+
+    # Act
+    add_combos, targets = plan_role_grants(combos, existing, iterations=10)
+
+    # Assert
+    assert add_combos == [(1, 2), (2, 1)]
+    assert targets == [(2, 2), (3, 1)]
+    assert not set(targets) & (set(add_combos) | set(existing))
+
+
+# * ENDPOINT BENCH ENDED
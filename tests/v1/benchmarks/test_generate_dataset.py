@@ -0,0 +1,59 @@
+from benchmarks.v1.generate_dataset import DatasetGenerator, csv_chunks
+
+COUNTS = {
+    "roles": 3,
+    "modules": 4,
+    "permissions": 2,
+    "users": 50,
+    "user_grants": 120,
+    "audit_rows": 200,
+    "sessions": 30,
+}
+
+
+def _materialise(generator):
+    return {table: list(rows) for table, _, rows in generator.tables()}
+
+
+# * DATASET GENERATOR STARTED
+def test_same_seed_produces_the_same_rows():
+    # Act
+    first = _materialise(DatasetGenerator(COUNTS, seed=3))
+    second = _materialise(DatasetGenerator(COUNTS, seed=3))
+    other = _materialise(DatasetGenerator(COUNTS, seed=4))
+
+    # Assert
+    assert first == second
+    assert first["users"] != other["users"]
+
+
+def test_ids_continue_after_existing_rows_and_grants_are_unique():
+    # Arrange
+    generator = DatasetGenerator(
+        COUNTS, start_ids={"users": 1000, "user_permission": 10}, status_ids=[1, 2]
+    )
+
+    # Act
+    tables = _materialise(generator)
+
+    # Assert
+    assert "status_master" not in tables
+    assert [row[0] for row in tables["users"]][:2] == [1001, 1002]
+    assert len({row[4] for row in tables["users"]}) <= 3
+    grants = [row[1:4] for row in tables["user_permission"]]
+    assert len(grants) == 120 and len(set(grants)) == 120
+    assert tables["user_permission"][0][0] == 11
+    role_grants = [row[1:4] for row in tables["role_permission"]]
+    assert len(set(role_grants)) == len(role_grants)
+
+
+def test_csv_chunks_splits_rows_for_copy():
+    # Act
+    chunks = list(csv_chunks(((i, f"name {i}", None) for i in range(5)), 2))
+
+    # Assert
+    assert len(chunks) == 3
+    assert chunks[0] == '0,name 0,\r\n1,name 1,\r\n'
+
+
+# * DATASET GENERATOR ENDED
@@ -327,13 +327,13 @@ def test_forget_password_missing_email(client):
     assert "Enter your email" in response.text
 
 
-@patch("controllers.v1.auth_controller.user_databaseConnection.getUserTable")
-def test_forget_password_success(mock_getUserTable, client):
+@patch("controllers.v1.auth_controller.user_databaseConnection.get_by_email")
+def test_forget_password_success(mock_get_by_email, client):
     mock_user = MagicMock()
     mock_user.email = "m.veeramvenkatraj@gmail.com"
     mock_user.id = 2
 
-    mock_getUserTable.return_value = [mock_user]
+    mock_get_by_email.return_value = mock_user
     response = client.post(
         "/v1/auth/forgetpassword", json={"email": "m.veeramvenkatraj@gmail.com"}
     )
@@ -350,7 +350,7 @@ def test_forget_password_user_not_found(client):
     assert "Email not registered." in response.text
 
 
-@patch("controllers.v1.auth_controller.user_databaseConnection.getUserTable")
+@patch("controllers.v1.auth_controller.user_databaseConnection.get_by_email")
 def test_forget_password_exception_handling(mock_send_reset_link, client):
     """Test forgetPassword raises unexpected error and returns JSON 400"""
     # Force the service to raise an unexpected exception
@@ -476,7 +476,7 @@ def test_refresh_token_missing_token(client):
     assert response.json()["detail"] == "Refresh token missing"
 
 
-@patch("routes.v1.auth_route.jwt.decode")
+@patch("routes.v1.auth_route.decode_token")
 @patch("routes.v1.auth_route.getDBConnection")
 def test_refresh_token_invalid_token(mock_get_db, mock_jwt_decode, client):
     """Test invalid JWT structure"""
@@ -488,7 +488,7 @@ def test_refresh_token_invalid_token(mock_get_db, mock_jwt_decode, client):
     assert response.json()["detail"] == "Invalid refresh token"
 
 
-@patch("routes.v1.auth_route.jwt.decode")
+@patch("routes.v1.auth_route.decode_token")
 @patch("routes.v1.auth_route.getDBConnection")
 def test_refresh_token_not_found(mock_get_db, mock_jwt_decode, client):
     """Test when refresh token not found in DB"""
@@ -503,7 +503,7 @@ def test_refresh_token_not_found(mock_get_db, mock_jwt_decode, client):
     assert response.json()["detail"] == "Invalid or revoked refresh token"
 
 
-@patch("routes.v1.auth_route.jwt.decode", side_effect=jwt.ExpiredSignatureError)
+@patch("routes.v1.auth_route.decode_token", side_effect=jwt.ExpiredSignatureError)
 def test_refresh_token_expired(mock_jwt_decode, client):
     """Test expired refresh token"""
     response = client.post("/v1/auth/refresh", json={"refresh_token": "expired_token"})
@@ -595,7 +595,7 @@ class FakeUser:
 #     app.dependency_overrides = {}
 
 
-# @patch("routes.v1.auth_route.jwt.decode")
+# @patch("routes.v1.auth_route.decode_token")
 # @patch("routes.v1.auth_route.create_access_token")
 # @patch("routes.v1.auth_route.create_refresh_token")
 # @patch("routes.v1.auth_route.getDBConnection")
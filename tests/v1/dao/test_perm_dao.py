@@ -427,11 +427,13 @@ def test_get_rp_data_success(db_session):
 
     # Act
     result = RolePerm_DBConn.getRPData(db_session)
+    role_2 = RolePerm_DBConn.getRPData(db_session, role_id=2)
 
     # Assert
     assert isinstance(result, list)
     assert any(rp.role_id == 1 for rp in result)
     assert any(rp.role_id == 2 for rp in result)
+    assert role_2 and all(rp.role_id == 2 for rp in role_2)
 
     # Cleanup (optional)
     db_session.query(RolePermission).filter(RolePermission.id.in_(rp_ids)).update(
@@ -509,12 +511,12 @@ def test_add_role_perm_duplicate_entry(db_session):
         # Act
     response = RolePerm_DBConn.addRolePerm(data_list, db_session)
 
-    # Assert
+    # Assert: the upsert leaves an active grant alone
     assert isinstance(response, JSONResponse)
     assert response.status_code == HTTP_400_BAD_REQUEST
     response_data = json.loads(response.body.decode("utf-8"))
     assert response_data["success"] is False
-    assert response_data["error"] == "Duplicate entry"
+    assert response_data["message"] == "Role Permission already exists."
 
     # Cleanup
     db_session.query(RolePermission).filter_by(id=rp.id).delete()
@@ -530,7 +532,7 @@ def test_add_role_permission_generic_integrity_error():
     )
     db.commit.side_effect = integrity_error
 
-    response = RolePerm_DBConn.addRolePerm([1, 2, 3], db="en")
+    response = RolePerm_DBConn.addRolePerm([1, 2, 3], db=db)
 
     assert isinstance(response, JSONResponse)
     assert response.status_code == 400
@@ -540,10 +542,10 @@ def test_add_role_permission_generic_integrity_error():
 def test_add_role_permission_general_exception():
     db = MagicMock()
 
-    # Simulate unexpected error on db.add()
-    db.add.side_effect = Exception("Unexpected crash")
+    # Simulate unexpected error on the upsert
+    db.execute.side_effect = Exception("Unexpected crash")
 
-    response = RolePerm_DBConn.addRolePerm([1, 2, 3], db="en")
+    response = RolePerm_DBConn.addRolePerm([1, 2, 3], db=db)
 
     assert isinstance(response, JSONResponse)
     assert response.status_code == 400
@@ -890,14 +892,11 @@ def test_add_user_perm_duplicate_entry(db_session):
         db_session.add(new_perm)
         db_session.commit()
 
-    # Step 2: Try adding again, which should fail due to unique constraint
+    # Step 2: Try adding again, the upsert leaves the active grant alone
     response = UserPerm_DBConn.addUserPerm(data_list, db_session)
 
     # Assert
-    assert isinstance(response, JSONResponse)
-    assert response.status_code == HTTP_400_BAD_REQUEST
-    response_data = json.loads(response.body.decode("utf-8"))
-    assert "Duplicate entry" in response_data["error"]
+    assert response is False
 
 
 def test_add_user_perm_foreign_key_error(db_session):
@@ -919,7 +918,7 @@ def test_add_user_perm_foreign_key_error(db_session):
 def test_add_user_permission_integrity_error_general():
     db = MagicMock()
     # Simulate general IntegrityError
-    db.add.side_effect = IntegrityError("General integrity error", None, None)
+    db.execute.side_effect = IntegrityError("General integrity error", None, None)
 
     response = UserPerm_DBConn.addUserPerm([1, 2, 3], db)
 
@@ -931,7 +930,7 @@ def test_add_user_permission_integrity_error_general():
 def test_add_user_permission_general_exception():
     db = MagicMock()
     # Simulate unexpected general exception
-    db.add.side_effect = Exception("Unexpected crash")
+    db.execute.side_effect = Exception("Unexpected crash")
 
     response = UserPerm_DBConn.addUserPerm([1, 2, 3], db)
 
@@ -1239,3 +1238,137 @@ def test_delete_up_exception(db_session):
 
 
 # * DELETE UP ENDED
+
+
+# * BULK UPSERT ROLE PERMISSION STARTED
+def _sqlite_session(model, rows):
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    engine = create_engine("sqlite://")
+    model.__table__.create(engine)
+    db = sessionmaker(bind=engine)()
+    db.add_all(rows)
+    db.commit()
+    return db
+
+
+def test_bulk_upsert_role_perm_inserts_and_revives():
+    # Arrange: one active grant, one soft-deleted grant
+    db = _sqlite_session(
+        RolePermission,
+        [
+            RolePermission(role_id=1, module_id=1, permission_id=1, is_deleted=0),
+            RolePermission(role_id=1, module_id=2, permission_id=1, is_deleted=1),
+        ],
+    )
+
+    # Act
+    rows = RolePerm_DBConn.bulkUpsertRolePerm(
+        [(1, 1, 1), (1, 2, 1), (1, 3, 1)], created_by=9, db=db
+    )
+
+    # Assert: the active grant is skipped, the other two are returned
+    assert sorted((r.module_id, r.permission_id) for r in rows) == [(2, 1), (3, 1)]
+    assert db.query(RolePermission).count() == 3
+    assert db.query(RolePermission).filter_by(is_deleted=0).count() == 3
+    revived = db.query(RolePermission).filter_by(module_id=2).one()
+    assert revived.modified_by == 9
+
+
+# * BULK UPSERT ROLE PERMISSION ENDED
+
+
+# * BULK APPLY USER PERMISSION STARTED
+def test_bulk_apply_user_perm_grants_and_revokes_in_one_transaction():
+    # Arrange
+    db = _sqlite_session(
+        UserPermission,
+        [
+            UserPermission(user_id=1, module_id=1, permission_id=1, is_deleted=0),
+            UserPermission(user_id=2, module_id=1, permission_id=1, is_deleted=0),
+            UserPermission(user_id=3, module_id=1, permission_id=1, is_deleted=1),
+        ],
+    )
+
+    # Act
+    granted, revoked = UserPerm_DBConn.bulkApplyUserPerm(
+        grants=[(1, 1, 1), (3, 1, 1), (4, 1, 1)],
+        revokes=[(2, 1, 1), (5, 1, 1)],
+        modified_by=9,
+        db=db,
+    )
+
+    # Assert: existing grant and unknown revoke are no-ops
+    assert sorted(r.user_id for r in granted) == [3, 4]
+    assert [r.user_id for r in revoked] == [2]
+    active = db.query(UserPermission).filter_by(is_deleted=0).all()
+    assert sorted(up.user_id for up in active) == [1, 3, 4]
+
+
+# * BULK APPLY USER PERMISSION ENDED
+
+
+# * ADD PERM UPSERT STARTED
+def test_add_role_perm_revives_soft_deleted_grant():
+    # Arrange
+    db = _sqlite_session(
+        RolePermission,
+        [RolePermission(id=5, role_id=1, module_id=1, permission_id=1, is_deleted=1)],
+    )
+
+    # Act
+    first = RolePerm_DBConn.addRolePerm([1, 1, 1], db)
+    second = RolePerm_DBConn.addRolePerm([1, 1, 1], db)
+
+    # Assert: same row revived in place, then reported as a duplicate
+    assert first.status_code == HTTP_201_CREATED
+    assert json.loads(first.body)["id"] == 5
+    assert second.status_code == HTTP_400_BAD_REQUEST
+    assert db.query(RolePermission).one().is_deleted == 0
+
+
+def test_add_user_perm_inserts_then_reports_duplicate():
+    # Arrange
+    db = _sqlite_session(UserPermission, [])
+
+    # Act / Assert
+    assert UserPerm_DBConn.addUserPerm([1, 1, 1], db) is True
+    assert UserPerm_DBConn.addUserPerm([1, 1, 1], db) is False
+    assert db.query(UserPermission).count() == 1
+
+
+def test_add_role_perm_revive_records_acting_user():
+    # Arrange
+    db = _sqlite_session(
+        RolePermission,
+        [
+            RolePermission(
+                id=5,
+                role_id=1,
+                module_id=1,
+                permission_id=1,
+                modified_by=3,
+                is_deleted=1,
+            ),
+            RolePermission(
+                id=6,
+                role_id=2,
+                module_id=1,
+                permission_id=1,
+                modified_by=3,
+                is_deleted=1,
+            ),
+        ],
+    )
+
+    # Act
+    RolePerm_DBConn.addRolePerm([1, 1, 1], db, created_by=7)
+    RolePerm_DBConn.addRolePerm([2, 1, 1], db)
+
+    # Assert: no acting user leaves the previous modified_by in place
+    assert db.get(RolePermission, 5).modified_by == 7
+    assert db.get(RolePermission, 6).modified_by == 3
+
+
+# * ADD PERM UPSERT ENDED
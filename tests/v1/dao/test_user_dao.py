@@ -225,6 +225,65 @@ def test_get_user_table_exception(db_session: Session, monkeypatch):
 # * GET USER TABLE ENDED
 
 
+# * POINT LOOKUPS STARTED
+def test_get_by_email_and_id(db_session: Session):
+    # Arrange
+    test_user = User(
+        email="lookup@example.com",
+        password="hashed_password",
+        user_name="LookupUser",
+        status=1,
+        created_by=1,
+        is_deleted=0,
+    )
+    db_session.add(test_user)
+    db_session.commit()
+    db_session.refresh(test_user)
+
+    # Act
+    by_email = user_databaseConnection.get_by_email("lookup@example.com", db_session)
+    by_id = user_databaseConnection.get_by_id(test_user.id, db_session)
+    missing = user_databaseConnection.get_by_email("nobody@example.com", db_session)
+
+    # Assert
+    assert by_email.id == test_user.id
+    assert by_id.email == "lookup@example.com"
+    assert missing is None
+
+    # Cleanup
+    db_session.query(User).filter(User.id == test_user.id).delete()
+    db_session.commit()
+
+
+def test_exists_ids_returns_only_active(db_session: Session):
+    # Arrange
+    test_user = User(
+        email="exists@example.com",
+        password="hashed_password",
+        user_name="ExistsUser",
+        status=1,
+        created_by=1,
+        is_deleted=0,
+    )
+    db_session.add(test_user)
+    db_session.commit()
+    db_session.refresh(test_user)
+
+    # Act
+    result = user_databaseConnection.exists_ids([test_user.id, 987654], db_session)
+
+    # Assert
+    assert result == {test_user.id}
+    assert user_databaseConnection.exists_ids([], db_session) == set()
+
+    # Cleanup
+    db_session.query(User).filter(User.id == test_user.id).delete()
+    db_session.commit()
+
+
+# * POINT LOOKUPS ENDED
+
+
 # * UPDATE USER STARTED
 def test_update_user_success(db_session: Session):
     data = db_session.query(User).filter(User.id == 999, User.is_deleted == 0).first()
@@ -0,0 +1,137 @@
+import pytest
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+
+from database.v1.seeders.permission_sync import content_hash, sync_grants
+from model.v1.module_model import Module
+from model.v1.permission_model import Permission, RolePermission
+from model.v1.role_model import Role
+from model.v1.seed_state_model import SeedState
+
+
+@pytest.fixture
+def sqlite_session():
+    engine = create_engine("sqlite://")
+    for model in (Role, Module, Permission, RolePermission, SeedState):
+        model.__table__.create(engine)
+    db = sessionmaker(bind=engine)()
+    db.add_all(
+        [
+            Role(id=1, role_name="Admin", status=1, is_deleted=0),
+            Role(id=2, role_name="Manager", status=1, is_deleted=0),
+            Module(id=1, module_name="Role", is_deleted=0),
+            Module(id=2, module_name="User Management", is_deleted=0),
+            Permission(id=1, permission_name="Create", is_deleted=0),
+            Permission(id=2, permission_name="Read", is_deleted=0),
+            # stale grant, not in the YAML
+            RolePermission(role_id=2, module_id=1, permission_id=1, is_deleted=0),
+            # soft-deleted grant the YAML brings back
+            RolePermission(role_id=1, module_id=2, permission_id=2, is_deleted=1),
+        ]
+    )
+    db.commit()
+    yield db
+    db.close()
+
+
+def _sync(db, yaml_data, **kwargs):
+    return sync_grants(
+        yaml_data,
+        db,
+        name="role_permissions",
+        owner_column=Role.role_name,
+        model=RolePermission,
+        owner_field="role_id",
+        **kwargs,
+    )
+
+
+def _active(db):
+    return set(
+        db.execute(
+            select(
+                RolePermission.role_id,
+                RolePermission.module_id,
+                RolePermission.permission_id,
+            ).where(RolePermission.is_deleted == 0)
+        ).all()
+    )
+
+
+YAML = {
+    "Admin": {"Role": ["Create", "Read"], "User Management": ["Read"]},
+    "Manager": {"Role": ["Read"]},
+}
+
+
+# * PERMISSION YAML SYNC STARTED
+def test_sync_applies_the_diff_and_records_the_hash(sqlite_session):
+    # Act
+    result = _sync(sqlite_session, YAML)
+
+    # Assert
+    assert result == {
+        "skipped": False,
+        "inserted": 3,
+        "restored": 1,
+        "deleted": 1,
+        "unresolved": 0,
+    }
+    assert _active(sqlite_session) == {(1, 1, 1), (1, 1, 2), (1, 2, 2), (2, 1, 2)}
+    assert sqlite_session.scalar(select(SeedState.content_hash)) == content_hash(YAML)
+    # the revived row kept its id instead of a duplicate being inserted
+    assert sqlite_session.query(RolePermission).count() == 5
+
+
+def test_sync_skips_unchanged_yaml(sqlite_session):
+    # Arrange
+    _sync(sqlite_session, YAML)
+    statements = []
+    event.listen(
+        sqlite_session.get_bind(),
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+
+    # Act
+    result = _sync(sqlite_session, YAML)
+
+    # Assert
+    assert result == {"skipped": True}
+    assert len(statements) == 1
+
+
+def test_sync_resolves_names_in_one_query_per_table(sqlite_session):
+    # Arrange
+    statements = []
+    event.listen(
+        sqlite_session.get_bind(),
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+
+    # Act
+    _sync(sqlite_session, YAML)
+
+    # Assert: hash, 3 lookups, grants, 1 upsert, 1 soft-delete, hash write
+    assert len(statements) == 8
+
+
+def test_sync_with_unknown_names_does_not_record_the_hash(sqlite_session, capsys):
+    # Act
+    result = _sync(sqlite_session, {"Ghost": {"Role": ["Read"]}, **YAML})
+
+    # Assert
+    assert result["unresolved"] == 1
+    assert "Role not found: Ghost" in capsys.readouterr().out
+    assert sqlite_session.scalar(select(SeedState.content_hash)) is None
+    assert (1, 1, 1) in _active(sqlite_session)
+
+
+def test_content_hash_ignores_key_order():
+    assert content_hash({"a": {"x": [1]}, "b": {}}) == content_hash(
+        {"b": {}, "a": {"x": [1]}}
+    )
+
+
+# * PERMISSION YAML SYNC ENDED
@@ -0,0 +1,74 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from database.v1.seeders.seeders import safe_add_all
+from model.v1.module_model import Module
+from model.v1.user_model import StatusMaster
+
+
+@pytest.fixture
+def sqlite_session():
+    engine = create_engine("sqlite://")
+    for model in (StatusMaster, Module):
+        model.__table__.create(engine)
+    db = sessionmaker(bind=engine)()
+    db.add(StatusMaster(id=1, status="Active", is_deleted=0))
+    db.commit()
+    yield db
+    db.close()
+
+
+# * SAFE ADD ALL STARTED
+def test_safe_add_all_skips_existing_rows_in_batches(sqlite_session):
+    # Arrange
+    statements = []
+    event.listen(
+        sqlite_session.get_bind(),
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    records = [StatusMaster(id=1, status="Active", is_deleted=0)] + [
+        Module(id=i, module_name=f"Module {i}", is_deleted=0) for i in range(1, 6)
+    ]
+
+    # Act
+    counts = safe_add_all(sqlite_session, records, batch_size=3)
+
+    # Assert
+    assert counts == {"inserted": 5, "skipped": 1, "failed": 0}
+    assert sqlite_session.query(Module).count() == 5
+    # one INSERT for StatusMaster, two chunks for Module
+    assert sum(s.startswith("INSERT") for s in statements) == 3
+
+
+def test_safe_add_all_is_idempotent(sqlite_session):
+    # Arrange
+    records = lambda: [Module(id=1, module_name="Role", is_deleted=0)]
+    safe_add_all(sqlite_session, records())
+
+    # Act
+    counts = safe_add_all(sqlite_session, records())
+
+    # Assert
+    assert counts == {"inserted": 0, "skipped": 1, "failed": 0}
+
+
+def test_safe_add_all_reports_only_genuinely_bad_rows(sqlite_session, capsys):
+    # Arrange: module_name is NOT NULL
+    records = [
+        Module(id=1, module_name="Role", is_deleted=0),
+        Module(id=2, module_name=None, is_deleted=0),
+        Module(id=3, module_name="RAG Model", is_deleted=0),
+    ]
+
+    # Act
+    counts = safe_add_all(sqlite_session, records)
+
+    # Assert
+    assert counts == {"inserted": 2, "skipped": 0, "failed": 1}
+    assert "Failed to seed Module" in capsys.readouterr().out
+    assert sqlite_session.query(Module).count() == 2
+
+
+# * SAFE ADD ALL ENDED
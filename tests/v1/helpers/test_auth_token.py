@@ -5,8 +5,16 @@ from fastapi.responses import JSONResponse
 from fastapi.security import HTTPAuthorizationCredentials
 from unittest.mock import patch, MagicMock
 import json
+import time
 import jwt
 from middleware.v1.auth_token import token_required  # Adjust to your module path
+from utils.v1.permission_cache import invalidate_roles, decision_cache
+from utils.v1.token_cache import (
+    cache_verified_claims,
+    clear_token_cache,
+    evict_jti,
+    get_verified_claims,
+)
 
 
 @pytest.fixture
@@ -26,7 +34,7 @@ def test_token_required_success_admin(mock_db_session, mock_credentials):
     permissions_data = [(None, "admin", None, None)]
 
     with patch("middleware.v1.auth_token.bltFunc", return_value=set()):
-        with patch("middleware.v1.auth_token.jwt.decode", return_value=decoded_token):
+        with patch("middleware.v1.auth_token.decode_token", return_value=decoded_token):
             with patch(
                 "middleware.v1.auth_token.Auth_DatabaseConnection.validateToken",
                 return_value=True,
@@ -61,7 +69,7 @@ def test_token_required_success_non_admin(mock_db_session, mock_credentials):
     required_permission = [("resource", "read")]
 
     with patch("middleware.v1.auth_token.bltFunc", return_value=set()):
-        with patch("middleware.v1.auth_token.jwt.decode", return_value=decoded_token):
+        with patch("middleware.v1.auth_token.decode_token", return_value=decoded_token):
             with patch(
                 "middleware.v1.auth_token.Auth_DatabaseConnection.validateToken",
                 return_value=True,
@@ -131,7 +139,7 @@ def test_token_required_invalid_token_jwt(mock_db_session, mock_credentials):
 
     with patch("middleware.v1.auth_token.bltFunc", return_value=set()):
         with patch(
-            "middleware.v1.auth_token.jwt.decode", side_effect=jwt.InvalidTokenError
+            "middleware.v1.auth_token.decode_token", side_effect=jwt.InvalidTokenError
         ):
             # Act
             verify_token = token_required()
@@ -152,7 +160,7 @@ def test_token_required_expired_token(mock_db_session, mock_credentials):
 
     with patch("middleware.v1.auth_token.bltFunc", return_value=set()):
         with patch(
-            "middleware.v1.auth_token.jwt.decode",
+            "middleware.v1.auth_token.decode_token",
             side_effect=jwt.ExpiredSignatureError,
         ):
             # Act
@@ -174,7 +182,7 @@ def test_token_required_invalid_token_validation(mock_db_session, mock_credentia
     decoded_token = {"email": "test@example.com", "user_id": "user_123"}
 
     with patch("middleware.v1.auth_token.bltFunc", return_value=set()):
-        with patch("middleware.v1.auth_token.jwt.decode", return_value=decoded_token):
+        with patch("middleware.v1.auth_token.decode_token", return_value=decoded_token):
             with patch(
                 "middleware.v1.auth_token.Auth_DatabaseConnection.validateToken",
                 return_value=False,
@@ -199,7 +207,7 @@ def test_token_required_no_user_role(mock_db_session, mock_credentials):
     permissions_data = [(None, None, None, None)]
 
     with patch("middleware.v1.auth_token.bltFunc", return_value=set()):
-        with patch("middleware.v1.auth_token.jwt.decode", return_value=decoded_token):
+        with patch("middleware.v1.auth_token.decode_token", return_value=decoded_token):
             with patch(
                 "middleware.v1.auth_token.Auth_DatabaseConnection.validateToken",
                 return_value=True,
@@ -231,7 +239,7 @@ def test_token_required_unauthorized_role(mock_db_session, mock_credentials):
     required_role = "admin"
 
     with patch("middleware.v1.auth_token.bltFunc", return_value=set()):
-        with patch("middleware.v1.auth_token.jwt.decode", return_value=decoded_token):
+        with patch("middleware.v1.auth_token.decode_token", return_value=decoded_token):
             with patch(
                 "middleware.v1.auth_token.Auth_DatabaseConnection.validateToken",
                 return_value=True,
@@ -265,7 +273,7 @@ def test_token_required_permission_denied(mock_db_session, mock_credentials):
     required_permission = [("resource", "read")]
 
     with patch("middleware.v1.auth_token.bltFunc", return_value=set()):
-        with patch("middleware.v1.auth_token.jwt.decode", return_value=decoded_token):
+        with patch("middleware.v1.auth_token.decode_token", return_value=decoded_token):
             with patch(
                 "middleware.v1.auth_token.Auth_DatabaseConnection.validateToken",
                 return_value=True,
@@ -289,3 +297,228 @@ def test_token_required_permission_denied(mock_db_session, mock_credentials):
                         # Assert
                         assert e.status_code == 403
                         assert e.detail == {"message": "No Access! Permission denied."}
+
+
+# * SINGLE-QUERY AUTHORIZATION STARTED
+@pytest.fixture(autouse=True)
+def clear_permission_cache():
+    invalidate_roles()
+    clear_token_cache()
+    yield
+    invalidate_roles()
+    clear_token_cache()
+
+
+def _cookie_request(token="test_token"):
+    request = MagicMock()
+    request.cookies = {"access_token": token}
+    return request
+
+
+def _auth_context(role_name="Admin", role_granted=False, user_granted=False):
+    context = MagicMock()
+    context.role_name = role_name
+    context.role_granted = role_granted
+    context.user_granted = user_granted
+    return context
+
+
+def test_token_required_single_query_role_grant(mock_db_session):
+    # Arrange
+    decoded_token = {"user_id": 1, "role_id": 1, "email": "a@b.com", "jti": "j1"}
+
+    with patch("middleware.v1.auth_token.decode_token", return_value=decoded_token):
+        with patch(
+            "middleware.v1.auth_token.is_token_blacklisted", return_value=False
+        ):
+            with patch(
+                "middleware.v1.auth_token.AuthDAO.get_authorization_context",
+                return_value=_auth_context(role_granted=True),
+            ) as mock_context:
+                # Act
+                verify_token = token_required(required_permission=[(1, 2)])
+                result = asyncio.run(verify_token(_cookie_request(), mock_db_session))
+
+    # Assert
+    mock_context.assert_called_once_with(1, 1, 1, 2, db=mock_db_session)
+    assert result["role"] == "Admin"
+    assert result["user_id"] == 1
+
+
+def test_token_required_single_query_user_override(mock_db_session):
+    # Arrange
+    decoded_token = {"user_id": 1, "role_id": 3, "jti": "j1"}
+
+    with patch("middleware.v1.auth_token.decode_token", return_value=decoded_token):
+        with patch(
+            "middleware.v1.auth_token.is_token_blacklisted", return_value=False
+        ):
+            with patch(
+                "middleware.v1.auth_token.AuthDAO.get_authorization_context",
+                return_value=_auth_context(role_name="User", user_granted=True),
+            ):
+                # Act
+                verify_token = token_required(required_permission=(1, 2))
+                result = asyncio.run(verify_token(_cookie_request(), mock_db_session))
+
+    # Assert
+    assert result["role"] == "User"
+
+
+def test_token_required_single_query_denied(mock_db_session):
+    # Arrange
+    decoded_token = {"user_id": 1, "role_id": 3, "jti": "j1"}
+
+    with patch("middleware.v1.auth_token.decode_token", return_value=decoded_token):
+        with patch(
+            "middleware.v1.auth_token.is_token_blacklisted", return_value=False
+        ):
+            with patch(
+                "middleware.v1.auth_token.AuthDAO.get_authorization_context",
+                return_value=_auth_context(role_name="User"),
+            ):
+                # Act
+                verify_token = token_required(required_permission=[(1, 2)])
+                with pytest.raises(HTTPException) as exc:
+                    asyncio.run(verify_token(_cookie_request(), mock_db_session))
+
+    # Assert
+    assert exc.value.status_code == 403
+
+
+def test_token_required_single_query_user_missing(mock_db_session):
+    # Arrange
+    decoded_token = {"user_id": 99, "role_id": 1, "jti": "j1"}
+
+    with patch("middleware.v1.auth_token.decode_token", return_value=decoded_token):
+        with patch(
+            "middleware.v1.auth_token.is_token_blacklisted", return_value=False
+        ):
+            with patch(
+                "middleware.v1.auth_token.AuthDAO.get_authorization_context",
+                return_value=None,
+            ):
+                # Act
+                verify_token = token_required(required_role="admin")
+                with pytest.raises(HTTPException) as exc:
+                    asyncio.run(verify_token(_cookie_request(), mock_db_session))
+
+    # Assert
+    assert exc.value.status_code == 404
+
+
+def test_token_required_cached_decision_skips_db(mock_db_session):
+    # Arrange
+    decoded_token = {"user_id": 1, "role_id": 1, "jti": "j1"}
+
+    with patch("middleware.v1.auth_token.decode_token", return_value=decoded_token):
+        with patch(
+            "middleware.v1.auth_token.is_token_blacklisted", return_value=False
+        ):
+            with patch(
+                "middleware.v1.auth_token.AuthDAO.get_authorization_context",
+                return_value=_auth_context(role_granted=True),
+            ) as mock_context:
+                # Act
+                verify_token = token_required(required_permission=[(1, 2)])
+                for _ in range(3):
+                    asyncio.run(verify_token(_cookie_request(), mock_db_session))
+
+    # Assert
+    mock_context.assert_called_once()
+    assert decision_cache.stats()["hits"] >= 2
+
+
+def test_token_required_cache_invalidated_on_grant_change(mock_db_session):
+    # Arrange
+    decoded_token = {"user_id": 1, "role_id": 1, "jti": "j1"}
+    from utils.v1.permission_cache import invalidate_permissions
+
+    with patch("middleware.v1.auth_token.decode_token", return_value=decoded_token):
+        with patch(
+            "middleware.v1.auth_token.is_token_blacklisted", return_value=False
+        ):
+            with patch(
+                "middleware.v1.auth_token.AuthDAO.get_authorization_context",
+                side_effect=[_auth_context(role_granted=True), _auth_context()],
+            ):
+                verify_token = token_required(required_permission=[(1, 2)])
+                asyncio.run(verify_token(_cookie_request(), mock_db_session))
+
+                # Act
+                invalidate_permissions()
+                with pytest.raises(HTTPException) as exc:
+                    asyncio.run(verify_token(_cookie_request(), mock_db_session))
+
+    # Assert
+    assert exc.value.status_code == 403
+
+
+def test_token_required_reuses_verified_claims(mock_db_session):
+    # Arrange
+    decoded_token = {"user_id": 1, "role_id": 1, "jti": "j1", "exp": time.time() + 60}
+
+    with patch(
+        "middleware.v1.auth_token.decode_token", return_value=decoded_token
+    ) as mock_decode:
+        with patch(
+            "middleware.v1.auth_token.is_token_blacklisted", return_value=False
+        ):
+            with patch(
+                "middleware.v1.auth_token.AuthDAO.get_authorization_context",
+                return_value=_auth_context(role_granted=True),
+            ):
+                # Act
+                verify_token = token_required(required_permission=[(1, 2)])
+                for _ in range(3):
+                    asyncio.run(verify_token(_cookie_request(), mock_db_session))
+
+    # Assert
+    mock_decode.assert_called_once()
+
+
+def test_token_required_revoked_jti_evicts_verified_claims(mock_db_session):
+    # Arrange
+    decoded_token = {"user_id": 1, "role_id": 1, "jti": "j1", "exp": time.time() + 60}
+    cache_verified_claims("test_token", decoded_token)
+
+    # Act
+    evict_jti("j1")
+
+    # Assert
+    assert get_verified_claims("test_token") is None
+
+
+def test_token_required_async_opt_in(mock_db_session):
+    # Arrange
+    decoded_token = {"user_id": 1, "role_id": 1, "jti": "j1"}
+
+    async def context(*args, **kwargs):
+        return _auth_context(role_granted=True)
+
+    with patch("middleware.v1.auth_token.decode_token", return_value=decoded_token):
+        with patch(
+            "middleware.v1.auth_token.is_token_blacklisted", return_value=False
+        ):
+            with patch(
+                "middleware.v1.auth_token.AuthDAO.get_authorization_context"
+            ) as mock_sync:
+                with patch(
+                    "middleware.v1.auth_token.AsyncAuthDAO.get_authorization_context",
+                    side_effect=context,
+                ) as mock_async:
+                    # Act
+                    verify_token = token_required(
+                        required_permission=[(1, 2)], use_async=True
+                    )
+                    result = asyncio.run(
+                        verify_token(_cookie_request(), mock_db_session)
+                    )
+
+    # Assert
+    mock_async.assert_called_once_with(1, 1, 1, 2, db=mock_db_session)
+    mock_sync.assert_not_called()
+    assert result["role"] == "Admin"
+
+
+# * SINGLE-QUERY AUTHORIZATION ENDED
@@ -0,0 +1,90 @@
+import csv
+import io
+import json
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from dao.v1.perm_dao import RolePerm_DBConn
+from helpers.v1.export import export_response, stream_rows
+from model.v1.permission_model import RolePermission
+
+
+def _session_factory(rows):
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    RolePermission.__table__.create(engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as db:
+        db.add_all(rows)
+        db.commit()
+    return factory
+
+
+def _role_permissions():
+    return [
+        RolePermission(id=i, role_id=1, module_id=i, permission_id=2, is_deleted=0)
+        for i in range(1, 6)
+    ] + [RolePermission(id=6, role_id=1, module_id=9, permission_id=2, is_deleted=1)]
+
+
+# * STREAMING EXPORT STARTED
+def test_ndjson_export_streams_one_chunk_per_batch():
+    # Arrange
+    factory = _session_factory(_role_permissions())
+
+    # Act
+    chunks = list(
+        stream_rows(
+            RolePerm_DBConn.exportQuery(),
+            "ndjson",
+            batch_size=2,
+            session_factory=factory,
+        )
+    )
+
+    # Assert
+    assert len(chunks) == 3  # 5 live rows in batches of 2
+    rows = [json.loads(line) for chunk in chunks for line in chunk.splitlines()]
+    assert [r["id"] for r in rows] == [1, 2, 3, 4, 5]  # soft-deleted row skipped
+    assert rows[0]["module_id"] == 1
+    assert isinstance(rows[0]["created_at"], str)
+
+
+def test_csv_export_writes_header_once():
+    # Arrange
+    factory = _session_factory(_role_permissions())
+
+    # Act
+    body = "".join(
+        stream_rows(
+            RolePerm_DBConn.exportQuery(),
+            "csv",
+            batch_size=2,
+            session_factory=factory,
+        )
+    )
+
+    # Assert
+    rows = list(csv.reader(io.StringIO(body)))
+    assert rows[0][:4] == ["id", "role_id", "module_id", "permission_id"]
+    assert [r[0] for r in rows[1:]] == ["1", "2", "3", "4", "5"]
+
+
+def test_export_response_sets_media_type_and_filename():
+    # Act
+    response = export_response(RolePerm_DBConn.exportQuery(), "csv", "role_permissions")
+
+    # Assert
+    assert response.media_type == "text/csv"
+    assert (
+        response.headers["content-disposition"]
+        == 'attachment; filename="role_permissions.csv"'
+    )
+
+
+# * STREAMING EXPORT ENDED
@@ -0,0 +1,61 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from core.v1.exceptions import AppException
+from dao.v1.perm_dao import Permissions_DBConn
+from dao.v1.user_dao import user_databaseConnection
+from helpers.v1.fieldsets import resolve_fields, row_to_dict
+from helpers.v1.pagination import page_result
+from model.v1.permission_model import Permission
+
+
+@pytest.fixture
+def sqlite_session():
+    engine = create_engine("sqlite://")
+    Permission.__table__.create(engine)
+    db = sessionmaker(bind=engine)()
+    db.add_all(
+        [
+            Permission(id=i, permission_name=f"perm-{i}", created_by=7, is_deleted=0)
+            for i in range(1, 4)
+        ]
+    )
+    db.commit()
+    yield db
+    db.close()
+
+
+# * SPARSE FIELDSETS STARTED
+def test_resolve_fields_keeps_request_order_and_rejects_unknown():
+    # Act
+    fields = resolve_fields(user_databaseConnection.LIST_FIELDS, ["email", "id"])
+
+    # Assert
+    assert list(fields) == ["email", "id"]
+    assert "password" not in resolve_fields(user_databaseConnection.LIST_FIELDS)
+    with pytest.raises(AppException) as exc:
+        resolve_fields(user_databaseConnection.LIST_FIELDS, ["password"])
+    assert exc.value.status_code == 400
+
+
+def test_dao_returns_rows_with_only_requested_columns(sqlite_session):
+    # Arrange
+    fields = resolve_fields(Permissions_DBConn.LIST_FIELDS, ["name"])
+
+    # Act
+    rows = Permissions_DBConn.getPermissionData(sqlite_session, limit=2, fields=fields)
+    page, next_cursor = page_result(rows, 2)
+
+    # Assert
+    assert not isinstance(rows[0], Permission)  # no entity hydration
+    assert rows[0]._fields == ("id", "name")  # id kept for the cursor
+    assert [row_to_dict(row, fields) for row in page] == [
+        {"name": "perm-1"},
+        {"name": "perm-2"},
+    ]
+    assert next_cursor is not None
+    assert len(sqlite_session.identity_map) == 0
+
+
+# * SPARSE FIELDSETS ENDED
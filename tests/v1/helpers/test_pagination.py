@@ -0,0 +1,80 @@
+import pytest
+from unittest.mock import MagicMock
+
+from core.v1.exceptions import AppException
+from config.v1.config import Config
+from helpers.v1.pagination import (
+    decode_cursor,
+    encode_cursor,
+    page_params,
+    page_result,
+)
+
+
+# * KEYSET PAGINATION STARTED
+def test_cursor_round_trip():
+    # Act
+    cursor = encode_cursor(4242)
+
+    # Assert
+    assert "4242" not in cursor  # opaque to clients
+    assert decode_cursor(cursor) == 4242
+    assert decode_cursor(None) is None
+
+
+def test_invalid_cursor_raises_400():
+    # Act / Assert
+    with pytest.raises(AppException) as exc:
+        decode_cursor("not-a-cursor")
+    assert exc.value.status_code == 400
+
+
+def test_paging_is_opt_in():
+    # Act
+    full_list = page_params(limit=None, cursor=None)
+    first_page = page_params(limit=5, cursor=None)
+    next_page = page_params(limit=None, cursor=encode_cursor(7))
+
+    # Assert
+    assert full_list is None
+    assert (first_page.limit, first_page.after_id) == (5, None)
+    assert (next_page.limit, next_page.after_id) == (Config.PAGE_SIZE_DEFAULT, 7)
+
+
+def test_page_result_sets_next_cursor_only_when_more_rows():
+    # Arrange: keyset() fetches limit + 1 rows
+    rows = [MagicMock(id=i) for i in (3, 5, 8)]
+
+    # Act
+    page, next_cursor = page_result(rows, limit=2)
+    last_page, no_cursor = page_result(rows[:2], limit=2)
+
+    # Assert
+    assert [r.id for r in page] == [3, 5]
+    assert decode_cursor(next_cursor) == 5
+    assert len(last_page) == 2
+    assert no_cursor is None
+
+
+def test_dao_walks_pages_in_id_order(db_session):
+    # Arrange
+    from dao.v1.module_dao import Module_DBConn
+
+    seen, after_id = [], None
+
+    # Act
+    while True:
+        rows = Module_DBConn.getModuleData(db_session, limit=2, after_id=after_id)
+        page, next_cursor = page_result(rows, 2)
+        seen.extend(m.id for m in page)
+        if not next_cursor:
+            break
+        after_id = decode_cursor(next_cursor)
+
+    # Assert
+    assert seen == sorted(seen)
+    assert len(seen) == len(set(seen))
+    assert len(seen) == len(Module_DBConn.getModuleData(db_session))
+
+
+# * KEYSET PAGINATION ENDED
@@ -0,0 +1,94 @@
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+from helpers.v1.permission_helpers import (
+    validate_permission_triples,
+    verifyModuleRolendPermID,
+)
+
+
+def _db_with_rows(rows):
+    db = MagicMock()
+    db.execute.return_value = [MagicMock(kind=kind, id=id) for kind, id in rows]
+    return db
+
+
+# * PERMISSION TRIPLE VALIDATION STARTED
+def test_validate_triples_single_query():
+    # Arrange
+    db = _db_with_rows([("role", 1), ("module", 1), ("permission", 1)])
+
+    # Act
+    errors = validate_permission_triples("role", [(1, 1, 1), (1, 1, 1)], db)
+
+    # Assert
+    assert errors == []
+    db.execute.assert_called_once()
+
+
+def test_validate_triples_reports_first_missing_id():
+    # Arrange
+    db = _db_with_rows([("user", 1), ("module", 1), ("permission", 1)])
+
+    # Act
+    errors = validate_permission_triples("user", [(2, 1, 1), (1, 5, 9), (1, 1, 9)], db)
+
+    # Assert
+    assert errors == [
+        ((2, 1, 1), "User ID not available"),
+        ((1, 5, 9), "Module ID not available"),
+        ((1, 1, 9), "Permission ID not available"),
+    ]
+
+
+def test_verify_role_module_perm_missing_module():
+    # Arrange
+    db = _db_with_rows([("role", 1), ("permission", 3)])
+
+    # Act
+    response = asyncio.run(verifyModuleRolendPermID(1, 2, 3, db))
+
+    # Assert
+    assert response.status_code == 400
+    assert json.loads(response.body)["message"] == "Module ID not available"
+
+
+def test_verify_role_module_perm_non_integer_role_id():
+    # Arrange
+    db = _db_with_rows([("module", 1), ("permission", 1)])
+
+    # Act
+    response = asyncio.run(verifyModuleRolendPermID("invalid", 1, 1, db))
+
+    # Assert
+    assert response.status_code == 400
+    assert json.loads(response.body)["message"] == "Role ID not available"
+    query = db.execute.call_args[0][0]
+    assert "invalid" not in query.compile().params.values()
+
+
+def test_validate_triples_accepts_only_real_ints():
+    # Arrange
+    db = _db_with_rows([("role", 1), ("module", 2), ("permission", 3)])
+    rejected = [("1", 2, 3), (" 1 ", 2, 3), ("1_0", 2, 3), (1.0, 2, 3), (True, 2, 3)]
+
+    # Act
+    errors = validate_permission_triples("role", [(1, 2, 3), *rejected], db)
+
+    # Assert
+    assert errors == [(t, "Role ID not available") for t in rejected]
+
+
+def test_validate_triples_bool_module_id_is_not_module_1():
+    # Arrange
+    db = _db_with_rows([("role", 1), ("module", 1), ("permission", 1)])
+
+    # Act
+    errors = validate_permission_triples("role", [(1, True, 1)], db)
+
+    # Assert
+    assert errors == [((1, True, 1), "Module ID not available")]
+
+
+# * PERMISSION TRIPLE VALIDATION ENDED
@@ -24,12 +24,14 @@ from tests.v1.conftest import db_session
 
 class MockRolePermDBConn:
     @staticmethod
-    def getRPData(db):
-        return [
+    def getRPData(db, role_id=None):
+        rows = [
             type("obj", (), {"role_id": 1, "module_id": 101, "permission_id": 1001}),
             type("obj", (), {"role_id": 1, "module_id": 102, "permission_id": 1002}),
             type("obj", (), {"role_id": 2, "module_id": 103, "permission_id": 1003}),
         ]
+        # the DAO filters by role_id in SQL
+        return [r for r in rows if role_id is None or r.role_id == role_id]
 
 
 def test_getRolePermission_all(client, get_valid_token):
@@ -155,7 +157,8 @@ def test_get_specific_role_permissions(client, get_valid_token):
 def test_get_all_roles_success(client, get_valid_token):
     """Test fetching all roles with mocked empty database"""
     with patch(
-        "controllers.v1.perm_controller.RolePerm_DBConn.getRPData", lambda db: []
+        "controllers.v1.perm_controller.RolePerm_DBConn.getRPData",
+        lambda db, **kwargs: [],
     ):
         headers = {
             "Authorization": f"Bearer {get_valid_token}",
@@ -992,3 +995,69 @@ def test_delete_role_permission_unexpected_error(
 # * INTEGRATION TEST ENDED
 
 # * DELETE ROLE PERMISSION ENDED
+
+
+# * BULK ROLE PERMISSION STARTED
+# UNIT TEST STARTED
+def _bulk_payload(*triples):
+    from schema.v1.perm_schema import BulkRolePermissionRequest
+
+    return BulkRolePermissionRequest(
+        items=[
+            {"role_id": r, "module_id": m, "permission_id": p} for r, m, p in triples
+        ]
+    )
+
+
+@patch("controllers.v1.perm_controller.log_audit", new_callable=AsyncMock)
+@patch("controllers.v1.perm_controller.RolePerm_DBConn.bulkUpsertRolePerm")
+@patch("controllers.v1.perm_controller.validate_permission_triples", return_value=[])
+def test_bulk_role_permission_one_upsert_one_audit(
+    mock_validate, mock_upsert, mock_audit
+):
+    import asyncio
+    from controllers.v1.perm_controller import PermissionModule
+
+    # Arrange: the repeated triple is collapsed, one of two already existed
+    mock_upsert.return_value = [MagicMock(id=7, role_id=3, module_id=1, permission_id=2)]
+    payload = _bulk_payload((3, 1, 2), (3, 1, 2), (3, 4, 2))
+    db = MagicMock()
+
+    # Act
+    response = asyncio.run(
+        PermissionModule.bulkAddRolePermission(payload, db, {"user_id": 1})
+    )
+
+    # Assert
+    assert response.status_code == HTTP_201_CREATED
+    body = json.loads(response.body)
+    assert body["skipped"] == 1
+    assert body["added"][0]["id"] == 7
+    mock_upsert.assert_called_once_with([(3, 1, 2), (3, 4, 2)], 1, db)
+    mock_audit.assert_awaited_once()
+
+
+@patch("controllers.v1.perm_controller.RolePerm_DBConn.bulkUpsertRolePerm")
+@patch(
+    "controllers.v1.perm_controller.validate_permission_triples",
+    return_value=[((3, 9, 2), "Module ID not available")],
+)
+def test_bulk_role_permission_rejects_invalid_triples(mock_validate, mock_upsert):
+    import asyncio
+    from controllers.v1.perm_controller import PermissionModule
+
+    # Act
+    response = asyncio.run(
+        PermissionModule.bulkAddRolePermission(
+            _bulk_payload((3, 1, 2), (3, 9, 2)), MagicMock(), {"user_id": 1}
+        )
+    )
+
+    # Assert: nothing is written when any triple is invalid
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert json.loads(response.body)["errors"][0]["module_id"] == 9
+    mock_upsert.assert_not_called()
+
+
+# UNIT TEST ENDED
+# * BULK ROLE PERMISSION ENDED
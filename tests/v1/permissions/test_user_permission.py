@@ -1,4 +1,5 @@
 import asyncio
+import pytest
 import json
 from unittest.mock import MagicMock, patch
 from controllers.v1.perm_controller import PermissionModule
@@ -8,6 +9,8 @@ from fastapi.responses import JSONResponse
 from helpers.v1.permission_helpers import verifyModuleUserndPermID
 from main import app
 from model.v1.permission_model import UserPermission
+from pydantic import ValidationError
+from schema.v1.perm_schema import BulkUserPermissionRequest
 from sqlalchemy import and_
 from starlette.status import (
     HTTP_200_OK,
@@ -32,16 +35,9 @@ def test_get_single_user_perm_missing_both_fields(client, get_valid_token):
 
 
 def test_get_single_user_perm_user_not_found(monkeypatch, client, get_valid_token):
-    def mock_get_user_table(_):
-        class FakeUser:
-            def __init__(self, email):
-                self.email = email
-
-        return [FakeUser("someone@else.com")]
-
     monkeypatch.setattr(
-        "controllers.v1.perm_controller.user_databaseConnection.getUserTable",
-        mock_get_user_table,
+        "controllers.v1.perm_controller.user_databaseConnection.get_by_email",
+        lambda email, db: None,
     )
 
     headers = {"Authorization": f"Bearer {get_valid_token}", "Accept-Language": "en"}
@@ -62,8 +58,8 @@ def test_get_single_user_perm_by_email_success(monkeypatch, client, get_valid_to
             self.email = email
 
     monkeypatch.setattr(
-        "controllers.v1.perm_controller.user_databaseConnection.getUserTable",
-        lambda db: [FakeUser(101, "abc@example.com")],
+        "controllers.v1.perm_controller.user_databaseConnection.get_by_email",
+        lambda email, db: FakeUser(101, email),
     )
 
     def mock_perm_service(uid, db, lang):
@@ -283,13 +279,9 @@ def test_add_user_perm_already_exists(mock_serv, client, get_valid_token):
     assert "already" in response.json()["message"].lower()
 
 
-@patch("helpers.v1.permission_helpers.user_databaseConnection.getUserTable")
-@patch("helpers.v1.permission_helpers.Module_DBConn.getModuleData")
-@patch("helpers.v1.permission_helpers.Permissions_DBConn.getPermissionData")
+@patch("helpers.v1.permission_helpers.existing_ids")
 def test_verify_module_user_perm_id_success(
-    mock_get_permission_data,
-    mock_get_module_data,
-    mock_get_user_table,
+    mock_existing_ids,
     db_session,
 ):
     # Arrange
@@ -297,13 +289,12 @@ def test_verify_module_user_perm_id_success(
     module_id = 2
     permission_id = 3
     accept_language = "en"
-    user = MagicMock(id=1)
-    module = MagicMock(id=2)
-    permission = MagicMock(id=3)
 
-    mock_get_user_table.return_value = [user]
-    mock_get_module_data.return_value = [module]
-    mock_get_permission_data.return_value = [permission]
+    mock_existing_ids.return_value = {
+        "user": {1},
+        "module": {2},
+        "permission": {3},
+    }
 
     # Act
     response = asyncio.run(
@@ -814,3 +805,34 @@ def test_delete_user_permission_unexpected_error(
 # * INTEGRATION TEST ENDED
 
 # * DELETE USER PERMISSION ENDED
+
+
+# * BULK USER PERMISSION STARTED
+# UNIT TEST STARTED
+@patch("controllers.v1.perm_controller.UserPerm_DBConn.bulkApplyUserPerm")
+@patch("controllers.v1.perm_controller.validate_permission_triples", return_value=[])
+def test_bulk_user_permission_rejects_grant_and_revoke_of_same_triple(
+    mock_validate, mock_apply
+):
+    # Arrange
+    item = {"user_id": 1, "module_id": 1, "permission_id": 1}
+    payload = BulkUserPermissionRequest(grant=[item], revoke=[item])
+
+    # Act
+    response = asyncio.run(
+        PermissionModule.bulkApplyUserPermission(payload, MagicMock(), {"user_id": 1})
+    )
+
+    # Assert
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    mock_apply.assert_not_called()
+
+
+def test_bulk_user_permission_requires_items():
+    # Act / Assert
+    with pytest.raises(ValidationError):
+        BulkUserPermissionRequest(grant=[], revoke=[])
+
+
+# UNIT TEST ENDED
+# * BULK USER PERMISSION ENDED
@@ -33,9 +33,7 @@ def test_up_id_not_found(db_session):
 
 def test_user_id_not_found(db_session):
     UserPerm_DBConn.getUserPData = lambda db: [DummyPerm(1, 10, 20, 30)]
-    user_databaseConnection.getUserTable = lambda db: [
-        DummyUser(99)
-    ]  # user_id 2 not in DB
+    user_databaseConnection.exists_ids = lambda ids, db: set()  # user_id 2 not in DB
     response = Perm_Serv.updateUserPermissionService(1, 2, 20, 30, db_session, "en")
     assert isinstance(response, JSONResponse)
     assert response.status_code == 400
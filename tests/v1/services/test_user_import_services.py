@@ -0,0 +1,107 @@
+import io
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from model.v1.role_model import Role
+from model.v1.user_model import StatusMaster, User
+from services.v1.user_import_services import (
+    UserImporter,
+    import_pool,
+    read_import,
+    shutdown_import_pool,
+)
+
+
+def fake_hash(password):
+    # module level so the process pool can pickle it; bcrypt is too slow here
+    return f"hashed:{password}"
+
+
+@pytest.fixture
+def sqlite_session():
+    engine = create_engine("sqlite://")
+    for model in (StatusMaster, Role, User):
+        model.__table__.create(engine)
+    db = sessionmaker(bind=engine)()
+    db.add_all(
+        [
+            StatusMaster(id=1, status="Active", is_deleted=0),
+            Role(id=1, role_name="User", status=1, is_deleted=0),
+            User(email="taken@example.com", password="x", user_name="t", role_id=1),
+        ]
+    )
+    db.commit()
+    yield db
+    db.close()
+
+
+CSV_FILE = """email,password,username,status,role
+a@example.com,pw-a,alice,1,1
+taken@example.com,pw,taken,1,1
+b@example.com,pw-b,bob,1,1
+a@example.com,pw-a2,alice2,1,1
+c@example.com,pw-c,carol,1,9
+d@example.com,pw-d,dave,x,1
+"""
+
+
+# * BULK USER IMPORT STARTED
+def test_import_csv_reports_bad_rows_and_inserts_the_rest(sqlite_session):
+    # Arrange
+    progress = []
+    importer = UserImporter(
+        sqlite_session,
+        created_by=1,
+        batch_size=3,
+        workers=1,
+        hasher=fake_hash,
+        on_progress=progress.append,
+    )
+
+    # Act
+    summary = importer.run(read_import(io.StringIO(CSV_FILE), "csv"))
+
+    # Assert
+    assert summary["total"] == 6
+    assert summary["imported"] == 2
+    assert {(e["row"], e["error"]) for e in summary["errors"]} == {
+        (2, "User Email Already Exists."),
+        (4, "Duplicate email in file."),
+        (5, "Role ID not available"),
+        (6, "Invalid row: status"),
+    }
+    assert len(progress) == 2  # one report per batch
+    alice = sqlite_session.query(User).filter_by(email="a@example.com").one()
+    assert alice.password == "hashed:pw-a"
+    assert alice.user_name == "alice"
+    assert alice.created_by == 1
+
+
+def test_read_ndjson_skips_blank_lines_and_flags_garbage():
+    # Act
+    records = list(read_import(io.StringIO('{"email": "a"}\n\nnot json\n'), "ndjson"))
+
+    # Assert
+    assert records == [{"email": "a"}, {}]
+
+
+def test_http_imports_share_one_pool_and_leave_it_running(sqlite_session):
+    # Arrange
+    pool = import_pool()
+    importer = UserImporter(sqlite_session, hasher=fake_hash, pool=pool)
+
+    # Act
+    summary = importer.run(read_import(io.StringIO(CSV_FILE), "csv"))
+
+    # Assert
+    assert summary["imported"] == 2
+    assert import_pool() is pool
+    assert pool.submit(fake_hash, "pw").result() == "hashed:pw"
+    shutdown_import_pool()
+    assert import_pool() is not pool
+    shutdown_import_pool()
+
+
+# * BULK USER IMPORT ENDED
@@ -0,0 +1,224 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from utils.v1.audit_logger import log_audit
+from utils.v1.audit_sink import AuditSink, AuditSpool
+
+
+def _record(i):
+    return {
+        "table_name": "users",
+        "record_id": i,
+        "action": "LOGOUT",
+        "performed_by": "1",
+    }
+
+
+def _sink(tmp_path, writer, **kwargs):
+    options = {"batch_size": 3, "flush_interval": 0.05, "max_queue": 100}
+    options.update(kwargs)
+    return AuditSink(
+        str(tmp_path / "audit.ndjson"), writer=writer, retry_delay=0.01, **options
+    )
+
+
+class Recorder:
+    def __init__(self, failures=0):
+        self.batches = []
+        self.failures = failures
+
+    async def __call__(self, rows):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("database down")
+        self.batches.append([row["record_id"] for row in rows])
+
+
+# * AUDIT SINK STARTED
+def test_sink_writes_multi_row_batches_and_drains_on_stop(tmp_path):
+    # Arrange
+    writer = Recorder()
+    sink = _sink(tmp_path, writer)
+
+    # Act
+    async def scenario():
+        await sink.start()
+        for i in range(7):
+            await sink.submit(_record(i))
+        await sink.stop()
+
+    asyncio.run(scenario())
+
+    # Assert
+    assert writer.batches == [[0, 1, 2], [3, 4, 5], [6]]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_sink_flushes_a_partial_batch_after_the_interval(tmp_path):
+    # Arrange
+    writer = Recorder()
+    sink = _sink(tmp_path, writer, batch_size=100)
+
+    # Act
+    async def scenario():
+        await sink.start()
+        await sink.submit(_record(1))
+        await asyncio.sleep(0.2)
+        written = list(writer.batches)
+        await sink.stop()
+        return written
+
+    # Assert
+    assert asyncio.run(scenario()) == [[1]]
+
+
+def test_sink_retries_a_failed_batch(tmp_path):
+    # Arrange
+    writer = Recorder(failures=2)
+    sink = _sink(tmp_path, writer)
+
+    # Act
+    async def scenario():
+        await sink.start()
+        await sink.submit(_record(1))
+        await sink.stop()
+
+    asyncio.run(scenario())
+
+    # Assert
+    assert writer.batches == [[1]]
+
+
+def test_submit_waits_while_the_queue_is_full(tmp_path):
+    # Arrange
+    written = []
+
+    async def scenario():
+        gate = asyncio.Event()
+
+        async def slow_writer(rows):
+            await gate.wait()
+            written.extend(row["record_id"] for row in rows)
+
+        sink = _sink(tmp_path, slow_writer, batch_size=1, max_queue=2)
+        await sink.start()
+        for i in range(3):  # one in flight, two queued
+            await sink.submit(_record(i))
+        await asyncio.sleep(0.01)
+
+        # Act
+        blocked = asyncio.create_task(sink.submit(_record(3)))
+        await asyncio.sleep(0.05)
+        was_blocked = not blocked.done()
+        gate.set()
+        await blocked
+        await sink.stop()
+        return was_blocked
+
+    # Assert
+    assert asyncio.run(scenario()) is True
+    assert written == [0, 1, 2, 3]
+
+
+def test_unwritten_records_are_replayed_on_next_start(tmp_path):
+    # Arrange: the database is down for the whole first run
+    down = Recorder(failures=10**6)
+    up = Recorder()
+
+    async def first_run():
+        sink = _sink(tmp_path, down)
+        await sink.start()
+        for i in range(4):
+            await sink.submit(_record(i))
+        await sink.stop(timeout=0.1)
+
+    async def second_run():
+        sink = _sink(tmp_path, up)
+        await sink.start()
+        await sink.submit(_record(99))
+        await asyncio.sleep(0.2)
+        await sink.stop()
+
+    # Act
+    asyncio.run(first_run())
+    asyncio.run(second_run())
+
+    # Assert
+    assert sorted(i for batch in up.batches for i in batch) == [0, 1, 2, 3, 99]
+    assert not list(tmp_path.glob("*.replay"))
+
+
+def test_live_workers_keep_their_spools(tmp_path):
+    # Arrange: a running worker holds the flock on its spool, a dead one
+    # (any host, any pid) left its spool unlocked
+    stamp = {"performed_at": "2026-01-01T00:00:00+00:00"}
+    live = AuditSpool(str(tmp_path / "audit.live.ndjson"), lock=True)
+    live.append({**_record(1), **stamp})
+    dead = AuditSpool(str(tmp_path / "audit.dead.ndjson"))
+    dead.append({**_record(2), **stamp})
+    dead.close()
+    writer = Recorder()
+
+    # Act
+    async def scenario():
+        sink = _sink(tmp_path, writer)
+        await sink.start()
+        await sink.submit(_record(3))
+        await asyncio.sleep(0.2)
+        await sink.stop()
+
+    asyncio.run(scenario())
+    live.close()
+
+    # Assert: only the dead worker's records are replayed
+    assert sorted(i for batch in writer.batches for i in batch) == [2, 3]
+    assert [path.name for path in tmp_path.iterdir()] == ["audit.live.ndjson"]
+
+
+def test_spool_lock_is_exclusive_until_closed(tmp_path):
+    # Arrange
+    path = str(tmp_path / "audit.worker.ndjson")
+    owner = AuditSpool(path, lock=True)
+
+    # Act / Assert
+    with pytest.raises(BlockingIOError):
+        AuditSpool(path, lock=True)
+    owner.close()
+    AuditSpool(path, lock=True).close()
+
+
+def test_spool_skips_committed_and_torn_records(tmp_path):
+    # Arrange
+    spool = AuditSpool(str(tmp_path / "audit.ndjson"))
+    first = spool.append(_record(1))
+    spool.append(_record(2))
+    spool.commit(first)
+    spool._file.write('{"torn":')
+    spool._file.flush()
+
+    # Act
+    pending = [record["record_id"] for record, _ in spool.pending()]
+
+    # Assert
+    assert pending == [2]
+
+
+@patch("utils.v1.audit_logger.audit_sink")
+def test_log_audit_enqueues_instead_of_committing(mock_sink):
+    # Arrange
+    mock_sink.running = True
+    mock_sink.submit = AsyncMock()
+    db = MagicMock()
+
+    # Act
+    asyncio.run(log_audit(db, "users", 5, "LOGOUT", 5, None))
+
+    # Assert
+    record = mock_sink.submit.await_args.args[0]
+    assert record["record_id"] == 5 and record["performed_by"] == "5"
+    db.commit.assert_not_called()
+
+
+# * AUDIT SINK ENDED
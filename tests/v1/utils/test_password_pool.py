@@ -0,0 +1,66 @@
+import asyncio
+import time
+
+import pytest
+
+from core.v1.exceptions import AppException
+from utils.v1.auth_utils import hash_password, verify_password
+from utils.v1.password_pool import PasswordHasherPool
+
+
+# * PASSWORD POOL STARTED
+def test_password_pool_runs_bcrypt_off_loop():
+    # Arrange
+    pool = PasswordHasherPool(workers=2, max_pending=4)
+    hashed = hash_password("secret")
+
+    # Act
+    result = asyncio.run(pool.run(verify_password, "secret", hashed))
+
+    # Assert
+    assert result is True
+    assert pool.stats()["completed"] == 1
+    assert pool.stats()["pending"] == 0
+
+
+def test_password_pool_rejects_when_saturated():
+    # Arrange
+    pool = PasswordHasherPool(workers=1, max_pending=2)
+
+    async def flood():
+        return await asyncio.gather(
+            *(pool.run(time.sleep, 0.05) for _ in range(4)), return_exceptions=True
+        )
+
+    # Act
+    results = asyncio.run(flood())
+
+    # Assert
+    rejected = [r for r in results if isinstance(r, AppException)]
+    assert len(rejected) == 2
+    assert all(r.status_code == 503 for r in rejected)
+    assert pool.stats()["rejected"] == 2
+
+
+def test_password_pool_keeps_event_loop_responsive():
+    # Arrange
+    pool = PasswordHasherPool(workers=2, max_pending=8)
+    ticks = []
+
+    async def ticker():
+        while len(ticks) < 5:
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.01)
+
+    async def scenario():
+        await asyncio.gather(ticker(), pool.run(time.sleep, 0.1))
+
+    # Act
+    asyncio.run(scenario())
+
+    # Assert: the loop kept ticking while the blocking call ran
+    assert len(ticks) == 5
+    assert ticks[-1] - ticks[0] < 0.1
+
+
+# * PASSWORD POOL ENDED
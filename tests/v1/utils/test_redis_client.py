@@ -0,0 +1,77 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import jwt
+
+from config.v1.config import Config
+from utils.v1 import redis_client
+
+
+def _token(jti, exp_in=60):
+    return jwt.encode(
+        {"jti": jti, "exp": int(time.time()) + exp_in}, "secret", algorithm="HS256"
+    )
+
+
+def _pipeline():
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[True, True])
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    return pipe
+
+
+# * REDIS BLACKLIST STARTED
+def test_is_token_blacklisted_true():
+    # Arrange
+    with patch.object(redis_client.redis_client, "get", AsyncMock(return_value="1")):
+        # Act
+        result = asyncio.run(redis_client.is_token_blacklisted("abc"))
+
+    # Assert
+    assert result is True
+
+
+def test_is_token_blacklisted_false():
+    # Arrange
+    with patch.object(redis_client.redis_client, "get", AsyncMock(return_value=None)):
+        # Act
+        result = asyncio.run(redis_client.is_token_blacklisted("abc"))
+
+    # Assert
+    assert result is False
+
+
+def test_blacklist_tokens_uses_single_pipeline(monkeypatch):
+    # Arrange
+    monkeypatch.setattr(Config, "JWT_SECRET_KEY", "secret")
+    monkeypatch.setattr(Config, "JWT_ALGORITHM", "HS256")
+    pipe = _pipeline()
+
+    with patch.object(redis_client.redis_client, "pipeline", return_value=pipe):
+        # Act
+        asyncio.run(redis_client.blacklist_tokens(_token("a"), _token("r")))
+
+    # Assert
+    keys = [c.args[0] for c in pipe.set.call_args_list]
+    assert keys == ["bl:a", "bl:r"]
+    assert pipe.publish.call_count == 2
+    pipe.execute.assert_awaited_once()
+    assert redis_client.revocation_mirror.contains("a")
+
+
+def test_blacklist_tokens_skips_invalid(monkeypatch):
+    # Arrange
+    monkeypatch.setattr(Config, "JWT_SECRET_KEY", "secret")
+    monkeypatch.setattr(Config, "JWT_ALGORITHM", "HS256")
+
+    with patch.object(redis_client.redis_client, "pipeline") as mock_pipeline:
+        # Act
+        asyncio.run(redis_client.blacklist_tokens("not-a-jwt", _token("x", -10)))
+
+    # Assert
+    mock_pipeline.assert_not_called()
+
+
+# * REDIS BLACKLIST ENDED
@@ -0,0 +1,89 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from config.v1.config import Config
+from utils.v1 import redis_client
+from utils.v1.revocation_mirror import RevocationMirror
+
+
+# * REVOCATION MIRROR STARTED
+def test_mirror_contains_until_exp():
+    # Arrange
+    mirror = RevocationMirror(MagicMock(), "revocations")
+    mirror.add("live", time.time() + 60)
+    mirror.add("stale", time.time() - 1)
+
+    # Act / Assert
+    assert mirror.contains("live") is True
+    assert mirror.contains("stale") is False
+    assert mirror.contains("unknown") is False
+    assert len(mirror) == 1
+
+
+def test_mirror_applies_published_message():
+    # Arrange
+    mirror = RevocationMirror(MagicMock(), "revocations")
+    exp = time.time() + 60
+
+    # Act
+    mirror._on_message(f"abc-123:{exp}")
+
+    # Assert
+    assert mirror.contains("abc-123") is True
+
+
+def test_mirror_seed_uses_key_ttl():
+    # Arrange
+    async def scan_iter(match, count):
+        for key in ("bl:a", "bl:b"):
+            yield key
+
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[30, -2])
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+
+    client = MagicMock()
+    client.scan_iter = scan_iter
+    client.pipeline.return_value = pipe
+    mirror = RevocationMirror(client, "revocations")
+
+    # Act
+    asyncio.run(mirror.seed())
+
+    # Assert
+    assert mirror.contains("a") is True
+    assert mirror.contains("b") is False
+
+
+def test_blacklist_check_skips_redis_when_mirror_ready(monkeypatch):
+    # Arrange
+    monkeypatch.setattr(redis_client.revocation_mirror, "ready", True)
+
+    with patch.object(redis_client.redis_client, "get", AsyncMock()) as mock_get:
+        # Act
+        result = asyncio.run(redis_client.is_token_blacklisted("not-revoked"))
+
+    # Assert
+    assert result is False
+    mock_get.assert_not_called()
+
+
+def test_blacklist_check_falls_back_to_redis(monkeypatch):
+    # Arrange
+    monkeypatch.setattr(redis_client.revocation_mirror, "ready", False)
+    monkeypatch.setattr(Config, "REVOCATION_FALLBACK_TO_REDIS", True)
+
+    with patch.object(
+        redis_client.redis_client, "get", AsyncMock(return_value="1")
+    ) as mock_get:
+        # Act
+        result = asyncio.run(redis_client.is_token_blacklisted("revoked"))
+
+    # Assert
+    assert result is True
+    mock_get.assert_awaited_once_with("bl:revoked")
+
+
+# * REVOCATION MIRROR ENDED
@@ -0,0 +1,55 @@
+from datetime import timedelta
+
+import pytest
+
+from benchmarks.v1.token_codec import bench_keys
+from utils.v1.token_codec import ExpiredSignatureError, InvalidTokenError, TokenCodec
+
+
+# * TOKEN CODEC STARTED
+def test_codec_round_trip_hs256():
+    # Arrange
+    codec = TokenCodec("HS256", secret_key="secret")
+
+    # Act
+    token = codec.encode({"user_id": 1}, "access", timedelta(minutes=5))
+    claims = codec.decode(token, "access")
+
+    # Assert
+    assert claims["user_id"] == 1
+    assert claims["type"] == "access"
+    assert claims["jti"]
+
+
+def test_codec_round_trip_rs256():
+    # Arrange
+    codec = TokenCodec("RS256", *bench_keys("RS256"))
+
+    # Act
+    token = codec.encode({"user_id": 7}, "refresh", timedelta(minutes=5))
+
+    # Assert
+    assert codec.decode(token, "refresh")["user_id"] == 7
+
+
+def test_codec_rejects_wrong_token_type():
+    # Arrange
+    codec = TokenCodec("HS256", secret_key="secret")
+    token = codec.encode({"user_id": 1}, "refresh", timedelta(minutes=5))
+
+    # Act / Assert
+    with pytest.raises(InvalidTokenError):
+        codec.decode(token, "access")
+
+
+def test_codec_rejects_expired_token():
+    # Arrange
+    codec = TokenCodec("HS256", secret_key="secret")
+    token = codec.encode({"user_id": 1}, "access", timedelta(seconds=-5))
+
+    # Act / Assert
+    with pytest.raises(ExpiredSignatureError):
+        codec.decode(token)
+
+
+# * TOKEN CODEC ENDED
@@ -0,0 +1,64 @@
+from unittest.mock import patch
+from utils.v1.ttl_cache import TTLCache
+
+
+def test_ttl_cache_hit_and_miss():
+    # Arrange
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1)
+
+    # Act
+    hit = cache.get("a")
+    miss = cache.get("b")
+
+    # Assert
+    assert hit == 1
+    assert miss is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    # Arrange
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is now the oldest
+
+    # Act
+    cache.set("c", 3)
+
+    # Assert
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_cache_entry_expires():
+    # Arrange
+    cache = TTLCache(maxsize=10, ttl=5)
+    with patch("utils.v1.ttl_cache.time.time", return_value=1000):
+        cache.set("a", 1)
+
+    # Act
+    with patch("utils.v1.ttl_cache.time.time", return_value=1006):
+        value = cache.get("a")
+
+    # Assert
+    assert value is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_explicit_expiry():
+    # Arrange
+    cache = TTLCache(maxsize=10, ttl=5)
+    with patch("utils.v1.ttl_cache.time.time", return_value=1000):
+        cache.set("a", 1, expires_at=2000)
+
+    # Act
+    with patch("utils.v1.ttl_cache.time.time", return_value=1500):
+        value = cache.get("a")
+
+    # Assert
+    assert value == 1
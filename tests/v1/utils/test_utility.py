@@ -116,3 +116,75 @@ def test_send_reset_link_exception(mock_db_session, mock_background_task):
 
 #     # Assert
 #     assert result is None  # Function returns None implicitly
+
+
+# * RESET TOKEN STARTED
+def test_generate_reset_token_selector_verifier(monkeypatch):
+    # Arrange
+    from config.v1.config import Config
+    from utils.v1.utility import generate_reset_token, hash_reset_verifier
+
+    monkeypatch.setattr(Config, "RESET_TOKEN_SECRET", "reset-secret")
+
+    # Act
+    raw_token, selector, hashed_verifier, expires_at = generate_reset_token()
+
+    # Assert
+    token_selector, verifier = raw_token.split(".", 1)
+    assert token_selector == selector
+    assert hashed_verifier == hash_reset_verifier(verifier)
+    assert verifier not in hashed_verifier
+
+
+def test_reset_verifier_without_any_key_raises_config_error(monkeypatch):
+    # Arrange
+    from config.v1.config import Config
+    from utils.v1.utility import hash_reset_verifier
+
+    monkeypatch.setattr(Config, "RESET_TOKEN_SECRET", None)
+    monkeypatch.setattr(Config, "JWT_SECRET_KEY", None)
+
+    # Act / Assert
+    with pytest.raises(RuntimeError, match="RESET_TOKEN_SECRET or JWT_SECRET_KEY"):
+        hash_reset_verifier("verifier")
+
+
+def test_verify_reset_token_looks_up_by_selector(monkeypatch, mock_db_session):
+    # Arrange
+    import asyncio
+    from config.v1.config import Config
+    from utils.v1.auth_utils import verifyResetPassToken
+    from utils.v1.utility import generate_reset_token
+
+    monkeypatch.setattr(Config, "RESET_TOKEN_SECRET", "reset-secret")
+    raw_token, selector, hashed_verifier, _ = generate_reset_token()
+    row = MagicMock(selector=selector, token=hashed_verifier)
+    mock_db_session.query().filter().first.return_value = row
+
+    # Act
+    result = asyncio.run(verifyResetPassToken(raw_token, mock_db_session))
+
+    # Assert
+    assert result is row
+
+
+def test_verify_reset_token_rejects_wrong_verifier(monkeypatch, mock_db_session):
+    # Arrange
+    import asyncio
+    from fastapi import HTTPException
+    from config.v1.config import Config
+    from utils.v1.auth_utils import verifyResetPassToken
+    from utils.v1.utility import generate_reset_token
+
+    monkeypatch.setattr(Config, "RESET_TOKEN_SECRET", "reset-secret")
+    _, selector, hashed_verifier, _ = generate_reset_token()
+    row = MagicMock(selector=selector, token=hashed_verifier)
+    mock_db_session.query().filter().first.return_value = row
+
+    # Act / Assert
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(verifyResetPassToken(f"{selector}.forged", mock_db_session))
+    assert exc.value.status_code == 400
+
+
+# * RESET TOKEN ENDED
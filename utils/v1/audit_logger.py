@@ -3,6 +3,7 @@ from model.v1.audit_log import AuditLog
 from sqlalchemy.orm import Session
 from fastapi import Request
 from datetime import datetime
+from utils.v1.audit_sink import audit_sink
 
 
 # date error : Object of type datetime is not JSON serializable! So serialize data before adding.
@@ -36,16 +37,23 @@ async def log_audit(
     ip_address = request.client.host if request else "UNKNOWN"
     module = str(request.url.path) if request else "UNKNOWN"
 
-    audit_entry = AuditLog(
-        table_name=table_name,
-        record_id=record_id,
-        action=action,
-        old_data=serialize_data(old_data),
-        new_data=serialize_data(new_data),
-        changed_fields=changed_fields,
-        performed_by=user,
-        ip_address=ip_address,
-        module=module,
-    )
-    db.add(audit_entry)
+    record = {
+        "table_name": table_name,
+        "record_id": record_id,
+        "action": action,
+        "old_data": serialize_data(old_data),
+        "new_data": serialize_data(new_data),
+        "changed_fields": changed_fields,
+        "performed_by": str(user) if user is not None else "UNKNOWN",
+        "ip_address": ip_address,
+        "module": module,
+    }
+
+    # queued for the background writer, off the request's commit path
+    if audit_sink.running:
+        await audit_sink.submit(record)
+        return
+
+    # no running event-loop writer (scripts, tests): write it directly
+    db.add(AuditLog(**record))
     db.commit()
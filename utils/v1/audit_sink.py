@@ -0,0 +1,333 @@
+import asyncio
+import fcntl
+import glob
+import json
+import logging
+import os
+import time
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import insert
+
+from config.v1.config import Config
+from model.v1.audit_log import AuditLog
+
+logger = logging.getLogger(__name__)
+
+
+class AuditSpool:
+    """
+    Append-only NDJSON file of queued audit records.
+
+    Every record is appended before it is queued, and the byte offset up
+    to which records are known to be in the database is kept in
+    `<path>.offset`. After a crash, `pending()` yields the records past
+    that offset. Once the queue has fully drained the file is truncated.
+
+    With `lock` the spool holds an exclusive flock for as long as it is
+    open, which tells other workers its owner is still running.
+    """
+
+    def __init__(self, path: str, fsync: bool = False, lock: bool = False):
+        self.path = path
+        self.offset_path = f"{path}.offset"
+        self.fsync = fsync
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+        if lock:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    def append(self, record: dict) -> int:
+        """Write one record and return the file offset just past it."""
+        self._file.write(json.dumps(record, separators=(",", ":"), default=str) + "\n")
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        return self._file.tell()
+
+    def committed(self) -> int:
+        try:
+            with open(self.offset_path) as fh:
+                return int(fh.read() or 0)
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def commit(self, offset: int):
+        """Records up to `offset` are in the database."""
+        tmp = f"{self.offset_path}.tmp"
+        with open(tmp, "w") as fh:
+            fh.write(str(offset))
+        os.replace(tmp, self.offset_path)
+
+    def pending(self):
+        """(record, end offset) for every record past the committed offset."""
+        with open(self.path, "rb") as fh:
+            fh.seek(self.committed())
+            for line in iter(fh.readline, b""):
+                if not line.endswith(b"\n"):
+                    # torn write from a crash mid-append
+                    break
+                yield json.loads(line), fh.tell()
+
+    def reset(self):
+        self._file.truncate(0)
+        self._file.seek(0)
+        self.commit(0)
+
+    def close(self):
+        self._file.close()
+
+    def discard(self):
+        self.close()
+        for path in (self.path, self.offset_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+async def insert_audit_rows(rows):
+    from database.v1.connection import async_engine
+
+    async with async_engine.begin() as conn:
+        await conn.execute(insert(AuditLog.__table__), rows)
+
+
+def _lock_orphan(path: str):
+    """
+    Open descriptor holding the flock of `path`, or None while its owner
+    still holds it (or the file is gone). The kernel drops a dead owner's
+    lock, so this needs no pid or host bookkeeping.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        return None
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        # another worker may have claimed and renamed it before we locked
+        if os.fstat(fd).st_ino == os.stat(path).st_ino:
+            return fd
+    except (BlockingIOError, FileNotFoundError):
+        pass
+    os.close(fd)
+    return None
+
+
+def _to_row(record: dict) -> dict:
+    row = dict(record)
+    row["performed_at"] = datetime.fromisoformat(row["performed_at"])
+    return row
+
+
+class AuditSink:
+    """
+    Off-request-path writer for audit_log.
+
+    submit() appends the record to the spool and puts it on a bounded
+    in-memory queue; a background task writes queued records with one
+    multi-row INSERT per batch, when `batch_size` records are waiting or
+    `flush_interval` seconds after the first one arrived. When the queue
+    is full, submit() waits for the writer (backpressure) instead of
+    growing without bound. A failed INSERT is retried with the same batch
+    while the spool keeps it safe. stop() drains the queue; whatever could
+    not be written stays in the spool.
+
+    Every worker process spools to its own `<root>.<id><ext>` file derived
+    from spool_path and keeps it flocked while running. start() takes over
+    every spool or replay file whose lock it can acquire, i.e. whose owner
+    has exited, renames it to a `<root>.<id>.replay` file of its own and
+    writes it from a second background task, holding the lock until done.
+    The spool directory needs working flock(); on network volumes that
+    means NFSv4 or another filesystem that propagates it between hosts.
+    """
+
+    def __init__(
+        self,
+        spool_path: str,
+        batch_size: int,
+        flush_interval: float,
+        max_queue: int,
+        fsync: bool = False,
+        writer=insert_audit_rows,
+        retry_delay: float = 1.0,
+    ):
+        self.spool_path = spool_path
+        self._root, self._ext = os.path.splitext(spool_path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+        self.fsync = fsync
+        self.writer = writer
+        self.retry_delay = retry_delay
+
+        self.written = 0
+        self.batches = 0
+        self._spool = None
+        self._queue = None
+        self._space = None
+        self._task = None
+        self._replay_task = None
+        self._claimed = []
+        self._in_flight = False
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    async def start(self):
+        if self._task is not None:
+            return
+        self._claim_orphans()
+        self._spool = AuditSpool(
+            f"{self._root}.{uuid.uuid4().hex}{self._ext}", fsync=self.fsync, lock=True
+        )
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._space = asyncio.Event()
+        self._task = asyncio.create_task(self.run())
+        self._replay_task = asyncio.create_task(self._replay())
+
+    def _claim_orphans(self):
+        """Move unlocked spool and replay files to locked replay files of ours."""
+        orphans = glob.glob(f"{self._root}.*{self._ext}")
+        orphans += glob.glob(f"{self._root}.*.replay")
+        for path in sorted(orphans):
+            fd = _lock_orphan(path)
+            if fd is None:
+                continue
+            target = f"{self._root}.{uuid.uuid4().hex}.replay"
+            os.replace(path, target)
+            if os.path.exists(f"{path}.offset"):
+                os.replace(f"{path}.offset", f"{target}.offset")
+            leftover = AuditSpool(target)
+            unwritten = next(leftover.pending(), None) is not None
+            leftover.close()
+            if unwritten:
+                self._claimed.append((target, fd))
+            else:
+                leftover.discard()
+                os.close(fd)
+
+    async def submit(self, record: dict):
+        record = dict(record)
+        record.setdefault("performed_at", datetime.now(timezone.utc).isoformat())
+        while self._queue.full():
+            self._space.clear()
+            await self._space.wait()
+        # no await between the spool append and the enqueue, so spool
+        # order and queue order stay the same
+        self._queue.put_nowait((record, self._spool.append(record)))
+
+    async def run(self):
+        while True:
+            batch = await self._collect()
+            await self._write(batch)
+
+    async def _collect(self):
+        batch = [await self._queue.get()]
+        self._in_flight = True
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            if self._queue.empty():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), remaining)
+                    )
+                except asyncio.TimeoutError:
+                    break
+            else:
+                batch.append(self._queue.get_nowait())
+        self._space.set()
+        return batch
+
+    async def _insert(self, rows):
+        while True:
+            try:
+                await self.writer(rows)
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Audit batch of %d failed: %s", len(rows), e)
+                await asyncio.sleep(self.retry_delay)
+        self.written += len(rows)
+        self.batches += 1
+
+    async def _write(self, batch):
+        try:
+            await self._insert([_to_row(record) for record, _ in batch])
+            self._spool.commit(batch[-1][1])
+        finally:
+            self._in_flight = False
+        if self._queue.empty():
+            self._spool.reset()
+
+    async def _replay(self):
+        while self._claimed:
+            path, fd = self._claimed[0]
+            spool = AuditSpool(path)
+            batch = []
+            for record, end in spool.pending():
+                batch.append((_to_row(record), end))
+                if len(batch) == self.batch_size:
+                    await self._insert([row for row, _ in batch])
+                    spool.commit(batch[-1][1])
+                    batch = []
+            if batch:
+                await self._insert([row for row, _ in batch])
+            spool.discard()
+            os.close(fd)
+            self._claimed.pop(0)
+            logger.info("Replayed audit spool %s", path)
+
+    async def stop(self, timeout: float = None):
+        """Flush everything queued, then stop the writer task."""
+        if self._task is None:
+            return
+        try:
+            await asyncio.wait_for(self._drain(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Audit queue not drained, %d records left in the spool",
+                self._queue.qsize(),
+            )
+        for task in (self._task, self._replay_task):
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._task = self._replay_task = None
+        # unfinished replay files become claimable again
+        for _, fd in self._claimed:
+            os.close(fd)
+        self._claimed = []
+        if next(self._spool.pending(), None) is None:
+            self._spool.discard()
+        else:
+            self._spool.close()
+
+    async def _drain(self):
+        while not self._queue.empty() or self._in_flight:
+            await asyncio.sleep(min(self.flush_interval, 0.05))
+
+    def stats(self) -> dict:
+        return {
+            "queued": self._queue.qsize() if self._queue else 0,
+            "max_queue": self.max_queue,
+            "written": self.written,
+            "batches": self.batches,
+        }
+
+
+audit_sink = AuditSink(
+    spool_path=Config.AUDIT_SPOOL_PATH,
+    batch_size=Config.AUDIT_BATCH_SIZE,
+    flush_interval=Config.AUDIT_FLUSH_INTERVAL,
+    max_queue=Config.AUDIT_QUEUE_MAXSIZE,
+    fsync=Config.AUDIT_SPOOL_FSYNC,
+)
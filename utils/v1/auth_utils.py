@@ -3,6 +3,9 @@ from datetime import datetime
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 from model.v1.user_model import PasswordResetToken
+from utils.v1.password_pool import password_pool
+from utils.v1.utility import hash_reset_verifier
+import hmac
 
 
 def hash_password(password: str) -> str:
@@ -19,23 +22,35 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     )
 
 
+async def hash_password_async(password: str) -> str:
+    """hash_password on the bcrypt pool, raises AppException(503) when saturated."""
+    return await password_pool.run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password on the bcrypt pool, raises AppException(503) when saturated."""
+    return await password_pool.run(verify_password, plain_password, hashed_password)
+
+
 async def verifyResetPassToken(raw_token, db: Session):
-    tokens_from_db = (
+    # "<selector>.<verifier>": find the row by selector, then compare the HMAC
+    selector, _, verifier = (raw_token or "").partition(".")
+    if not selector or not verifier:
+        raise HTTPException(status_code=400, detail="Invalid or expired token")
+
+    valid_token = (
         db.query(PasswordResetToken)
         .filter(
+            PasswordResetToken.selector == selector,
             PasswordResetToken.used == False,
             PasswordResetToken.expires_at > datetime.utcnow(),
         )
-        .all()
+        .first()
     )
 
-    valid_token = None
-    for t in tokens_from_db:
-        if verify_password(raw_token, t.token):
-            valid_token = t
-            break
-
-    if not valid_token:
+    if not valid_token or not hmac.compare_digest(
+        valid_token.token, hash_reset_verifier(verifier)
+    ):
         raise HTTPException(status_code=400, detail="Invalid or expired token")
 
     return valid_token
@@ -0,0 +1,66 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config.v1.config import Config
+from core.v1.exceptions import AppException
+
+
+class PasswordHasherPool:
+    """
+    Runs bcrypt calls on a fixed-size thread pool (bcrypt releases the GIL)
+    so they never block the event loop. At most `max_pending` calls may be
+    running or queued; beyond that callers get an AppException(503) instead
+    of waiting behind an ever-growing queue.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="bcrypt"
+        )
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self._busy_seconds = 0.0
+
+    async def run(self, fn, *args):
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise AppException("Server is busy. Please try again shortly.", 503)
+
+        self.pending += 1
+        start = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self.pending -= 1
+            self.completed += 1
+            self._busy_seconds += time.perf_counter() - start
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "running": min(self.pending, self.workers),
+            "queued": max(self.pending - self.workers, 0),
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_ms": (
+                round(self._busy_seconds * 1000 / self.completed, 2)
+                if self.completed
+                else 0.0
+            ),
+        }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_pool = PasswordHasherPool(
+    workers=Config.PASSWORD_POOL_WORKERS,
+    max_pending=Config.PASSWORD_POOL_MAX_PENDING,
+)
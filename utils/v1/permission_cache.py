@@ -0,0 +1,30 @@
+from config.v1.config import Config
+from utils.v1.ttl_cache import TTLCache
+
+# (role_id, user_id, module_id, permission_id) -> (user_exists, granted)
+decision_cache = TTLCache(
+    maxsize=Config.PERMISSION_CACHE_MAXSIZE, ttl=Config.PERMISSION_CACHE_TTL
+)
+
+# role_id -> role_name, only active roles are cached
+role_name_cache = TTLCache(
+    maxsize=Config.ROLE_CACHE_MAXSIZE, ttl=Config.PERMISSION_CACHE_TTL
+)
+
+
+def invalidate_permissions():
+    """Drop cached grant decisions after role/user permission writes."""
+    decision_cache.clear()
+
+
+def invalidate_roles():
+    """Drop cached role names (and decisions that depend on them)."""
+    role_name_cache.clear()
+    decision_cache.clear()
+
+
+def cache_stats() -> dict:
+    return {
+        "decisions": decision_cache.stats(),
+        "role_names": role_name_cache.stats(),
+    }
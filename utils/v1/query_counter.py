@@ -0,0 +1,35 @@
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryCounter:
+    """
+    Context manager that counts SQL statements sent to an engine.
+
+    with QueryCounter(engine) as counter:
+        ...
+    counter.count  -> number of statements executed inside the block
+
+    An AsyncEngine is accepted too; events are attached to its sync_engine.
+    """
+
+    def __init__(self, engine: Engine):
+        self.engine = getattr(engine, "sync_engine", engine)
+        self.count = 0
+        self.statements = []
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+        self.statements.append(statement)
+
+    def reset(self):
+        self.count = 0
+        self.statements = []
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+        return False
@@ -1,45 +1,100 @@
-import redis
+import redis.asyncio as redis
 from typing import Optional
-import jwt, time
+import time
 from config.v1.config import Config
+from utils.v1.revocation_mirror import RevocationMirror
+from utils.v1.token_cache import evict_jti
+from utils.v1.token_codec import ExpiredSignatureError, decode_token
 
-redis_client = redis.Redis(host="localhost", port=6379, db=0, decode_responses=True)
+redis_pool = redis.ConnectionPool(
+    host=Config.REDIS_HOST,
+    port=Config.REDIS_PORT,
+    db=Config.REDIS_DB,
+    password=Config.REDIS_PASSWORD,
+    max_connections=Config.REDIS_MAX_CONNECTIONS,
+    socket_timeout=Config.REDIS_SOCKET_TIMEOUT,
+    socket_connect_timeout=Config.REDIS_CONNECT_TIMEOUT,
+    decode_responses=True,
+)
+redis_client = redis.Redis(connection_pool=redis_pool)
+revocation_mirror = RevocationMirror(
+    redis_client, Config.REVOCATION_CHANNEL, on_revoke=evict_jti
+)
 
 
-def redis_set(key: str, value: str, ex: Optional[int] = None):
-    return redis_client.set(key, value, ex=ex)
+async def redis_set(key: str, value: str, ex: Optional[int] = None):
+    return await redis_client.set(key, value, ex=ex)
 
 
-def redis_get(key: str):
-    return redis_client.get(key)
+async def redis_get(key: str):
+    return await redis_client.get(key)
 
 
-def redis_del(key: str):
-    return redis_client.delete(key)
+async def redis_del(key: str):
+    return await redis_client.delete(key)
 
 
-def blacklist_token(token: str):
-    """Decode token, extract jti & exp, and store it in Redis with TTL."""
+def _blacklist_entry(token: str):
+    """Decode token and return (jti, exp, ttl) for its blacklist entry, or None."""
     try:
-        payload = jwt.decode(
-            token, Config.JWT_SECRET_KEY, algorithms=[Config.JWT_ALGORITHM]
-        )
+        payload = decode_token(token)
         jti = payload.get("jti")
         exp = payload.get("exp")
 
         if not jti or not exp:
-            return
+            return None
 
         ttl = max(int(exp - time.time()), 1)  # time left before expiry
-        redis_client.set(f"bl:{jti}", "1", ex=ttl)
-    except jwt.ExpiredSignatureError:
+        return jti, exp, ttl
+    except ExpiredSignatureError:
         # Already expired → no need to blacklist
-        pass
+        return None
     except Exception:
         # Invalid token → skip
-        pass
+        return None
+
+
+async def blacklist_tokens(*tokens: str):
+    """Blacklist several tokens in a single round-trip and notify other workers."""
+    entries = [entry for entry in map(_blacklist_entry, tokens) if entry]
+    if not entries:
+        return
+
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for jti, exp, ttl in entries:
+            pipe.set(f"bl:{jti}", "1", ex=ttl)
+            pipe.publish(Config.REVOCATION_CHANNEL, f"{jti}:{exp}")
+        await pipe.execute()
+
+    for jti, exp, _ in entries:
+        revocation_mirror.add(jti, exp)
+
+
+async def blacklist_token(token: str):
+    """Decode token, extract jti & exp, and store it in Redis with TTL."""
+    await blacklist_tokens(token)
+
+
+async def is_token_blacklisted(jti: str) -> bool:
+    """
+    Check if token is blacklisted. Answered from the local mirror while
+    its subscription is live, otherwise from Redis unless the fallback
+    is switched off.
+    """
+    if revocation_mirror.contains(jti):
+        return True
+    if revocation_mirror.ready or not Config.REVOCATION_FALLBACK_TO_REDIS:
+        return False
+    return await redis_get(f"bl:{jti}") is not None
+
+
+def start_revocation_mirror():
+    if Config.REVOCATION_MIRROR_ENABLED:
+        revocation_mirror.start()
 
 
-def is_token_blacklisted(jti: str) -> bool:
-    """Check if token is blacklisted."""
-    return redis_get(f"bl:{jti}") is not None
+async def close_redis():
+    """Stop the revocation mirror and release pooled connections on shutdown."""
+    await revocation_mirror.stop()
+    await redis_client.aclose()
+    await redis_pool.disconnect()
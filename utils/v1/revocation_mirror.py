@@ -0,0 +1,122 @@
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger("revocation_mirror")
+
+
+class RevocationMirror:
+    """
+    Per-worker copy of the Redis token blacklist (jti -> exp).
+
+    Seeded from the bl:* keys at startup and kept current by a pub/sub
+    subscription that blacklist_token publishes to. `ready` is only True
+    while the subscription is live, so callers know when the mirror can
+    be trusted to answer "not revoked" on its own. `on_revoke(jti)` is
+    called for every revocation added, local or published.
+    """
+
+    def __init__(
+        self, client, channel: str, key_prefix: str = "bl:", on_revoke=None
+    ):
+        self.client = client
+        self.channel = channel
+        self.key_prefix = key_prefix
+        self.on_revoke = on_revoke
+        self.ready = False
+        self._revoked = {}
+        self._task = None
+
+    def add(self, jti: str, exp: float):
+        self._revoked[jti] = float(exp)
+        if self.on_revoke:
+            self.on_revoke(jti)
+
+    def contains(self, jti: str) -> bool:
+        exp = self._revoked.get(jti)
+        if exp is None:
+            return False
+        if exp <= time.time():
+            # token is past exp anyway, jwt decode rejects it
+            self._revoked.pop(jti, None)
+            return False
+        return True
+
+    def purge(self):
+        now = time.time()
+        for jti in [j for j, exp in self._revoked.items() if exp <= now]:
+            self._revoked.pop(jti, None)
+
+    def __len__(self):
+        return len(self._revoked)
+
+    async def seed(self, batch_size: int = 500):
+        """Load current revocations, deriving exp from each key's TTL."""
+        keys = []
+        async for key in self.client.scan_iter(
+            match=f"{self.key_prefix}*", count=batch_size
+        ):
+            keys.append(key)
+            if len(keys) >= batch_size:
+                await self._load(keys)
+                keys = []
+        if keys:
+            await self._load(keys)
+
+    async def _load(self, keys):
+        async with self.client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.ttl(key)
+            ttls = await pipe.execute()
+
+        now = time.time()
+        for key, ttl in zip(keys, ttls):
+            if ttl and ttl > 0:
+                self.add(key[len(self.key_prefix) :], now + ttl)
+
+    def _on_message(self, data: str):
+        jti, _, exp = data.rpartition(":")
+        if jti:
+            self.add(jti, float(exp))
+
+    async def run(self, retry_delay: float = 1.0):
+        """Subscribe, seed and apply published revocations until cancelled."""
+        while True:
+            pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            try:
+                # subscribe before seeding so nothing published in between is lost
+                await pubsub.subscribe(self.channel)
+                await self.seed()
+                self.ready = True
+                logger.info("Revocation mirror live with %d entries", len(self))
+
+                while True:
+                    message = await pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self._on_message(message["data"])
+                    elif message is None:
+                        self.purge()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Revocation mirror disconnected: %s", e)
+            finally:
+                self.ready = False
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+            await asyncio.sleep(retry_delay)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
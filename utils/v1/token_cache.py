@@ -0,0 +1,43 @@
+import hashlib
+
+from config.v1.config import Config
+from utils.v1.ttl_cache import TTLCache
+
+# sha256(raw token) -> decoded claims, each entry expires at the token's exp
+verified_token_cache = TTLCache(maxsize=Config.JWT_CACHE_MAXSIZE, ttl=0)
+
+# jti -> sha256(raw token), so a revocation can evict without the raw token
+_jti_index = TTLCache(maxsize=Config.JWT_CACHE_MAXSIZE, ttl=0)
+
+
+def token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def get_verified_claims(token: str):
+    """Claims of a token that already passed signature verification, or None."""
+    return verified_token_cache.get(token_digest(token))
+
+
+def cache_verified_claims(token: str, claims: dict):
+    exp = claims.get("exp")
+    if not exp:
+        return
+
+    digest = token_digest(token)
+    verified_token_cache.set(digest, claims, expires_at=exp)
+    jti = claims.get("jti")
+    if jti:
+        _jti_index.set(jti, digest, expires_at=exp)
+
+
+def evict_jti(jti: str):
+    """Drop the cached claims of a revoked token."""
+    digest = _jti_index.pop(jti)
+    if digest:
+        verified_token_cache.pop(digest)
+
+
+def clear_token_cache():
+    verified_token_cache.clear()
+    _jti_index.clear()
@@ -0,0 +1,98 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import jwt
+from jwt import ExpiredSignatureError, InvalidTokenError
+from jwt.algorithms import get_default_algorithms
+
+from config.v1.config import Config
+
+ACCESS_TOKEN_EXPIRES = timedelta(minutes=30)
+REFRESH_TOKEN_EXPIRES = timedelta(days=7)
+
+
+class TokenCodec:
+    """
+    Encodes and decodes access/refresh tokens with PyJWT.
+
+    Key material is parsed once: HS* algorithms use the shared secret,
+    RS/ES/PS algorithms load the PEM private key (signing) and public key
+    (verification) into key objects up front, so no call re-parses them.
+    """
+
+    def __init__(
+        self,
+        algorithm: str,
+        secret_key: str = None,
+        private_key: str = None,
+        public_key: str = None,
+    ):
+        self.algorithm = algorithm
+        self._algorithms = [algorithm]
+        self._jwt = jwt.PyJWT(options={"require": ["exp", "jti"]})
+
+        if algorithm.startswith("HS"):
+            self._signing_key = self._verifying_key = secret_key
+        else:
+            impl = get_default_algorithms()[algorithm]
+            self._signing_key = impl.prepare_key(private_key) if private_key else None
+            self._verifying_key = impl.prepare_key(public_key)
+
+    def encode(self, data: dict, token_type: str, expires_delta: timedelta) -> str:
+        claims = data.copy()
+        claims.update(
+            {
+                "exp": datetime.now(timezone.utc) + expires_delta,
+                "jti": str(uuid.uuid4()),
+                "type": token_type,
+            }
+        )
+        return self._jwt.encode(claims, self._signing_key, algorithm=self.algorithm)
+
+    def decode(self, token: str, token_type: str = None) -> dict:
+        """
+        Verify signature, exp and required claims. When token_type is given
+        the "type" claim must match it.
+        """
+        claims = self._jwt.decode(
+            token, self._verifying_key, algorithms=self._algorithms
+        )
+        if token_type and claims.get("type") != token_type:
+            raise InvalidTokenError(f"Expected a {token_type} token")
+        return claims
+
+
+_codec = None
+_codec_settings = None
+
+
+def get_token_codec() -> TokenCodec:
+    """Process-wide codec, rebuilt only when the JWT settings change."""
+    global _codec, _codec_settings
+
+    settings = (
+        Config.JWT_ALGORITHM,
+        Config.JWT_SECRET_KEY,
+        Config.JWT_PRIVATE_KEY,
+        Config.JWT_PUBLIC_KEY,
+    )
+    if _codec is None or settings != _codec_settings:
+        _codec = TokenCodec(*settings)
+        _codec_settings = settings
+    return _codec
+
+
+def create_access_token(data: dict, expires_delta: timedelta = None) -> str:
+    return get_token_codec().encode(
+        data, "access", expires_delta or ACCESS_TOKEN_EXPIRES
+    )
+
+
+def create_refresh_token(data: dict, expires_delta: timedelta = None) -> str:
+    return get_token_codec().encode(
+        data, "refresh", expires_delta or REFRESH_TOKEN_EXPIRES
+    )
+
+
+def decode_token(token: str, token_type: str = None) -> dict:
+    return get_token_codec().decode(token, token_type)
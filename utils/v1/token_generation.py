@@ -1,26 +0,0 @@
-from datetime import datetime, timedelta
-from config.v1.config import Config
-import jwt
-import uuid
-
-
-def create_access_token(data: dict, expires_delta: timedelta = None):
-    to_encode = data.copy()
-    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=30))
-    jti = str(uuid.uuid4())
-    to_encode.update({"exp": expire, "jti": jti, "type": "access"})
-    encoded_jwt = jwt.encode(
-        to_encode, Config.JWT_SECRET_KEY, algorithm=Config.JWT_ALGORITHM
-    )
-    return encoded_jwt
-
-
-def create_refresh_token(data: dict, expires_delta: timedelta = None):
-    to_encode = data.copy()
-    expire = datetime.utcnow() + (expires_delta or timedelta(days=7))
-    jti = str(uuid.uuid4())
-    to_encode.update({"exp": expire, "jti": jti, "type": "refresh"})
-    encoded_jwt = jwt.encode(
-        to_encode, Config.JWT_SECRET_KEY, algorithm=Config.JWT_ALGORITHM
-    )
-    return encoded_jwt
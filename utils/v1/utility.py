@@ -1,7 +1,8 @@
 import smtplib
 import os
 import secrets
-import bcrypt
+import hmac
+import hashlib
 from email.message import EmailMessage
 from datetime import datetime, timedelta
 from fastapi.responses import JSONResponse
@@ -41,13 +42,8 @@ def sendResetLink(receiver, background_task, db, raw_token):
     from dao.v1.user_dao import user_databaseConnection
 
     try:
-        data = user_databaseConnection.getUserTable(db)
-        userID = None
-        for i in data:
-            if i.email == receiver:
-                userID = i.id
-                break
-        if not userID:
+        user = user_databaseConnection.get_by_email(receiver, db)
+        if not user:
             print("User not found.❌")
             return False
 
@@ -96,16 +92,34 @@ FastVault Tech.
 #         pass  # Ignoring the exception if the file is not found
 
 
-def generate_reset_token():
-    # Generate a secure random token (user sees this raw token)
-    raw_token = secrets.token_urlsafe(32)
+def reset_token_key() -> str:
+    """HMAC key for reset verifiers; checked once at startup by the lifespan."""
+    key = Config.RESET_TOKEN_SECRET or Config.JWT_SECRET_KEY
+    if not key:
+        raise RuntimeError(
+            "RESET_TOKEN_SECRET or JWT_SECRET_KEY must be set to issue password "
+            "reset tokens."
+        )
+    return key
+
+
+def hash_reset_verifier(verifier: str) -> str:
+    key = reset_token_key()
+    digest = hmac.new(key.encode("utf-8"), verifier.encode("utf-8"), hashlib.sha256)
+    return digest.hexdigest()
+
 
-    # Hash the token before saving to DB
-    hashed_token = bcrypt.hashpw(raw_token.encode("utf-8"), bcrypt.gensalt()).decode(
-        "utf-8"
-    )
+def generate_reset_token():
+    """
+    Selector/verifier reset token. The user gets "<selector>.<verifier>";
+    the DB stores the selector in clear (indexed lookup) and only an HMAC
+    of the verifier.
+    """
+    selector = secrets.token_urlsafe(12)
+    verifier = secrets.token_urlsafe(32)
+    raw_token = f"{selector}.{verifier}"
 
     # Set expiration (30 minutes)
     expires_at = datetime.utcnow() + timedelta(minutes=30)
 
-    return raw_token, hashed_token, expires_at
+    return raw_token, selector, hash_reset_verifier(verifier), expires_at